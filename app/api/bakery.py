@@ -19,6 +19,7 @@ from app.core.exception import (
 from app.schema.bakery import (
     BakeryDetailResponseDTO,
     BakeryLikeResponseDTO,
+    BakeryOverviewResponseDTO,
     GuDongMenuBakeryResponseDTO,
     LoadMoreBakeryResponseDTO,
     RecentViewedBakery,
@@ -315,6 +316,46 @@ async def get_bakery_detail(
     )
 
 
+@router.get(
+    "/{bakery_id}/overview",
+    response_model=BaseResponse[BakeryOverviewResponseDTO],
+    responses={**ERROR_UNKNOWN, **ERROR_NOT_FOUND},
+)
+async def get_bakery_overview(
+    bakery_id: int,
+    page_size: int = Query(default=5, description="함께 조회할 리뷰 개수"),
+    sort_clause: str = Query(
+        default="LIKE_COUNT.DESC",
+        description="""
+    리뷰 정렬 (/bakeries/{bakery_id}/reviews 와 동일)\n
+    좋아요순 : LIKE_COUNT.DESC
+    최신 작성순 : CREATED_AT.DESC
+    높은 평가순 : RATING.DESC
+    낮은 평가순 : RATING.ASC
+    """,
+    ),
+    auth_ctx=Depends(get_auth_context),
+    db=Depends(get_db),
+):
+    """베이커리 상세 화면 통합 조회 API. (상세정보 + 메뉴 + 사진 + 영업시간 + 첫 페이지 리뷰)
+
+    다음 페이지 리뷰는 reviews.next_cursor로 /bakeries/{bakery_id}/reviews 를 호출.
+    """
+
+    user_id = auth_ctx.get("user_id")
+    token = auth_ctx.get("token")
+
+    return BaseResponse(
+        data=await BakeryService(db=db).get_bakery_overview(
+            user_id=user_id,
+            bakery_id=bakery_id,
+            page_size=page_size,
+            sort_clause=sort_clause,
+        ),
+        token=token,
+    )
+
+
 @router.get("/{bakery_id}/menus", response_model=BaseResponse[List[SimpleBakeryMenu]])
 async def get_bakery_menus(
     bakery_id: int, auth_ctx=Depends(get_auth_context), db=Depends(get_db)
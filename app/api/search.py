@@ -4,7 +4,8 @@ from sqlalchemy import func
 from app.core.auth import get_auth_context
 from app.core.base import BaseResponse
 from app.core.database import get_db
-from app.schema.search import SearchBakeryResponseDTO
+from app.core.suggest import SUGGEST_MAX_SIZE
+from app.schema.search import SearchBakeryResponseDTO, SuggestResponseDTO
 from app.services.search_service import SearchService
 
 router = APIRouter(prefix="/search", tags=["search"])
@@ -21,7 +22,7 @@ async def search_bakeries_by_keyword(
     auth_ctx=Depends(get_auth_context),
     db=Depends(get_db),
 ):
-    """검색어로 빵집 조회하는 API."""
+    """검색어로 빵집 조회하는 API. (관련도 순, 초성 검색 지원)"""
 
     user_id = auth_ctx.get("user_id")
     token = auth_ctx.get("token")
@@ -35,3 +36,19 @@ async def search_bakeries_by_keyword(
         ),
         token=token,
     )
+
+
+@router.get("/suggest", response_model=BaseResponse[SuggestResponseDTO])
+async def get_search_suggestions(
+    keyword: str,
+    size: int = Query(default=10, ge=1, le=SUGGEST_MAX_SIZE),
+    auth_ctx=Depends(get_auth_context),
+):
+    """검색어 자동완성 API. (빵집이름/메뉴이름 접두사, 초성 검색 지원)"""
+
+    token = auth_ctx.get("token")
+
+    return BaseResponse(
+        data=SearchService.get_suggestions(keyword=keyword, size=size),
+        token=token,
+    )
@@ -13,5 +13,5 @@ async def test_api():
 
 @router.get("/ping-db")
 async def ping_db(db=Depends(get_db)):
-    result = db.execute(text("SELECT 1"))
+    result = await db.execute(text("SELECT 1"))
     return {"db_connected": result.scalar() == 1}
@@ -1,9 +1,11 @@
+import hashlib
 import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from typing import Optional, Tuple
 
 from fastapi import Depends, Header
-from jose import ExpiredSignatureError, JWTError, jwt
 
 from app.core.base import BaseResponse, BaseTokenHeader
 from app.core.config import Configs
@@ -22,6 +24,74 @@ SECRET_KEY = configs.SECRET_KEY
 REFRESH_SECRET_KEY = configs.REFRESH_SECRET_KEY
 ALGORITHM = configs.ALGORITHM
 
+# JWT 라이브러리 선택 (jose | pyjwt)
+if configs.JWT_BACKEND == "pyjwt":
+    import jwt as pyjwt
+    from jwt import ExpiredSignatureError
+    from jwt import InvalidTokenError as JWTError
+
+    def _encode(payload: dict, key: str) -> str:
+        return pyjwt.encode(payload, key, algorithm=ALGORITHM)
+
+    def _decode(token: str, key: str) -> dict:
+        return pyjwt.decode(token, key, algorithms=[ALGORITHM])
+
+else:
+    from jose import ExpiredSignatureError, JWTError, jwt
+
+    def _encode(payload: dict, key: str) -> str:
+        return jwt.encode(payload, key, algorithm=ALGORITHM)
+
+    def _decode(token: str, key: str) -> dict:
+        return jwt.decode(token, key, algorithms=ALGORITHM)
+
+
+class VerifiedTokenCache:
+    """검증이 끝난 access_token LRU 캐시.
+
+    token 원문 대신 sha256 해시를 key로 (user_id, exp)를 저장하고,
+    exp가 지나면 캐시에서 제거해서 다시 디코딩(만료 처리) 하도록 한다.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._cache: OrderedDict[bytes, Tuple[int, int]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str, now: Optional[float] = None) -> Optional[int]:
+        """캐시된 user_id 반환하는 메소드. (없거나 만료됐으면 None)"""
+
+        key = self._key(token)
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+
+        user_id, exp = cached
+        if exp <= (time.time() if now is None else now):
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return user_id
+
+    def set(self, token: str, user_id: int, exp: int):
+        """검증된 토큰 캐싱하는 메소드."""
+
+        if self.maxsize <= 0 or exp is None:
+            return
+
+        key = self._key(token)
+        self._cache[key] = (user_id, exp)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+
+verified_token_cache = VerifiedTokenCache(maxsize=configs.TOKEN_CACHE_SIZE)
+
 
 def get_expiration_time(token_type: str) -> int:
     """유효기간 반환하는 메소드."""
@@ -51,16 +121,8 @@ def create_jwt_token(data: dict[str, str]):
     }
 
     # 토큰생성
-    access_token = jwt.encode(
-        access_payload,
-        SECRET_KEY,
-        algorithm=ALGORITHM,
-    )
-    refresh_token = jwt.encode(
-        refresh_payload,
-        REFRESH_SECRET_KEY,
-        algorithm=ALGORITHM,
-    )
+    access_token = _encode(access_payload, SECRET_KEY)
+    refresh_token = _encode(refresh_payload, REFRESH_SECRET_KEY)
 
     return access_token, refresh_token
 
@@ -70,15 +132,20 @@ async def decode_jwt_payload(access_token: str, refresh_token: str):
     try:
         if not access_token or not refresh_token:
             raise RequestDataMissingException(detail="토큰이 필요합니다.")
+
+        # 이미 검증한 access_token이면 디코딩 생략
+        user_id = verified_token_cache.get(access_token)
+        if user_id is not None:
+            return BaseResponse(data=dict(user_id=user_id))
+
         # access_token 디코딩
-        payload = jwt.decode(access_token, SECRET_KEY, algorithms=ALGORITHM)
+        payload = _decode(access_token, SECRET_KEY)
         user_id = int(payload.get("sub"))
+        verified_token_cache.set(access_token, user_id, payload.get("exp"))
         return BaseResponse(data=dict(user_id=user_id))
     except ExpiredSignatureError:
         try:
-            payload = jwt.decode(
-                refresh_token, REFRESH_SECRET_KEY, algorithms=ALGORITHM
-            )
+            payload = _decode(refresh_token, REFRESH_SECRET_KEY)
             user_id = payload.get("sub")
 
             # redis에 refresh_token 있는지 확인
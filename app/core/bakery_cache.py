@@ -0,0 +1,137 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional, Tuple
+
+from pydantic import TypeAdapter
+from redis.exceptions import RedisError
+
+from app.core.config import Configs
+from app.core.redis import get_redis
+
+config = Configs()
+logger = logging.getLogger("bread-api")
+
+BAKERY_CACHE_PREFIX = "bakery"
+
+BLOCK_DETAIL = "detail"
+BLOCK_MENUS = "menus"
+
+
+def build_bakery_version_key(bakery_id: int) -> str:
+    """베이커리 정적 데이터 버전 key 반환하는 메소드."""
+
+    return f"{BAKERY_CACHE_PREFIX}:{bakery_id}:version"
+
+
+def build_bakery_block_key(bakery_id: int, block: str, version: int) -> str:
+    """버전이 포함된 베이커리 정적 데이터 캐시 key 반환하는 메소드."""
+
+    return f"{BAKERY_CACHE_PREFIX}:{bakery_id}:v{version}:{block}"
+
+
+class LocalLRU:
+    """프로세스 메모리 LRU. key별로 (버전, 값, 만료시각)을 들고 있는다."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._cache: OrderedDict[Hashable, Tuple[int, Any, float]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Tuple[int, Any, float]]:
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+        return cached
+
+    def set(self, key: Hashable, version: int, value: Any, expires_at: float):
+        if self.maxsize <= 0:
+            return
+
+        self._cache[key] = (version, value, expires_at)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def discard(self, predicate: Callable[[Hashable], bool]):
+        for key in [k for k in self._cache if predicate(k)]:
+            del self._cache[key]
+
+
+class BakeryStaticCache:
+    """베이커리 주소/메뉴/사진/영업시간 같은 정적 데이터용 2단 캐시.
+
+    - 1단 (프로세스 메모리) : local_ttl 동안은 redis 조회 없이 반환
+    - 2단 (redis) : key에 버전이 포함되어 있어서 버전만 올리면 이전 캐시는 자연 만료
+    local_ttl이 지나면 redis의 현재 버전과 비교해서 같으면 그대로 재사용한다.
+    """
+
+    def __init__(self, maxsize: int, local_ttl: int) -> None:
+        self.local_ttl = local_ttl
+        self._local = LocalLRU(maxsize)
+
+    async def get(
+        self,
+        bakery_id: int,
+        block: str,
+        adapter: TypeAdapter,
+        loader: Callable[[], Awaitable[Any]],
+    ):
+        """캐시된 정적 데이터 반환하는 메소드. (없으면 loader로 조회 후 캐싱)"""
+
+        now = time.monotonic()
+        local_key = (bakery_id, block)
+        cached = self._local.get(local_key)
+        if cached is not None and cached[2] > now:
+            return cached[1]
+
+        try:
+            redis = await get_redis()
+            version = int(await redis.get(build_bakery_version_key(bakery_id)) or 0)
+
+            # 메모리 캐시가 최신 버전이면 만료시각만 연장
+            if cached is not None and cached[0] == version:
+                self._local.set(local_key, version, cached[1], now + self.local_ttl)
+                return cached[1]
+
+            key = build_bakery_block_key(bakery_id, block, version)
+            payload = await redis.get(key)
+        except RedisError as e:
+            logger.warning(f"bakery cache get failed : {bakery_id} {block} {e}")
+            return await loader()
+
+        if payload:
+            value = adapter.validate_json(payload)
+        else:
+            value = await loader()
+            if value is None:
+                return None
+            try:
+                await redis.setex(
+                    key, config.BAKERY_CACHE_TTL, adapter.dump_json(value)
+                )
+            except RedisError as e:
+                logger.warning(f"bakery cache set failed : {key} {e}")
+
+        self._local.set(local_key, version, value, now + self.local_ttl)
+        return value
+
+    async def bump_version(self, bakery_ids: Iterable[int]):
+        """메뉴/사진 등이 바뀐 베이커리의 캐시 버전 올리는 메소드."""
+
+        bakery_ids = set(bakery_ids)
+        self._local.discard(lambda k: k[0] in bakery_ids)
+
+        try:
+            redis = await get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                for bakery_id in bakery_ids:
+                    pipe.incr(build_bakery_version_key(bakery_id))
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"bakery cache version bump failed : {bakery_ids} {e}")
+
+
+bakery_static_cache = BakeryStaticCache(
+    maxsize=config.BAKERY_LOCAL_CACHE_SIZE,
+    local_ttl=config.BAKERY_LOCAL_CACHE_TTL,
+)
@@ -0,0 +1,144 @@
+import hashlib
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from pydantic import TypeAdapter
+from redis.exceptions import RedisError
+
+from app.core.config import Configs
+from app.core.redis import get_redis
+
+config = Configs()
+logger = logging.getLogger("bread-api")
+
+FEED_CACHE_PREFIX = "feed"
+BAKERY_CARD_CACHE_PREFIX = "bakery_card"
+
+
+def build_feed_cache_key(
+    feed: str,
+    area_codes: List[str],
+    target_day_of_week: int,
+    preference_ids: Optional[Iterable[int]] = None,
+) -> str:
+    """홈 피드 캐시 key 반환하는 메소드.
+
+    지역코드는 순서와 상관없이 같은 key가 되도록 정렬하고,
+    취향 목록은 길이가 길어질 수 있어서 해시값으로 변환.
+    """
+
+    areas = ",".join(sorted(set(area_codes), key=int))
+    key = f"{FEED_CACHE_PREFIX}:{feed}:area={areas}:dow={target_day_of_week}"
+
+    if preference_ids is not None:
+        joined = ",".join(str(p) for p in sorted(set(preference_ids)))
+        digest = hashlib.sha1(joined.encode()).hexdigest()[:16]
+        key = f"{key}:pref={digest}"
+
+    return key
+
+
+def build_bakery_index_key(bakery_id: int) -> str:
+    """해당 베이커리가 포함된 피드 캐시 key 목록의 key 반환하는 메소드."""
+
+    return f"{FEED_CACHE_PREFIX}:bakery:{bakery_id}"
+
+
+async def get_cached_feed(key: str, adapter: TypeAdapter):
+    """캐시된 피드 조회하는 메소드. (redis 장애 시 None 반환해서 DB 조회로 대체)"""
+
+    try:
+        redis = await get_redis()
+        cached = await redis.get(key)
+    except RedisError as e:
+        logger.warning(f"feed cache get failed : {key} {e}")
+        return None
+
+    return adapter.validate_json(cached) if cached else None
+
+
+async def set_cached_feed(
+    key: str, adapter: TypeAdapter, items: list, bakery_ids: Iterable[int]
+):
+    """피드 캐싱하고, 포함된 베이커리별로 무효화용 인덱스 적재하는 메소드."""
+
+    ttl = config.FEED_CACHE_TTL
+
+    try:
+        redis = await get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.setex(key, ttl, adapter.dump_json(items))
+            for bakery_id in set(bakery_ids):
+                index_key = build_bakery_index_key(bakery_id)
+                pipe.sadd(index_key, key)
+                pipe.expire(index_key, ttl)
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"feed cache set failed : {key} {e}")
+
+
+async def evict_bakery_feeds(bakery_ids: Iterable[int]):
+    """해당 베이커리가 포함된 피드 캐시 삭제하는 메소드."""
+
+    try:
+        redis = await get_redis()
+        for bakery_id in set(bakery_ids):
+            index_key = build_bakery_index_key(bakery_id)
+            keys = await redis.smembers(index_key)
+            await redis.delete(index_key, *keys)
+    except RedisError as e:
+        logger.warning(f"feed cache evict failed : {bakery_ids} {e}")
+
+
+def build_bakery_card_key(bakery_id: int) -> str:
+    """베이커리 카드(리스트 한 칸) 캐시 key 반환하는 메소드."""
+
+    return f"{BAKERY_CARD_CACHE_PREFIX}:{bakery_id}"
+
+
+async def get_cached_bakery_cards(
+    bakery_ids: List[int], adapter: TypeAdapter
+) -> Dict[int, object]:
+    """캐시된 베이커리 카드 한 번에 조회하는 메소드. (캐시에 있는 것만 반환)"""
+
+    if not bakery_ids:
+        return {}
+
+    try:
+        redis = await get_redis()
+        cached = await redis.mget([build_bakery_card_key(b) for b in bakery_ids])
+    except RedisError as e:
+        logger.warning(f"bakery card cache get failed : {e}")
+        return {}
+
+    return {b: adapter.validate_json(c) for b, c in zip(bakery_ids, cached) if c}
+
+
+async def set_cached_bakery_cards(cards: Dict[int, object], adapter: TypeAdapter):
+    """베이커리 카드 캐싱하는 메소드."""
+
+    if not cards:
+        return
+
+    try:
+        redis = await get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            for bakery_id, card in cards.items():
+                pipe.setex(
+                    build_bakery_card_key(bakery_id),
+                    config.BAKERY_CARD_CACHE_TTL,
+                    adapter.dump_json(card),
+                )
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"bakery card cache set failed : {e}")
+
+
+async def evict_bakery_cards(bakery_ids: Iterable[int]):
+    """평점/리뷰 개수가 바뀐 베이커리 카드 캐시 삭제하는 메소드."""
+
+    try:
+        redis = await get_redis()
+        await redis.delete(*[build_bakery_card_key(b) for b in set(bakery_ids)])
+    except RedisError as e:
+        logger.warning(f"bakery card cache evict failed : {bakery_ids} {e}")
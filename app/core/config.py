@@ -9,9 +9,39 @@ class Configs(BaseSettings):
     DB_PORT: str
     DATA_BASE: str
 
+    # ====================== DB Connection Pool
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+
     REDIS_HOST: str
     REDIS_PORT: str
 
+    # ====================== Cache
+    FEED_CACHE_TTL: int = 300
+    OPERATING_SCHEDULE_REFRESH_SECONDS: int = 600
+    SEARCH_DOCUMENT_REFRESH_SECONDS: int = 300
+    BAKERY_POPULARITY_REFRESH_SECONDS: int = 300
+    BAKERY_CARD_REFRESH_SECONDS: int = 300
+    REVIEW_LIKE_FLUSH_SECONDS: int = 5
+    BAKERY_CACHE_TTL: int = 60 * 60 * 24
+    BAKERY_LOCAL_CACHE_SIZE: int = 1000
+    BAKERY_LOCAL_CACHE_TTL: int = 30
+    BAKERY_CARD_CACHE_TTL: int = 600
+    RECENT_VIEW_TTL: int = 60 * 60 * 24 * 30
+    RECENT_VIEW_FLUSH_SECONDS: int = 30
+
+    # ====================== DB 마이그레이션
+    # DDL이 테이블 lock을 기다리며 다른 쿼리를 막지 않도록 대기시간 제한
+    MIGRATION_LOCK_TIMEOUT: str = "5s"
+
+    # ====================== 취향기반 추천
+    RECOMMENDATION_PER_AREA_LIMIT: int = 50
+    RECOMMENDATION_REFRESH_SECONDS: int = 60 * 60
+
     # ====================== KAKAKO AUTH
     KAKAO_API_KEY: str
     KAKAO_REDIRECT_URI: str
@@ -26,12 +56,40 @@ class Configs(BaseSettings):
     SECRET_KEY: str
     REFRESH_SECRET_KEY: str
     ALGORITHM: str
+    JWT_BACKEND: str = "jose"  # jose | pyjwt
+    TOKEN_CACHE_SIZE: int = 10000
+
+    # ====================== 외부 API HTTP Client
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_MAX_CONCURRENCY_PER_HOST: int = 10
+    HTTP_TIMEOUT: float = 5.0
+    HTTP_CONNECT_TIMEOUT: float = 3.0
+    HTTP_RETRIES: int = 2
+    HTTP_RETRY_BACKOFF: float = 0.2
 
     # ====================== 한국관광공사
     REQ_URL_DOMAIN: str
     ENC_TOUR_SECRET_KEY: str
     ORG_TOUR_SECRET_KEY: str
 
+    # ====================== 한국관광공사 캐시
+    TOUR_CACHE_ROWS: int = 20
+    TOUR_CACHE_FRESH_SECONDS: int = 60 * 60 * 6
+    TOUR_CACHE_STALE_TTL: int = 60 * 60 * 48
+    TOUR_CACHE_LOCK_SECONDS: int = 60
+    TOUR_CACHE_REFRESH_SECONDS: int = 60 * 60 * 6
+
+    # ====================== 이미지 처리
+    IMAGE_CONVERT_WORKERS: int = 2
+    IMAGE_UPLOAD_CONCURRENCY: int = 4
+    REVIEW_IMAGE_WORKERS: int = 2
+    REVIEW_IMAGE_JOB_MAX_ATTEMPTS: int = 3
+    REVIEW_IMAGE_BLOB_TTL: int = 60 * 60 * 24
+    REVIEW_IMAGE_WORKER_HEARTBEAT_TTL: int = 60 * 5
+    REVIEW_IMAGE_COMMIT_GRACE_SECONDS: int = 60
+
     # ====================== Supabase Bucket
     SUPABASE_BUCKET: str
     SUPABASE_ACCESS_KEY: str
@@ -47,7 +105,7 @@ class Configs(BaseSettings):
 
     @property
     def DATABASE_URL(self):
-        return f"postgresql+psycopg2://{self.DB_USER}:{self.DB_PW}@/{self.DATA_BASE}?host=/cloudsql/{self.GCP_RUN_PROJECT_ID}:asia-northeast3:bread-road-db"
+        return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PW}@/{self.DATA_BASE}?host=/cloudsql/{self.GCP_RUN_PROJECT_ID}:asia-northeast3:bread-road-db"
 
     @property
     def REDIS_URL(self):
@@ -3,6 +3,28 @@ EXPIRE_IN = {"ACCESS": 60 * 30, "REFRESH": 60 * 60 * 24 * 28}
 
 ETC_MENU_NAME = "기타메뉴"
 
+# asyncpg 쿼리 하나에 넣을 수 있는 bind parameter 최대 개수
+MAX_BIND_PARAMS = 32767
+
+# 최근 조회한 빵집 보관 개수
+RECENT_VIEW_LIMIT = 20
+
+# hot한 빵집 인기 점수 : 최근 리뷰 수 * 3 + 찜 수 + 평균 별점 * 2
+POPULARITY_REVIEW_WINDOW_DAYS = 30
+POPULARITY_REVIEW_WEIGHT = 3
+POPULARITY_LIKE_WEIGHT = 1
+POPULARITY_RATING_WEIGHT = 2
+
+# 이미지 사이즈별 variant : 긴 변 최대 px (None : 원본 크기)
+IMAGE_VARIANT_THUMB = "thumb"
+IMAGE_VARIANT_DETAIL = "detail"
+IMAGE_VARIANT_FULL = "full"
+IMAGE_VARIANTS = {
+    IMAGE_VARIANT_THUMB: 320,
+    IMAGE_VARIANT_DETAIL: 1080,
+    IMAGE_VARIANT_FULL: None,
+}
+
 REVIEW_THRESHOLDS = [1, 10, 50, 100, 500]
 BREAD_THRESHOLDS = [10, 100, 500]
 
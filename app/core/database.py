@@ -1,41 +1,72 @@
-from contextlib import contextmanager
-from typing import Generator, List, Type, TypeVar
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Awaitable, Callable, List, Type, TypeVar
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import Configs
 from app.core.exception import DuplicateException, UnknownException
+from app.core.metrics import InstrumentedQueuePool, register_pool_metrics
 
 config = Configs()
-
-engine = create_engine(config.DATABASE_URL, echo=True)
+logger = logging.getLogger("bread-api")
+
+engine = create_async_engine(
+    config.DATABASE_URL,
+    echo=config.DB_ECHO,
+    poolclass=InstrumentedQueuePool,
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_MAX_OVERFLOW,
+    pool_timeout=config.DB_POOL_TIMEOUT,
+    pool_recycle=config.DB_POOL_RECYCLE,
+    pool_pre_ping=config.DB_POOL_PRE_PING,
+)
+register_pool_metrics(engine.sync_engine.pool)
 print("📌 DB Connection URL : ", config.DATABASE_URL)
 
-SessionLocal = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+SessionLocal = async_sessionmaker(
+    bind=engine, class_=AsyncSession, expire_on_commit=False
+)
 
 T = TypeVar("T", bound=BaseModel)
 
 
-@contextmanager
-def start_session():
+def run_after_commit(session: AsyncSession, callback: Callable[[], Awaitable]):
+    """트랜잭션 commit 이후에 실행할 작업 등록하는 메소드. (캐시 무효화 등)"""
+
+    session.info.setdefault("after_commit", []).append(callback)
+
+
+async def _run_after_commit_callbacks(session: AsyncSession):
+    """commit 이후 등록된 작업 실행하는 메소드. (실패해도 요청은 성공 처리)"""
+
+    for callback in session.info.pop("after_commit", []):
+        try:
+            await callback()
+        except Exception:
+            logger.exception("after commit callback failed")
+
+
+@asynccontextmanager
+async def start_session():
     """PostgreSQL 연결 및 session 관리"""
     session = SessionLocal()
     try:
         yield session
-        session.commit()
+        await session.commit()
+        await _run_after_commit_callbacks(session)
     except Exception as e:
-        session.rollback()
+        await session.rollback()
         raise
     finally:
-        session.close()
+        await session.close()
 
 
-def get_db() -> Generator:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """API 호출시 발동될 메소드"""
-    with start_session() as session:
+    async with start_session() as session:
         yield session
 
 
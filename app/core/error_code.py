@@ -27,3 +27,5 @@ class ErrorCode:
     ALREADY_DISLIKED = 1013
     # 탈퇴회원
     WITHDRAW_USER = 1014
+    # 잘못되거나 변조된 페이지 커서
+    INVALID_CURSOR = 1015
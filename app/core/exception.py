@@ -95,6 +95,14 @@ class InvalidSortParameterException(CustomException):
     DEFAULT_MESSAGE = "정렬 기준이나 방향이 누락되거나 잘못되었습니다."
 
 
+class InvalidCursorException(CustomException):
+    """잘못되거나 변조된 페이지 커서 Exception"""
+
+    STATUS_CODE = status.HTTP_400_BAD_REQUEST
+    ERROR_CODE = ErrorCode.INVALID_CURSOR
+    DEFAULT_MESSAGE = "잘못된 페이지 커서입니다. 첫 페이지부터 다시 조회해주세요."
+
+
 class InvalidImageFileException(CustomException):
     """유효하지 않은 이미지 확장자 에러."""
 
@@ -191,6 +199,7 @@ ERROR_DUPLE = build_error_response(DuplicateException)
 ERROR_NOT_FOUND = build_error_response(NotFoundException)
 ERROR_INVALID_AREA_CODE = build_error_response(InvalidAreaCodeException)
 ERROR_INVALID_SORT_PARAM = build_error_response(InvalidSortParameterException)
+ERROR_INVALID_CURSOR = build_error_response(InvalidCursorException)
 ERROR_INVALID_FILE_CONTENT_TYPE = build_error_response(InvalidImageFileException)
 ERROR_CONVERT_IMAGE = build_error_response(ConvertImageException)
 ERROR_UPLOAD_IMAGE = build_error_response(UploadImageException)
@@ -0,0 +1,40 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from app.core.config import Configs
+
+config = Configs()
+
+_image_executor: ProcessPoolExecutor | None = None
+
+
+def get_image_executor() -> ProcessPoolExecutor:
+    """이미지 변환(CPU 작업)용 프로세스 풀 반환하는 메소드.
+
+    이벤트 루프/스레드가 떠 있는 프로세스를 fork 하지 않도록 spawn으로 생성.
+    """
+
+    global _image_executor
+    if _image_executor is None:
+        _image_executor = ProcessPoolExecutor(
+            max_workers=config.IMAGE_CONVERT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _image_executor
+
+
+def warm_up_image_executor():
+    """첫 요청에서 워커 프로세스 기동 비용을 내지 않도록 미리 띄워두는 메소드."""
+
+    executor = get_image_executor()
+    for _ in range(config.IMAGE_CONVERT_WORKERS):
+        executor.submit(int)
+
+
+def shutdown_image_executor():
+    """이미지 변환용 프로세스 풀 종료하는 메소드."""
+
+    global _image_executor
+    if _image_executor is not None:
+        _image_executor.shutdown(wait=True, cancel_futures=True)
+        _image_executor = None
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import ssl
+from typing import Dict, Optional
+
+import httpx
+
+from app.core.config import Configs
+
+config = Configs()
+logger = logging.getLogger("bread-api")
+
+_client: httpx.AsyncClient | None = None
+_host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+def _build_ssl_context() -> ssl.SSLContext:
+    """외부 API(관광공사 등) 호환을 위해 기본 cipher를 허용한 SSL context."""
+
+    ssl_context = ssl.create_default_context()
+    ssl_context.set_ciphers("DEFAULT")
+    return ssl_context
+
+
+def init_http_client() -> httpx.AsyncClient:
+    """앱 수명 동안 재사용할 AsyncClient 생성하는 메소드.
+
+    커넥션을 keep-alive로 재사용해서 요청마다 TLS handshake 하지 않도록 한다.
+    HTTP/2 를 지원하는 서버는 HTTP/2 로 연결. (ALPN 협상, 미지원 서버는 HTTP/1.1)
+    """
+
+    global _client
+    if _client is None:
+        limits = httpx.Limits(
+            max_connections=config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+        )
+        _client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                verify=_build_ssl_context(),
+                http2=True,
+                limits=limits,
+            ),
+            timeout=httpx.Timeout(
+                config.HTTP_TIMEOUT, connect=config.HTTP_CONNECT_TIMEOUT
+            ),
+        )
+    return _client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공용 AsyncClient 반환하는 메소드."""
+
+    return _client if _client is not None else init_http_client()
+
+
+async def close_http_client():
+    """공용 AsyncClient 종료하는 메소드."""
+
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _get_host_semaphore(host: str) -> asyncio.Semaphore:
+    """호스트별 동시 요청 수 제한용 semaphore 반환하는 메소드."""
+
+    if host not in _host_semaphores:
+        _host_semaphores[host] = asyncio.Semaphore(config.HTTP_MAX_CONCURRENCY_PER_HOST)
+    return _host_semaphores[host]
+
+
+async def request(
+    method: str, url: str, params: Optional[dict] = None, **kwargs
+) -> httpx.Response:
+    """공용 AsyncClient로 요청하는 메소드.
+
+    GET 요청은 연결 실패/timeout 시 HTTP_RETRIES 만큼 재시도.
+    """
+
+    client = get_http_client()
+    retries = config.HTTP_RETRIES if method == "GET" else 0
+
+    async with _get_host_semaphore(httpx.URL(url).host):
+        for attempt in range(retries + 1):
+            try:
+                return await client.request(method, url, params=params, **kwargs)
+            except httpx.TransportError as e:
+                if attempt == retries:
+                    raise
+                logger.warning(f"http request retry ({attempt + 1}) : {url} {e}")
+                await asyncio.sleep(config.HTTP_RETRY_BACKOFF * (2**attempt))
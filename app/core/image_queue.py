@@ -0,0 +1,172 @@
+import json
+import logging
+import time
+import uuid
+from typing import List, Optional, Tuple
+
+from app.core.config import Configs
+from app.core.redis import get_binary_redis, get_redis
+
+config = Configs()
+logger = logging.getLogger("bread-api")
+
+REVIEW_IMAGE_QUEUE = "review_image:jobs"
+REVIEW_IMAGE_DEAD_LETTER = "review_image:jobs:dead"
+REVIEW_IMAGE_BLOB_PREFIX = "review_image:blob:"
+# 워커별 처리중 작업 목록 (처리가 끝나야 지운다) / 워커 목록 / 워커 생존 표시
+REVIEW_IMAGE_PROCESSING_PREFIX = "review_image:processing:"
+REVIEW_IMAGE_WORKERS_KEY = "review_image:workers"
+REVIEW_IMAGE_HEARTBEAT_PREFIX = "review_image:heartbeat:"
+
+
+def _processing_key(worker_id: str) -> str:
+    return f"{REVIEW_IMAGE_PROCESSING_PREFIX}{worker_id}"
+
+
+def _heartbeat_key(worker_id: str) -> str:
+    return f"{REVIEW_IMAGE_HEARTBEAT_PREFIX}{worker_id}"
+
+
+async def enqueue_review_image_job(review_id: int, images: List[Tuple[bytes, str]]):
+    """리뷰 이미지 원본을 redis에 올리고 후처리 작업 적재하는 메소드.
+
+    images : (이미지 bytes, 원본 파일명) 목록
+    """
+
+    blobs = []
+    binary_redis = await get_binary_redis()
+    async with binary_redis.pipeline(transaction=False) as pipe:
+        for img_data, filename in images:
+            key = f"{REVIEW_IMAGE_BLOB_PREFIX}{uuid.uuid4()}"
+            pipe.setex(key, config.REVIEW_IMAGE_BLOB_TTL, img_data)
+            blobs.append({"key": key, "filename": filename})
+        await pipe.execute()
+
+    job = {
+        "review_id": review_id,
+        "blobs": blobs,
+        "attempts": 0,
+        "enqueued_at": time.time(),
+    }
+    redis = await get_redis()
+    await redis.lpush(REVIEW_IMAGE_QUEUE, json.dumps(job))
+
+
+def new_review_image_worker_id() -> str:
+    return uuid.uuid4().hex
+
+
+async def register_review_image_worker(worker_id: str):
+    """워커 등록 및 생존 표시 갱신하는 메소드. (HEARTBEAT_TTL 안에 다시 호출해야 함)"""
+
+    redis = await get_redis()
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.sadd(REVIEW_IMAGE_WORKERS_KEY, worker_id)
+        pipe.setex(
+            _heartbeat_key(worker_id), config.REVIEW_IMAGE_WORKER_HEARTBEAT_TTL, 1
+        )
+        await pipe.execute()
+
+
+async def _move_back_to_queue(worker_id: str) -> int:
+    """워커의 처리중 작업을 전부 큐로 되돌리는 메소드."""
+
+    redis = await get_redis()
+    moved = 0
+    while await redis.lmove(
+        _processing_key(worker_id), REVIEW_IMAGE_QUEUE, "LEFT", "RIGHT"
+    ):
+        moved += 1
+    return moved
+
+
+async def release_review_image_worker(worker_id: str):
+    """종료하는 워커의 처리중 작업을 큐로 되돌리고 등록 해제하는 메소드."""
+
+    await _move_back_to_queue(worker_id)
+    redis = await get_redis()
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.srem(REVIEW_IMAGE_WORKERS_KEY, worker_id)
+        pipe.delete(_heartbeat_key(worker_id))
+        await pipe.execute()
+
+
+async def requeue_stale_review_image_jobs():
+    """생존 표시가 만료된 (죽은) 워커가 처리중이던 작업을 큐로 되돌리는 메소드."""
+
+    redis = await get_redis()
+    for worker_id in await redis.smembers(REVIEW_IMAGE_WORKERS_KEY):
+        if await redis.exists(_heartbeat_key(worker_id)):
+            continue
+        moved = await _move_back_to_queue(worker_id)
+        await redis.srem(REVIEW_IMAGE_WORKERS_KEY, worker_id)
+        if moved:
+            logger.warning(f"review image jobs requeued : {worker_id} {moved}")
+
+
+async def pop_review_image_job(
+    worker_id: str, timeout: int
+) -> Optional[Tuple[str, dict]]:
+    """후처리 작업 하나를 워커의 처리중 목록으로 옮겨서 (원본, 작업) 반환하는 메소드.
+
+    작업은 ack / requeue 전까지 처리중 목록에 남아있어서 워커가 죽어도 유실되지 않는다.
+    (timeout 동안 없으면 None)
+    """
+
+    redis = await get_redis()
+    raw = await redis.blmove(
+        REVIEW_IMAGE_QUEUE, _processing_key(worker_id), timeout, "RIGHT", "LEFT"
+    )
+    return (raw, json.loads(raw)) if raw else None
+
+
+async def ack_review_image_job(worker_id: str, raw: str):
+    """처리가 끝난 작업 처리중 목록에서 지우는 메소드."""
+
+    redis = await get_redis()
+    await redis.lrem(_processing_key(worker_id), 1, raw)
+
+
+async def requeue_review_image_job(worker_id: str, raw: str, job: dict):
+    """처리중 작업을 (바뀐 내용으로) 다시 큐에 넣는 메소드."""
+
+    redis = await get_redis()
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.lpush(REVIEW_IMAGE_QUEUE, json.dumps(job))
+        pipe.lrem(_processing_key(worker_id), 1, raw)
+        await pipe.execute()
+
+
+async def get_review_image_blobs(job: dict) -> Optional[List[Tuple[bytes, str]]]:
+    """작업에 해당하는 이미지 원본 조회하는 메소드. (만료된 원본이 있으면 None)"""
+
+    binary_redis = await get_binary_redis()
+    values = await binary_redis.mget([b["key"] for b in job["blobs"]])
+    if any(v is None for v in values):
+        return None
+    return [(v, b["filename"]) for v, b in zip(values, job["blobs"])]
+
+
+async def delete_review_image_blobs(job: dict):
+    """작업이 끝난 이미지 원본 삭제하는 메소드."""
+
+    binary_redis = await get_binary_redis()
+    await binary_redis.delete(*[b["key"] for b in job["blobs"]])
+
+
+async def retry_or_dead_letter(worker_id: str, raw: str, job: dict, reason: str):
+    """실패한 작업 재시도 큐에 넣거나, 최대 횟수 초과시 dead letter로 옮기는 메소드."""
+
+    job = {**job, "attempts": job.get("attempts", 0) + 1, "last_error": reason}
+
+    if job["attempts"] < config.REVIEW_IMAGE_JOB_MAX_ATTEMPTS:
+        await requeue_review_image_job(worker_id, raw, job)
+        return
+
+    # 원본은 TTL까지 남겨두고, dead letter에서 수동으로 재처리 가능하도록 보관
+    logger.error(f"review image job dead : {job['review_id']} {reason}")
+    redis = await get_redis()
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.lpush(REVIEW_IMAGE_DEAD_LETTER, json.dumps(job))
+        pipe.lrem(_processing_key(worker_id), 1, raw)
+        await pipe.execute()
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional
+
+from app.core.redis import get_redis
+
+# 주기적 작업을 여러 인스턴스 중 한 곳에서만 실행하기 위한 lock
+JOB_LOCK_PREFIX = "job:lock:"
+# 마지막으로 성공한 작업의 시작시각 (어느 인스턴스가 실행하든 이어서 변경분만 갱신)
+JOB_LAST_STARTED_AT_PREFIX = "job:last_started_at:"
+
+
+async def run_as_leader(name: str, seconds: int, job: Callable[[], Awaitable]) -> bool:
+    """여러 인스턴스 중 한 곳에서만 seconds 주기마다 한 번 job 실행하는 메소드.
+
+    lock은 성공해도 만료될 때까지 남겨서 다른 인스턴스가 같은 주기에 다시 실행하지 않게 하고,
+    실패하면 바로 풀어서 다른 인스턴스가 다음 주기에 다시 시도할 수 있게 한다.
+    (다른 인스턴스가 실행했으면 False)
+    """
+
+    lock_key = f"{JOB_LOCK_PREFIX}{name}"
+    redis = await get_redis()
+    if not await redis.set(lock_key, 1, nx=True, ex=seconds):
+        return False
+    try:
+        await job()
+    except Exception:
+        await redis.delete(lock_key)
+        raise
+    return True
+
+
+async def get_last_started_at(name: str) -> Optional[datetime]:
+    """마지막으로 성공한 작업의 시작시각 조회하는 메소드. (없으면 None)"""
+
+    redis = await get_redis()
+    value = await redis.get(f"{JOB_LAST_STARTED_AT_PREFIX}{name}")
+    return datetime.fromisoformat(value) if value else None
+
+
+async def refresh_since_last_run(
+    name: str,
+    refresh: Callable[[Optional[datetime]], Awaitable],
+    overlap: timedelta,
+):
+    """마지막으로 성공한 작업 이후 바뀐 데이터만 refresh 하는 메소드. (기록이 없으면 전체)
+
+    overlap : 작업 중에 커밋된 데이터를 놓치지 않도록 이전 시작시각보다 앞에서부터 조회
+    """
+
+    started_at = datetime.now(timezone.utc)
+    last_started_at = await get_last_started_at(name)
+    await refresh(None if last_started_at is None else last_started_at - overlap)
+
+    redis = await get_redis()
+    await redis.set(f"{JOB_LAST_STARTED_AT_PREFIX}{name}", started_at.isoformat())
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Dict, Optional
+
+from jwt.algorithms import RSAAlgorithm
+
+from app.core.const import APPLE_PUBLIC_KEYS_URL
+from app.core.http import request
+
+logger = logging.getLogger("bread-api")
+
+# Cache-Control 헤더가 없을 때 캐시 유지시간
+DEFAULT_MAX_AGE = 60 * 60
+# 모르는 kid로 인한 재조회 최소 간격 (잘못된 토큰으로 애플 서버를 두드리지 않도록)
+MIN_REFRESH_INTERVAL = 60
+
+_max_age = re.compile(r"max-age=(\d+)")
+
+
+def parse_max_age(cache_control: Optional[str]) -> int:
+    """Cache-Control 헤더에서 max-age 추출하는 메소드."""
+
+    matched = _max_age.search(cache_control or "")
+    return int(matched.group(1)) if matched else DEFAULT_MAX_AGE
+
+
+class JWKSCache:
+    """JWKS 공개키를 파싱된 key 객체로 메모리에 들고 있는 캐시.
+
+    - 만료 전 : 네트워크 호출 없이 메모리에서 반환
+    - 만료 후 : 기존 key로 응답하고 백그라운드에서 갱신
+    - 모르는 kid : 키 교체 가능성이 있으므로 즉시 재조회 (MIN_REFRESH_INTERVAL 제한)
+    """
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self._keys: Dict[str, Any] = {}
+        self._expires_at = 0.0
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def _fetch(self):
+        """JWKS 조회해서 kid별 공개키로 교체하는 메소드."""
+
+        r = await request("GET", self.url)
+        r.raise_for_status()
+
+        self._keys = {k["kid"]: RSAAlgorithm.from_jwk(k) for k in r.json()["keys"]}
+        self._fetched_at = time.monotonic()
+        self._expires_at = self._fetched_at + parse_max_age(
+            r.headers.get("cache-control")
+        )
+
+    async def refresh(self, force: bool = False):
+        """JWKS 갱신하는 메소드. (동시 요청은 한 번만 조회)"""
+
+        fetched_at = self._fetched_at
+        async with self._lock:
+            # 대기하는 동안 다른 요청이 이미 갱신한 경우
+            if self._fetched_at != fetched_at:
+                return
+            if not force and time.monotonic() < self._expires_at:
+                return
+            await self._fetch()
+
+    async def _refresh_in_background(self):
+        try:
+            await self.refresh()
+        except Exception:
+            logger.exception(f"jwks refresh failed : {self.url}")
+
+    async def get_key(self, kid: str):
+        """kid에 해당하는 공개키 반환하는 메소드. (없으면 None)"""
+
+        now = time.monotonic()
+
+        if not self._keys:
+            await self.refresh(force=True)
+        elif kid not in self._keys:
+            if now - self._fetched_at >= MIN_REFRESH_INTERVAL:
+                await self.refresh(force=True)
+        elif now >= self._expires_at and (
+            self._refresh_task is None or self._refresh_task.done()
+        ):
+            self._refresh_task = asyncio.create_task(self._refresh_in_background())
+
+        return self._keys.get(kid)
+
+
+apple_jwks = JWKSCache(APPLE_PUBLIC_KEYS_URL)
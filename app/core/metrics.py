@@ -0,0 +1,41 @@
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "커넥션 풀에서 커넥션을 얻기까지 대기한 시간",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "pool_timeout 안에 커넥션을 얻지 못한 횟수",
+)
+DB_POOL_SIZE = Gauge("db_pool_size", "커넥션 풀 기본 크기")
+DB_POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "현재 사용중인 커넥션 개수")
+DB_POOL_OVERFLOW = Gauge("db_pool_overflow", "pool_size를 초과해서 열린 커넥션 개수")
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션 checkout 대기시간을 기록하는 커넥션 풀."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+
+def register_pool_metrics(pool: Pool):
+    """/metrics 수집 시점에 커넥션 풀 상태를 읽어가도록 등록하는 메소드."""
+
+    DB_POOL_SIZE.set_function(pool.size)
+    DB_POOL_CHECKED_OUT.set_function(pool.checkedout)
+    # overflow()는 pool_size 미만일 때 음수를 반환하므로 0으로 보정
+    DB_POOL_OVERFLOW.set_function(lambda: max(pool.overflow(), 0))
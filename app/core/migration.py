@@ -0,0 +1,258 @@
+"""Alembic 마이그레이션용 커스텀 operation.
+
+- op.create_index_concurrently / op.drop_index_concurrently
+  : 트랜잭션 밖(autocommit)에서 CREATE/DROP INDEX CONCURRENTLY 실행.
+    이전에 실패해서 INVALID 로 남은 인덱스는 지우고 다시 만든다.
+- op.batched_backfill
+  : pk 구간별로 나눠서 UPDATE/INSERT 실행. 구간마다 바로 commit 되므로
+    큰 테이블도 오래 잠그지 않는다.
+
+env.py 에서 이 모듈을 import 해야 op.* 으로 사용할 수 있다.
+"""
+
+import logging
+import time
+from typing import Any, List, Sequence
+
+from alembic.autogenerate import renderers
+from alembic.operations import MigrateOperation, Operations
+from alembic.operations.ops import (
+    CreateIndexOp,
+    CreateTableOp,
+    DropIndexOp,
+    ModifyTableOps,
+)
+from sqlalchemy import text
+
+logger = logging.getLogger("alembic")
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+@Operations.register_operation("create_index_concurrently")
+class CreateIndexConcurrentlyOp(MigrateOperation):
+    """CREATE INDEX CONCURRENTLY operation."""
+
+    def __init__(
+        self,
+        index_name: str,
+        table_name: str,
+        columns: Sequence[str],
+        unique: bool = False,
+        **kw: Any,
+    ) -> None:
+        self.index_name = index_name
+        self.table_name = table_name
+        self.columns = list(columns)
+        self.unique = unique
+        self.kw = kw
+
+    @classmethod
+    def create_index_concurrently(
+        cls,
+        operations: Operations,
+        index_name: str,
+        table_name: str,
+        columns: Sequence[str],
+        unique: bool = False,
+        **kw: Any,
+    ):
+        """테이블을 잠그지 않고 인덱스 생성하는 메소드."""
+
+        return operations.invoke(
+            cls(index_name, table_name, columns, unique=unique, **kw)
+        )
+
+    @classmethod
+    def from_index_op(cls, op: CreateIndexOp) -> "CreateIndexConcurrentlyOp":
+        columns = [getattr(c, "name", None) or str(c) for c in op.columns]
+        return cls(op.index_name, op.table_name, columns, unique=op.unique, **op.kw)
+
+    def reverse(self) -> "DropIndexConcurrentlyOp":
+        return DropIndexConcurrentlyOp(self.index_name, self.table_name)
+
+
+@Operations.register_operation("drop_index_concurrently")
+class DropIndexConcurrentlyOp(MigrateOperation):
+    """DROP INDEX CONCURRENTLY operation."""
+
+    def __init__(self, index_name: str, table_name: str) -> None:
+        self.index_name = index_name
+        self.table_name = table_name
+
+    @classmethod
+    def drop_index_concurrently(
+        cls, operations: Operations, index_name: str, table_name: str
+    ):
+        """테이블을 잠그지 않고 인덱스 삭제하는 메소드."""
+
+        return operations.invoke(cls(index_name, table_name))
+
+    @classmethod
+    def from_index_op(cls, op: DropIndexOp) -> "DropIndexConcurrentlyOp":
+        return cls(op.index_name, op.table_name)
+
+
+@Operations.register_operation("batched_backfill")
+class BatchedBackfillOp(MigrateOperation):
+    """pk 구간별로 나눠서 실행하는 backfill operation.
+
+    sql 에는 :start 이상 :end 미만 구간 조건이 들어가야 한다.
+    ex) UPDATE reviews SET ... WHERE id >= :start AND id < :end
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        sql: str,
+        pk: str = "id",
+        batch_size: int = BACKFILL_BATCH_SIZE,
+        pause: float = 0.0,
+    ) -> None:
+        self.table_name = table_name
+        self.sql = sql
+        self.pk = pk
+        self.batch_size = batch_size
+        self.pause = pause
+
+    @classmethod
+    def batched_backfill(
+        cls,
+        operations: Operations,
+        table_name: str,
+        sql: str,
+        pk: str = "id",
+        batch_size: int = BACKFILL_BATCH_SIZE,
+        pause: float = 0.0,
+    ):
+        """table_name 의 pk 구간별로 sql 실행하는 메소드. (구간마다 commit)"""
+
+        return operations.invoke(
+            cls(table_name, sql, pk=pk, batch_size=batch_size, pause=pause)
+        )
+
+
+def _drop_invalid_index(operations: Operations, index_name: str):
+    """CONCURRENTLY 생성이 중간에 실패해서 INVALID 로 남은 인덱스 삭제하는 메소드."""
+
+    if operations.get_context().as_sql:
+        return
+
+    invalid = (
+        operations.get_bind()
+        .execute(
+            text(
+                "SELECT 1 FROM pg_index "
+                "WHERE indexrelid = to_regclass(:name) AND NOT indisvalid"
+            ),
+            {"name": index_name},
+        )
+        .first()
+    )
+    if invalid:
+        logger.warning(f"drop invalid index : {index_name}")
+        operations.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{index_name}"')
+
+
+@Operations.implementation_for(CreateIndexConcurrentlyOp)
+def create_index_concurrently(
+    operations: Operations, operation: CreateIndexConcurrentlyOp
+):
+    with operations.get_context().autocommit_block():
+        _drop_invalid_index(operations, operation.index_name)
+        operations.create_index(
+            operation.index_name,
+            operation.table_name,
+            operation.columns,
+            unique=operation.unique,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+            **operation.kw,
+        )
+
+
+@Operations.implementation_for(DropIndexConcurrentlyOp)
+def drop_index_concurrently(operations: Operations, operation: DropIndexConcurrentlyOp):
+    with operations.get_context().autocommit_block():
+        operations.drop_index(
+            operation.index_name,
+            table_name=operation.table_name,
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+@Operations.implementation_for(BatchedBackfillOp)
+def batched_backfill(operations: Operations, operation: BatchedBackfillOp):
+    context = operations.get_context()
+    stmt = text(operation.sql)
+
+    # offline (--sql) 모드에서는 전체 구간을 한 번에 실행하는 SQL만 출력
+    if context.as_sql:
+        operations.execute(stmt.bindparams(start=-(2**63), end=2**63 - 1))
+        return
+
+    with context.autocommit_block():
+        bind = operations.get_bind()
+        lo, hi = bind.execute(
+            text(
+                f"SELECT min({operation.pk}), max({operation.pk}) "
+                f"FROM {operation.table_name}"
+            )
+        ).one()
+        if lo is None:
+            return
+
+        start = lo
+        while start <= hi:
+            end = start + operation.batch_size
+            bind.execute(stmt, {"start": start, "end": end})
+            logger.info(f"backfill {operation.table_name} : {start} ~ {end} / {hi}")
+            start = end
+            if operation.pause:
+                time.sleep(operation.pause)
+
+
+def _render_kw(kw: dict) -> str:
+    return "".join(f", {k}={v!r}" for k, v in kw.items())
+
+
+@renderers.dispatch_for(CreateIndexConcurrentlyOp)
+def render_create_index_concurrently(autogen_context, op: CreateIndexConcurrentlyOp):
+    unique = ", unique=True" if op.unique else ""
+    return (
+        f"op.create_index_concurrently({op.index_name!r}, {op.table_name!r}, "
+        f"{op.columns!r}{unique}{_render_kw(op.kw)})"
+    )
+
+
+@renderers.dispatch_for(DropIndexConcurrentlyOp)
+def render_drop_index_concurrently(autogen_context, op: DropIndexConcurrentlyOp):
+    return f"op.drop_index_concurrently({op.index_name!r}, {op.table_name!r})"
+
+
+def _to_concurrent_ops(ops: List[MigrateOperation], new_tables: set) -> list:
+    converted = []
+    for op in ops:
+        if isinstance(op, ModifyTableOps):
+            op.ops = _to_concurrent_ops(op.ops, new_tables)
+        elif isinstance(op, CreateIndexOp) and op.table_name not in new_tables:
+            op = CreateIndexConcurrentlyOp.from_index_op(op)
+        elif isinstance(op, DropIndexOp) and op.table_name not in new_tables:
+            op = DropIndexConcurrentlyOp.from_index_op(op)
+        converted.append(op)
+    return converted
+
+
+def use_concurrent_indexes(context, revision, directives):
+    """autogenerate 결과에서 기존 테이블의 인덱스 생성/삭제를 CONCURRENTLY 로 바꾸는 메소드.
+
+    같은 revision 에서 새로 만드는 테이블은 비어있으므로 일반 인덱스 그대로 둔다.
+    """
+
+    for script in directives:
+        for ops in [*script.upgrade_ops_list, *script.downgrade_ops_list]:
+            new_tables = {
+                op.table_name for op in ops.ops if isinstance(op, CreateTableOp)
+            }
+            ops.ops = _to_concurrent_ops(ops.ops, new_tables)
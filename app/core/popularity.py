@@ -0,0 +1,22 @@
+from typing import List
+
+from app.core.redis import get_redis
+
+# 찜/찜 해제로 인기 점수를 다시 계산해야 하는 bakery_id
+# (찜 해제는 남는 row가 없어서 주기적 갱신의 변경 감지 쿼리로 찾을 수 없다)
+BAKERY_POPULARITY_DIRTY = "bakery_popularity:dirty"
+
+
+async def mark_dirty_bakeries(bakery_ids: List[int]):
+    """인기 점수 재계산이 필요한 bakery_id 기록하는 메소드."""
+
+    if bakery_ids:
+        redis = await get_redis()
+        await redis.sadd(BAKERY_POPULARITY_DIRTY, *bakery_ids)
+
+
+async def take_dirty_bakeries(count: int) -> List[int]:
+    """인기 점수 재계산할 bakery_id 꺼내는 메소드."""
+
+    redis = await get_redis()
+    return [int(b) for b in await redis.spop(BAKERY_POPULARITY_DIRTY, count) or []]
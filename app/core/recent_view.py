@@ -0,0 +1,117 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from redis.exceptions import RedisError
+
+from app.core.config import Configs
+from app.core.const import RECENT_VIEW_LIMIT
+from app.core.redis import get_redis
+
+config = Configs()
+logger = logging.getLogger("bread-api")
+
+RECENT_VIEW_PREFIX = "recent_view"
+# DB에 아직 반영되지 않은 최근 조회 목록을 가진 user_id
+RECENT_VIEW_DIRTY = f"{RECENT_VIEW_PREFIX}:dirty"
+
+RecentViews = List[Tuple[int, float]]
+
+
+def build_recent_view_key(user_id: int) -> str:
+    """유저별 최근 조회한 빵집 sorted set key 반환하는 메소드. (score : 조회시각)"""
+
+    return f"{RECENT_VIEW_PREFIX}:{user_id}"
+
+
+def _to_views(rows) -> RecentViews:
+    return [(int(bakery_id), score) for bakery_id, score in rows]
+
+
+async def record_recent_view(user_id: int, bakery_id: int, viewed_at: float):
+    """최근 조회한 빵집 기록하는 메소드. (RECENT_VIEW_LIMIT개만 유지)"""
+
+    key = build_recent_view_key(user_id)
+    try:
+        redis = await get_redis()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(key, {bakery_id: viewed_at})
+            pipe.zremrangebyrank(key, 0, -(RECENT_VIEW_LIMIT + 1))
+            pipe.expire(key, config.RECENT_VIEW_TTL)
+            pipe.sadd(RECENT_VIEW_DIRTY, user_id)
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"recent view record failed : {user_id} {bakery_id} {e}")
+
+
+async def get_recent_views(user_id: int) -> Optional[RecentViews]:
+    """최근 조회한 빵집 (bakery_id, 조회시각) 최신순 조회하는 메소드. (캐시 없으면 None)"""
+
+    try:
+        redis = await get_redis()
+        rows = await redis.zrevrange(
+            build_recent_view_key(user_id), 0, RECENT_VIEW_LIMIT - 1, withscores=True
+        )
+    except RedisError as e:
+        logger.warning(f"recent view get failed : {user_id} {e}")
+        return None
+
+    return _to_views(rows) if rows else None
+
+
+async def seed_recent_views(user_id: int, views: RecentViews):
+    """DB에서 읽은 최근 조회 목록을 redis에 채우는 메소드."""
+
+    if not views:
+        return
+
+    key = build_recent_view_key(user_id)
+    try:
+        redis = await get_redis()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(key, {bakery_id: viewed_at for bakery_id, viewed_at in views})
+            pipe.expire(key, config.RECENT_VIEW_TTL)
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"recent view seed failed : {user_id} {e}")
+
+
+async def clear_recent_views(user_id: int):
+    """최근 조회한 빵집 기록 삭제하는 메소드."""
+
+    redis = await get_redis()
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.delete(build_recent_view_key(user_id))
+        pipe.srem(RECENT_VIEW_DIRTY, user_id)
+        await pipe.execute()
+
+
+async def take_dirty_users(count: int) -> List[int]:
+    """DB에 반영할 user_id 꺼내는 메소드."""
+
+    redis = await get_redis()
+    return [int(u) for u in await redis.spop(RECENT_VIEW_DIRTY, count) or []]
+
+
+async def mark_dirty_users(user_ids: List[int]):
+    """DB 반영에 실패한 user_id 다시 넣는 메소드."""
+
+    if user_ids:
+        redis = await get_redis()
+        await redis.sadd(RECENT_VIEW_DIRTY, *user_ids)
+
+
+async def get_recent_views_bulk(user_ids: List[int]) -> Dict[int, RecentViews]:
+    """여러 유저의 최근 조회 목록 한 번에 조회하는 메소드."""
+
+    redis = await get_redis()
+    async with redis.pipeline(transaction=False) as pipe:
+        for user_id in user_ids:
+            pipe.zrevrange(
+                build_recent_view_key(user_id),
+                0,
+                RECENT_VIEW_LIMIT - 1,
+                withscores=True,
+            )
+        results = await pipe.execute()
+
+    return {u: _to_views(rows) for u, rows in zip(user_ids, results)}
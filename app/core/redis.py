@@ -5,6 +5,7 @@ from app.core.config import Configs
 config = Configs()
 
 _redis: redis.Redis | None = None
+_binary_redis: redis.Redis | None = None
 
 
 async def get_redis() -> redis.Redis:
@@ -16,3 +17,15 @@ async def get_redis() -> redis.Redis:
             decode_responses=True,
         )
     return _redis
+
+
+async def get_binary_redis() -> redis.Redis:
+    """이미지 등 bytes 값을 그대로 다루는 redis client 반환하는 메소드."""
+
+    global _binary_redis
+    if _binary_redis is None:
+        _binary_redis = redis.from_url(
+            config.REDIS_URL,
+            decode_responses=False,
+        )
+    return _binary_redis
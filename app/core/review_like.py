@@ -0,0 +1,166 @@
+from typing import Dict, List, Optional, Tuple
+
+from app.core.redis import get_redis
+
+# (user_id:review_id) -> "1" 좋아요 / "0" 좋아요 해지 (마지막 상태만 보관)
+REVIEW_LIKE_PENDING = "review_like:pending"
+# review_id -> 아직 DB에 반영되지 않은 like_count 증감값
+REVIEW_LIKE_DELTA = "review_like:delta"
+# flusher가 DB에 반영중인 버퍼 (반영 실패시 다음 주기에 다시 처리)
+REVIEW_LIKE_PENDING_FLUSHING = "review_like:pending:flushing"
+REVIEW_LIKE_DELTA_FLUSHING = "review_like:delta:flushing"
+
+# 현재 상태 = 버퍼 -> 반영중 버퍼 -> DB 순서로 확인하고,
+# 바뀌는 경우에만 상태/증감값을 함께 기록 (동시 요청에도 한 번만 반영)
+_TOGGLE_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], ARGV[1])
+if not current then
+    current = redis.call('HGET', KEYS[2], ARGV[1])
+end
+if not current then
+    current = ARGV[3]
+end
+if current == ARGV[2] then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+redis.call('HINCRBY', KEYS[3], ARGV[4], ARGV[2] == '1' and 1 or -1)
+return 1
+"""
+
+# 반영중 버퍼가 비어있을 때만 현재 버퍼를 통째로 넘기고, 반영할 상태 반환
+_TAKE_SCRIPT = """
+if redis.call('EXISTS', KEYS[3]) == 0 and redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('RENAME', KEYS[1], KEYS[3])
+    if redis.call('EXISTS', KEYS[2]) == 1 then
+        redis.call('RENAME', KEYS[2], KEYS[4])
+    end
+end
+return redis.call('HGETALL', KEYS[3])
+"""
+
+
+def _field(user_id: int, review_id: int) -> str:
+    return f"{user_id}:{review_id}"
+
+
+def parse_pending_likes(
+    pending: Dict[str, str],
+) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """버퍼 상태를 (좋아요 목록, 좋아요 해지 목록) 으로 나누는 메소드."""
+
+    likes, unlikes = [], []
+    for field, state in pending.items():
+        user_id, review_id = field.split(":")
+        pair = (int(user_id), int(review_id))
+        (likes if state == "1" else unlikes).append(pair)
+    return likes, unlikes
+
+
+async def get_buffered_like(user_id: int, review_id: int) -> Optional[bool]:
+    """아직 DB에 반영되지 않은 좋아요 상태 조회하는 메소드. (없으면 None)"""
+
+    redis = await get_redis()
+    field = _field(user_id, review_id)
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.hget(REVIEW_LIKE_PENDING, field)
+        pipe.hget(REVIEW_LIKE_PENDING_FLUSHING, field)
+        pending, flushing = await pipe.execute()
+
+    state = pending if pending is not None else flushing
+    return None if state is None else state == "1"
+
+
+async def buffer_review_like(
+    user_id: int, review_id: int, is_like: bool, db_is_like: bool
+) -> bool:
+    """좋아요/해지를 버퍼에 기록하는 메소드. (이미 같은 상태면 False)
+
+    db_is_like : 버퍼에 상태가 없을 때 기준이 되는 DB 좋아요 여부
+    """
+
+    redis = await get_redis()
+    changed = await redis.eval(
+        _TOGGLE_SCRIPT,
+        3,
+        REVIEW_LIKE_PENDING,
+        REVIEW_LIKE_PENDING_FLUSHING,
+        REVIEW_LIKE_DELTA,
+        _field(user_id, review_id),
+        "1" if is_like else "0",
+        "1" if db_is_like else "0",
+        review_id,
+    )
+    return changed == 1
+
+
+async def get_buffered_review_likes(
+    user_id: int, review_ids: List[int]
+) -> Tuple[Dict[int, int], Dict[int, bool]]:
+    """조회용으로 반영 대기중인 (like_count 증감값, 유저 좋아요 상태) 반환하는 메소드."""
+
+    if not review_ids:
+        return {}, {}
+
+    redis = await get_redis()
+    fields = [_field(user_id, r) for r in review_ids]
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.hmget(REVIEW_LIKE_DELTA, review_ids)
+        pipe.hmget(REVIEW_LIKE_DELTA_FLUSHING, review_ids)
+        pipe.hmget(REVIEW_LIKE_PENDING, fields)
+        pipe.hmget(REVIEW_LIKE_PENDING_FLUSHING, fields)
+        deltas, flushing_deltas, states, flushing_states = await pipe.execute()
+
+    delta_map, state_map = {}, {}
+    for review_id, delta, flushing_delta, state, flushing_state in zip(
+        review_ids, deltas, flushing_deltas, states, flushing_states
+    ):
+        total = int(delta or 0) + int(flushing_delta or 0)
+        if total:
+            delta_map[review_id] = total
+        state = state if state is not None else flushing_state
+        if state is not None:
+            state_map[review_id] = state == "1"
+    return delta_map, state_map
+
+
+async def merge_buffered_review_likes(user_id: int, reviews: list) -> list:
+    """아직 DB에 반영되지 않은 좋아요 개수/여부를 조회 결과에 합치는 메소드."""
+
+    deltas, states = await get_buffered_review_likes(
+        user_id=user_id, review_ids=[r.review_id for r in reviews]
+    )
+    if not deltas and not states:
+        return reviews
+
+    return [
+        r.model_copy(
+            update={
+                "review_like_count": r.review_like_count + deltas.get(r.review_id, 0),
+                "is_like": states.get(r.review_id, r.is_like),
+            }
+        )
+        for r in reviews
+    ]
+
+
+async def take_pending_likes() -> Dict[str, str]:
+    """DB에 반영할 버퍼 가져오는 메소드. (이전 반영이 실패했다면 그 버퍼부터)"""
+
+    redis = await get_redis()
+    pending = await redis.eval(
+        _TAKE_SCRIPT,
+        4,
+        REVIEW_LIKE_PENDING,
+        REVIEW_LIKE_DELTA,
+        REVIEW_LIKE_PENDING_FLUSHING,
+        REVIEW_LIKE_DELTA_FLUSHING,
+    )
+    return dict(zip(pending[::2], pending[1::2]))
+
+
+async def clear_flushing_likes():
+    """DB 반영이 끝난 버퍼 삭제하는 메소드."""
+
+    redis = await get_redis()
+    await redis.delete(REVIEW_LIKE_PENDING_FLUSHING, REVIEW_LIKE_DELTA_FLUSHING)
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+from datetime import datetime, time
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import Configs
+from app.core.database import start_session
+from app.model.bakery import OperatingHour
+from app.utils.converter import operating_hours_to_open_status
+
+config = Configs()
+logger = logging.getLogger("bread-api")
+
+# (is_opened, open_time, close_time)
+DailyHour = Tuple[Optional[bool], Optional[time], Optional[time]]
+
+
+class OperatingSchedule:
+    """베이커리별 주간 영업시간을 프로세스 메모리에 들고 있는 캐시.
+
+    목록 쿼리마다 operating_hours를 요일 조건으로 join 하지 않고,
+    요청당 한 번 구한 현재시각으로 영업상태를 계산하기 위해 사용.
+    """
+
+    def __init__(self) -> None:
+        # bakery_id -> {day_of_week: (is_opened, open_time, close_time)}
+        self._hours: Dict[int, Dict[int, DailyHour]] = {}
+        self.loaded_at: Optional[datetime] = None
+
+    @staticmethod
+    async def _fetch(
+        db: AsyncSession, bakery_ids: Optional[Iterable[int]] = None
+    ) -> Dict[int, Dict[int, DailyHour]]:
+        """영업시간 조회해서 bakery_id별 주간 영업시간으로 묶어주는 메소드."""
+
+        stmt = select(
+            OperatingHour.bakery_id,
+            OperatingHour.day_of_week,
+            OperatingHour.is_opened,
+            OperatingHour.open_time,
+            OperatingHour.close_time,
+        )
+        if bakery_ids is not None:
+            stmt = stmt.where(OperatingHour.bakery_id.in_(bakery_ids))
+
+        hours: Dict[int, Dict[int, DailyHour]] = {}
+        for r in (await db.execute(stmt)).all():
+            hours.setdefault(r.bakery_id, {})[r.day_of_week] = (
+                r.is_opened,
+                r.open_time,
+                r.close_time,
+            )
+        return hours
+
+    async def refresh(self, db: AsyncSession):
+        """전체 영업시간 다시 읽어서 교체하는 메소드."""
+
+        self._hours = await self._fetch(db)
+        self.loaded_at = datetime.now()
+
+    async def ensure_loaded(self, db: AsyncSession, bakery_ids: Iterable[int]):
+        """캐시에 없는 베이커리 영업시간만 조회해서 채우는 메소드."""
+
+        missing = {i for i in bakery_ids if i not in self._hours}
+        if not missing:
+            return
+
+        fetched = await self._fetch(db, missing)
+        for bakery_id in missing:
+            # 영업시간 데이터가 없는 베이커리도 매번 조회하지 않도록 빈 값으로 적재
+            self._hours[bakery_id] = fetched.get(bakery_id, {})
+
+    def open_status(self, bakery_id: int, now: datetime) -> str:
+        """현재시각 기준 영업상태 반환하는 메소드."""
+
+        is_opened, open_time, close_time = self._hours.get(bakery_id, {}).get(
+            now.weekday(), (None, None, None)
+        )
+        return operating_hours_to_open_status(
+            is_opened=is_opened,
+            close_time=close_time,
+            open_time=open_time,
+            now=now.time(),
+        )
+
+    async def get_open_statuses(
+        self, db: AsyncSession, bakery_ids: Iterable[int], now: datetime
+    ) -> Dict[int, str]:
+        """베이커리 id 목록의 영업상태 반환하는 메소드."""
+
+        bakery_ids = list(bakery_ids)
+        await self.ensure_loaded(db, bakery_ids)
+        return {i: self.open_status(i, now) for i in bakery_ids}
+
+
+operating_schedule = OperatingSchedule()
+
+
+async def refresh_operating_schedule_periodically():
+    """주기적으로 영업시간 캐시 갱신하는 백그라운드 작업."""
+
+    while True:
+        try:
+            async with start_session() as db:
+                await operating_schedule.refresh(db)
+        except Exception:
+            logger.exception("operating schedule refresh failed")
+
+        await asyncio.sleep(config.OPERATING_SCHEDULE_REFRESH_SECONDS)
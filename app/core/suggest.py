@@ -0,0 +1,224 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.utils.hangul import is_choseong_only, normalize_text, to_choseong
+
+SUGGEST_TYPE_BAKERY = "bakery"
+SUGGEST_TYPE_MENU = "menu"
+
+# /search/suggest 에서 요청 가능한 최대 size
+SUGGEST_MAX_SIZE = 30
+# 이 길이 이하의 접두사는 일치 범위가 넓어서 상위 항목을 미리 계산해 둔다
+SHORT_PREFIX_LENGTH = 2
+
+
+@dataclass(frozen=True)
+class SuggestEntry:
+    text: str
+    type: str
+    bakery_id: Optional[int]
+    weight: int
+
+
+@dataclass(frozen=True)
+class SuggestSource:
+    """자동완성 색인 대상이 되는 베이커리 정보."""
+
+    bakery_id: int
+    name: str
+    review_count: int
+    menu_names: Tuple[str, ...]
+
+
+def _prefix_keys(text: str) -> List[str]:
+    """텍스트 전체와 단어 시작 위치별 접미사를 색인 key로 반환하는 메소드.
+
+    "성심당 본점" -> ["성심당 본점", "본점"] 이라서 "본점"으로도 찾을 수 있다.
+    """
+
+    normalized = normalize_text(text)
+    words = normalized.split(" ")
+    return [" ".join(words[i:]) for i in range(len(words)) if words[i]]
+
+
+def _entry_keys(entry: SuggestEntry) -> Set[str]:
+    """항목의 색인 key (원문 접미사 + 초성) 반환하는 메소드."""
+
+    keys = _prefix_keys(entry.text)
+    # 초성 key는 띄어쓰기 없이 입력해도 찾을 수 있도록 공백 제거
+    return {*keys, *(to_choseong(k).replace(" ", "") for k in keys)}
+
+
+def _short_prefixes(key: str) -> Set[str]:
+    return {key[:i] for i in range(1, min(len(key), SHORT_PREFIX_LENGTH) + 1)}
+
+
+def _rank(entry: SuggestEntry) -> Tuple[int, int, str, str]:
+    # 가중치 높은 순, 같으면 짧은 이름 우선, 그 다음은 이름 순서로 고정
+    return entry.weight, -len(entry.text), entry.text, entry.type
+
+
+def _bakery_entry(source: SuggestSource) -> SuggestEntry:
+    return SuggestEntry(
+        text=source.name,
+        type=SUGGEST_TYPE_BAKERY,
+        bakery_id=source.bakery_id,
+        weight=source.review_count or 0,
+    )
+
+
+def _menu_entry(menu_name: str, bakery_count: int) -> SuggestEntry:
+    # 메뉴는 여러 빵집에 같은 이름이 있으므로 빵집 수를 가중치로 사용
+    return SuggestEntry(
+        text=menu_name, type=SUGGEST_TYPE_MENU, bakery_id=None, weight=bakery_count
+    )
+
+
+class SuggestIndex:
+    """빵집이름/메뉴이름 자동완성용 프로세스 메모리 접두사 색인.
+
+    (key, entry) 를 key 기준 정렬 배열로 들고 있고, 접두사 범위는 bisect로 찾는다.
+    key는 소문자로 정리한 원문과 초성 두 가지를 모두 넣어서 초성 검색도 지원.
+    1~2글자 접두사는 일치 범위가 넓으므로 가중치 상위 항목을 미리 계산해 둔다.
+    """
+
+    def __init__(self) -> None:
+        self._sources: Dict[int, SuggestSource] = {}
+        self._menu_counts: Counter = Counter()
+        self._keys: List[str] = []
+        self._entries: List[SuggestEntry] = []
+        self._top: Dict[str, List[SuggestEntry]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def replace_all(self, sources: Iterable[SuggestSource]):
+        """전체 색인 교체하는 메소드."""
+
+        self._sources = {s.bakery_id: s for s in sources}
+        self._menu_counts = Counter(
+            name for s in self._sources.values() for name in set(s.menu_names)
+        )
+
+        entries = [_bakery_entry(s) for s in self._sources.values()]
+        entries += [_menu_entry(n, c) for n, c in self._menu_counts.items()]
+        pairs = sorted(
+            ((k, e) for e in entries for k in _entry_keys(e)), key=lambda p: p[0]
+        )
+        self._keys = [p[0] for p in pairs]
+        self._entries = [p[1] for p in pairs]
+        self._top = {
+            prefix: self._scan(prefix, SUGGEST_MAX_SIZE)
+            for prefix in {p for k in self._keys for p in _short_prefixes(k)}
+        }
+
+    def update(self, bakery_ids: Iterable[int], sources: Iterable[SuggestSource]):
+        """바뀐 베이커리 항목만 색인에서 빼고 다시 넣는 메소드. (sources에 없는 id는 삭제)"""
+
+        sources = {s.bakery_id: s for s in sources}
+        removed: List[SuggestEntry] = []
+        added: List[SuggestEntry] = []
+        old_menus: Counter = Counter()
+        new_menus: Counter = Counter()
+
+        for bakery_id in {*bakery_ids, *sources}:
+            old = self._sources.pop(bakery_id, None)
+            if old is not None:
+                removed.append(_bakery_entry(old))
+                old_menus.update(set(old.menu_names))
+            new = sources.get(bakery_id)
+            if new is not None:
+                self._sources[bakery_id] = new
+                added.append(_bakery_entry(new))
+                new_menus.update(set(new.menu_names))
+
+        # 빵집 수(가중치)가 바뀐 메뉴만 교체
+        for name in old_menus.keys() | new_menus.keys():
+            before = self._menu_counts[name]
+            after = before - old_menus[name] + new_menus[name]
+            if before == after:
+                continue
+            if before:
+                removed.append(_menu_entry(name, before))
+            if after:
+                added.append(_menu_entry(name, after))
+                self._menu_counts[name] = after
+            else:
+                del self._menu_counts[name]
+
+        # 지워지는 항목이 상위 목록에 있던 접두사만 나중에 다시 계산
+        stale: Set[str] = set()
+        for entry in removed:
+            for key in _entry_keys(entry):
+                self._remove(key, entry)
+                stale |= {
+                    p for p in _short_prefixes(key) if entry in self._top.get(p, ())
+                }
+        for entry in added:
+            for key in _entry_keys(entry):
+                self._insert(key, entry)
+                for prefix in _short_prefixes(key) - stale:
+                    self._add_top(prefix, entry)
+
+        for prefix in stale:
+            top = self._scan(prefix, SUGGEST_MAX_SIZE)
+            if top:
+                self._top[prefix] = top
+            else:
+                self._top.pop(prefix, None)
+
+    def _add_top(self, prefix: str, entry: SuggestEntry):
+        """짧은 접두사의 상위 목록에 새 항목 반영하는 메소드."""
+
+        top = self._top.setdefault(prefix, [])
+        if entry in top:
+            return
+        if len(top) < SUGGEST_MAX_SIZE or _rank(entry) > _rank(top[-1]):
+            top.append(entry)
+            top.sort(key=_rank, reverse=True)
+            del top[SUGGEST_MAX_SIZE:]
+
+    def _insert(self, key: str, entry: SuggestEntry):
+        i = bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._entries.insert(i, entry)
+
+    def _remove(self, key: str, entry: SuggestEntry):
+        i = bisect_left(self._keys, key)
+        while i < len(self._keys) and self._keys[i] == key:
+            if self._entries[i] == entry:
+                del self._keys[i]
+                del self._entries[i]
+                return
+            i += 1
+
+    def _scan(self, prefix: str, size: int) -> List[SuggestEntry]:
+        """접두사 범위 전체에서 가중치 높은 순으로 size개 반환하는 메소드."""
+
+        keys, entries = self._keys, self._entries
+        matched = {}
+        i = bisect_left(keys, prefix)
+        while i < len(keys) and keys[i].startswith(prefix):
+            matched.setdefault(entries[i], None)
+            i += 1
+
+        return heapq.nlargest(size, matched, key=_rank)
+
+    def search(self, keyword: str, size: int = 10) -> List[SuggestEntry]:
+        """접두사가 일치하는 항목을 가중치 높은 순으로 size개 반환하는 메소드."""
+
+        prefix = normalize_text(keyword)
+        if not prefix:
+            return []
+        if is_choseong_only(prefix):
+            prefix = prefix.replace(" ", "")
+
+        if len(prefix) <= SHORT_PREFIX_LENGTH and size <= SUGGEST_MAX_SIZE:
+            return self._top.get(prefix, [])[:size]
+        return self._scan(prefix, size)
+
+
+suggest_index = SuggestIndex()
@@ -0,0 +1,33 @@
+import time
+from typing import List
+
+from app.core.redis import get_redis
+
+# 자동완성 색인을 다시 만들어야 하는 bakery_id (score : 기록한 시각)
+# 검색 문서는 인스턴스 중 한 곳에서만 갱신하므로, 메모리 색인은 인스턴스마다 여기서 가져가서 반영
+SUGGEST_CHANGED = "suggest:changed"
+# 이보다 오래 반영하지 못한 인스턴스는 색인 전체를 다시 만든다
+SUGGEST_CHANGED_RETENTION_SECONDS = 60 * 60 * 24
+
+
+async def record_suggest_changes(bakery_ids: List[int]):
+    """자동완성 색인 갱신이 필요한 bakery_id 기록하는 메소드."""
+
+    if not bakery_ids:
+        return
+
+    now = time.time()
+    redis = await get_redis()
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.zadd(SUGGEST_CHANGED, {b: now for b in bakery_ids})
+        pipe.zremrangebyscore(
+            SUGGEST_CHANGED, "-inf", now - SUGGEST_CHANGED_RETENTION_SECONDS
+        )
+        await pipe.execute()
+
+
+async def get_suggest_changes(since: float) -> List[int]:
+    """since (unix time) 이후 기록된 bakery_id 조회하는 메소드."""
+
+    redis = await get_redis()
+    return [int(b) for b in await redis.zrangebyscore(SUGGEST_CHANGED, since, "+inf")]
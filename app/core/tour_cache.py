@@ -0,0 +1,94 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Awaitable, Callable, List, Optional
+
+from redis.exceptions import RedisError
+
+from app.core.config import Configs
+from app.core.redis import get_redis
+
+config = Configs()
+logger = logging.getLogger("bread-api")
+
+TOUR_CACHE_PREFIX = "tour"
+
+Fetcher = Callable[[], Awaitable[List[dict]]]
+
+# 백그라운드 재검증 task가 GC 되지 않도록 참조 유지
+_background_tasks: set = set()
+
+
+def build_tour_cache_key(endpoint: str, sigungu: int, cat: Optional[str] = None):
+    """관광공사 API 캐시 key 반환하는 메소드."""
+
+    key = f"{TOUR_CACHE_PREFIX}:{endpoint}:sigungu={sigungu}"
+    return f"{key}:cat={cat}" if cat else key
+
+
+async def store_tour_items(key: str, items: List[dict]):
+    """관광공사 API 응답 캐싱하는 메소드. (stale 기간까지 보관)"""
+
+    payload = json.dumps(
+        {"fetched_at": time.time(), "items": items}, ensure_ascii=False
+    )
+    try:
+        redis = await get_redis()
+        await redis.setex(key, config.TOUR_CACHE_STALE_TTL, payload)
+    except RedisError as e:
+        logger.warning(f"tour cache set failed : {key} {e}")
+
+
+async def refresh_tour_items(key: str, fetcher: Fetcher) -> List[dict]:
+    """관광공사 API 호출해서 캐시 갱신하는 메소드.
+
+    fetcher 가 실패하면 예외를 그대로 올려서 기존 (stale) 캐시를 덮어쓰지 않는다.
+    """
+
+    items = await fetcher()
+    await store_tour_items(key, items)
+    return items
+
+
+async def _revalidate(key: str, fetcher: Fetcher):
+    """stale 캐시 백그라운드 갱신하는 메소드. (lock으로 중복 호출 방지)"""
+
+    lock_key = f"{key}:lock"
+    try:
+        redis = await get_redis()
+        if not await redis.set(lock_key, 1, nx=True, ex=config.TOUR_CACHE_LOCK_SECONDS):
+            return
+        try:
+            await refresh_tour_items(key, fetcher)
+        finally:
+            await redis.delete(lock_key)
+    except Exception:
+        logger.exception(f"tour cache revalidate failed : {key}")
+
+
+async def get_tour_items(key: str, fetcher: Fetcher) -> List[dict]:
+    """캐시된 관광공사 데이터 반환하는 메소드. (stale-while-revalidate)
+
+    - fresh : 캐시 그대로 반환
+    - stale : 캐시 반환 + 백그라운드에서 갱신
+    - miss  : API 호출 후 캐싱
+    """
+
+    try:
+        redis = await get_redis()
+        cached = await redis.get(key)
+    except RedisError as e:
+        logger.warning(f"tour cache get failed : {key} {e}")
+        cached = None
+
+    if not cached:
+        return await refresh_tour_items(key, fetcher)
+
+    payload = json.loads(cached)
+    if time.time() - payload["fetched_at"] > config.TOUR_CACHE_FRESH_SECONDS:
+        task = asyncio.create_task(_revalidate(key, fetcher))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    return payload["items"]
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -17,6 +19,7 @@ from app.api import (
     tour,
     users,
 )
+from app.core.config import Configs
 from app.core.exception import (
     AlreadyDislikedException,
     AlreadyLikedException,
@@ -24,6 +27,7 @@ from app.core.exception import (
     DailyReviewLimitExceededExecption,
     DuplicateException,
     InvalidAreaCodeException,
+    InvalidCursorException,
     InvalidImageFileException,
     InvalidSortParameterException,
     InvalidTokenException,
@@ -35,6 +39,21 @@ from app.core.exception import (
     WithdrawnMemberException,
     exception_handler,
 )
+from app.core.executor import shutdown_image_executor, warm_up_image_executor
+from app.core.http import close_http_client, init_http_client
+from app.core.schedule import refresh_operating_schedule_periodically
+from app.services.bakery_service import (
+    flush_recent_views_periodically,
+    refresh_bakery_cards_periodically,
+    refresh_bakery_popularity_periodically,
+    refresh_recommendations_periodically,
+)
+from app.services.review_service import (
+    flush_review_likes_periodically,
+    run_review_image_worker,
+)
+from app.services.search_service import refresh_search_documents_periodically
+from app.services.tour_service import refresh_tour_cache_periodically
 
 # -------------------- 로깅 설정 --------------------
 logging.basicConfig(
@@ -44,13 +63,63 @@ logging.basicConfig(
 logger = logging.getLogger("bread-api")
 # --------------------------------------------------
 
+config = Configs()
+
 origins = [
     "http://localhost:3000",
 ]
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 외부 API 공용 http client
+    init_http_client()
+    # 이미지 변환용 프로세스 풀
+    warm_up_image_executor()
+    # 영업시간 캐시 주기적 갱신
+    schedule_refresher = asyncio.create_task(refresh_operating_schedule_periodically())
+    # 검색 문서 주기적 갱신
+    search_refresher = asyncio.create_task(refresh_search_documents_periodically())
+    # 관광공사 데이터 캐시 주기적 갱신
+    tour_refresher = asyncio.create_task(refresh_tour_cache_periodically())
+    # 리뷰 좋아요 버퍼 주기적 DB 반영
+    like_flusher = asyncio.create_task(flush_review_likes_periodically())
+    # 최근 조회한 베이커리 주기적 DB 반영
+    recent_view_flusher = asyncio.create_task(flush_recent_views_periodically())
+    # 리스트용 베이커리 카드 주기적 갱신
+    card_refresher = asyncio.create_task(refresh_bakery_cards_periodically())
+    # hot한 빵집 인기 점수 주기적 갱신
+    popularity_refresher = asyncio.create_task(refresh_bakery_popularity_periodically())
+    # 취향기반 추천 빵집 주기적 재계산
+    recommendation_refresher = asyncio.create_task(
+        refresh_recommendations_periodically()
+    )
+    # 리뷰 이미지 후처리 워커
+    image_workers = [
+        asyncio.create_task(run_review_image_worker())
+        for _ in range(config.REVIEW_IMAGE_WORKERS)
+    ]
+    yield
+    schedule_refresher.cancel()
+    search_refresher.cancel()
+    tour_refresher.cancel()
+    like_flusher.cancel()
+    recent_view_flusher.cancel()
+    card_refresher.cancel()
+    popularity_refresher.cancel()
+    recommendation_refresher.cancel()
+    for worker in image_workers:
+        worker.cancel()
+    # 처리중이던 리뷰 이미지 작업을 큐로 되돌릴 때까지 대기
+    await asyncio.gather(*image_workers, return_exceptions=True)
+    await close_http_client()
+    shutdown_image_executor()
+
+
 app = FastAPI(
     title="빵지순례 API",
     description="빵지순례 API",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -99,6 +168,7 @@ app.add_exception_handler(DuplicateException, exception_handler)
 app.add_exception_handler(NotFoundException, exception_handler)
 app.add_exception_handler(InvalidAreaCodeException, exception_handler)
 app.add_exception_handler(InvalidSortParameterException, exception_handler)
+app.add_exception_handler(InvalidCursorException, exception_handler)
 app.add_exception_handler(InvalidImageFileException, exception_handler)
 app.add_exception_handler(ConvertImageException, exception_handler)
 app.add_exception_handler(UploadImageException, exception_handler)
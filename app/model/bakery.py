@@ -4,12 +4,15 @@ from sqlalchemy import (
     Column,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    Numeric,
     SmallInteger,
     String,
     Text,
     Time,
 )
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 
 from app.model.base import Base
@@ -37,10 +40,16 @@ class Bakery(Base, DateTimeMixin):
     avg_rating = Column(Float, default=0, comment="평균 별점")
     review_count = Column(Integer, default=0, comment="리뷰 개수")
     thumbnail = Column(Text, default=None, comment="빵집 썸네일")
+    thumbnail_small = Column(
+        Text, nullable=True, default=None, comment="빵집 썸네일 (리스트용 작은 사이즈)"
+    )
 
 
 class BakeryMenu(Base, DateTimeMixin):
     __tablename__ = "bakery_menus"
+    __table_args__ = (
+        Index("ix_bakery_menus_bakery_signature", "bakery_id", "is_signature"),
+    )
 
     id = Column(Integer, primary_key=True)
     name = Column(String(64), nullable=False)
@@ -55,10 +64,15 @@ class BakeryMenu(Base, DateTimeMixin):
 
 class BakeryPhoto(Base, DateTimeMixin):
     __tablename__ = "bakery_photos"
+    __table_args__ = (
+        Index("ix_bakery_photos_bakery_signature", "bakery_id", "is_signature"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     bakery_id = Column(Integer, nullable=False)
     img_url = Column(Text, comment="이미지 경로")
+    thumb_url = Column(Text, nullable=True, comment="리스트용 작은 사이즈 이미지 경로")
+    detail_url = Column(Text, nullable=True, comment="상세용 중간 사이즈 이미지 경로")
     is_signature = Column(Boolean, default=False)
 
 
@@ -71,6 +85,9 @@ class BakeryPreference(Base):
 
 class OperatingHour(Base):
     __tablename__ = "operating_hours"
+    __table_args__ = (
+        Index("ix_operating_hours_bakery_day", "bakery_id", "day_of_week"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     bakery_id = Column(Integer, nullable=False)
@@ -83,6 +100,7 @@ class OperatingHour(Base):
 
 class MenuPhoto(Base, DateTimeMixin):
     __tablename__ = "menu_photos"
+    __table_args__ = (Index("ix_menu_photos_menu_id", "menu_id"),)
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     menu_id = Column(Integer, nullable=False)
@@ -94,3 +112,96 @@ class RecentBakeryView(Base, DateTimeMixin):
 
     user_id = Column(BigInteger, ForeignKey("users.id"), primary_key=True)
     bakery_id = Column(BigInteger, ForeignKey("bakeries.id"), primary_key=True)
+
+
+class BakerySearchDocument(Base, DateTimeMixin):
+    __tablename__ = "bakery_search_documents"
+    __table_args__ = (
+        Index(
+            "ix_bakery_search_documents_jamo_trgm",
+            "jamo",
+            postgresql_using="gin",
+            postgresql_ops={"jamo": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_bakery_search_documents_choseong_trgm",
+            "choseong",
+            postgresql_using="gin",
+            postgresql_ops={"choseong": "gin_trgm_ops"},
+        ),
+    )
+
+    bakery_id = Column(Integer, primary_key=True)
+    document = Column(
+        Text, nullable=False, comment="검색용 문서 : 빵집이름 구 동 메뉴이름 (소문자)"
+    )
+    choseong = Column(Text, nullable=False, comment="검색용 문서의 초성")
+    jamo = Column(
+        Text, nullable=False, comment="검색용 문서의 자모 (입력 중 부분 일치용)"
+    )
+    menu_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="문서 생성 시점의 메뉴 수 (삭제 감지용)",
+    )
+
+
+class BakeryPopularity(Base, DateTimeMixin):
+    """hot한 빵집 정렬용 인기 점수 테이블. (주기적으로 바뀐 빵집만 재계산)"""
+
+    __tablename__ = "bakery_popularity"
+    __table_args__ = (
+        Index("ix_bakery_popularity_score", "score", "bakery_id"),
+        Index(
+            "ix_bakery_popularity_area_score",
+            "commercial_area_id",
+            "score",
+            "bakery_id",
+        ),
+    )
+
+    # 빵집이 삭제되면 같이 삭제 (주기적 갱신으로는 삭제를 감지할 수 없음)
+    bakery_id = Column(
+        Integer,
+        ForeignKey("bakeries.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="베이커리 ID",
+    )
+    commercial_area_id = Column(Integer, nullable=True, comment="지역 ID")
+    recent_review_count = Column(
+        Integer, nullable=False, default=0, comment="최근 리뷰 개수"
+    )
+    like_count = Column(Integer, nullable=False, default=0, comment="찜 개수")
+    score = Column(
+        Numeric(10, 3),
+        nullable=False,
+        default=0,
+        comment="인기 점수 : 최근 리뷰 수 / 찜 수 / 평균 별점 가중합",
+    )
+
+
+class BakeryCard(Base, DateTimeMixin):
+    """리스트 화면용 베이커리 카드 projection 테이블.
+
+    대표 사진 / 대표 메뉴까지 미리 계산해두고, 리뷰 작성시와 주기적 갱신에서 최신화한다.
+    """
+
+    __tablename__ = "bakery_cards"
+
+    bakery_id = Column(Integer, primary_key=True, comment="베이커리 ID")
+    name = Column(
+        String(40, collation="ko_KR.utf8"), nullable=False, comment="빵집이름"
+    )
+    gu = Column(String(24), comment="구 아름")
+    dong = Column(String(24), comment="동 이름")
+    commercial_area_id = Column(Integer, nullable=True, comment="지역 ID")
+    avg_rating = Column(Float, default=0, comment="평균 별점")
+    review_count = Column(Integer, default=0, comment="리뷰 개수")
+    thumbnail = Column(Text, nullable=True, comment="빵집 썸네일 (작은 사이즈 우선)")
+    signature_img_url = Column(
+        Text, nullable=True, comment="대표 사진 (작은 사이즈 우선, 없으면 NULL)"
+    )
+    signature_menus = Column(
+        ARRAY(Text), nullable=False, default=list, comment="대표 메뉴 이름 목록"
+    )
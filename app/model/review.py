@@ -1,4 +1,15 @@
-from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String, Text, func
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
 
 from app.model.base import Base
 from app.model.datetime_mixin import DateTimeMixin
@@ -6,6 +17,19 @@ from app.model.datetime_mixin import DateTimeMixin
 
 class Review(Base, DateTimeMixin):
     __tablename__ = "reviews"
+    __table_args__ = (
+        # 베이커리 리뷰 정렬 (좋아요 순 / 작성일 순 / 별점 순)
+        # 별점은 NULL 이면 0으로 정렬하므로 같은 COALESCE 표현식으로 색인
+        Index("ix_reviews_bakery_like_count", "bakery_id", "like_count", "id"),
+        Index("ix_reviews_bakery_created_at", "bakery_id", "created_at", "id"),
+        Index(
+            "ix_reviews_bakery_rating", "bakery_id", text("coalesce(rating, 0)"), "id"
+        ),
+        # 유저 리뷰 / 오늘 작성한 리뷰 / 방문한 빵집
+        Index(
+            "ix_reviews_user_bakery_created_at", "user_id", "bakery_id", "created_at"
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     bakery_id = Column(Integer, nullable=False)
@@ -28,14 +52,18 @@ class Review(Base, DateTimeMixin):
 
 class ReviewPhoto(Base):
     __tablename__ = "review_photos"
+    __table_args__ = (Index("ix_review_photos_review_id", "review_id"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     review_id = Column(Integer, nullable=False)
     img_url = Column(Text, comment="flqb 이미지 경로")
+    thumb_url = Column(Text, nullable=True, comment="리스트용 작은 사이즈 이미지 경로")
+    detail_url = Column(Text, nullable=True, comment="상세용 중간 사이즈 이미지 경로")
 
 
 class ReviewLike(Base):
     __tablename__ = "review_likes"
+    __table_args__ = (Index("ix_review_likes_review_id", "review_id"),)
 
     user_id = Column(
         Integer, primary_key=True, nullable=False, comment="작성한 user_id"
@@ -45,6 +73,7 @@ class ReviewLike(Base):
 
 class ReviewBakeryMenu(Base, DateTimeMixin):
     __tablename__ = "review_bakery_menus"
+    __table_args__ = (Index("ix_review_bakery_menus_review_id", "review_id"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     review_id = Column(Integer, nullable=False, comment="리뷰 ID")
@@ -1,4 +1,14 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, SmallInteger, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    SmallInteger,
+    String,
+    Text,
+)
 
 from app.model.base import Base
 from app.model.datetime_mixin import DateTimeMixin
@@ -14,7 +24,7 @@ class Users(Base, DateTimeMixin):
         comment="로그인 타입(KAKAO : 카카오, EMAIL : 이메일)",
     )
     email = Column(String(64), nullable=False, comment="이메일 주소")
-    password = Column(Text(64), nullable=True, comment="비밀번호")
+    password = Column(Text, nullable=True, comment="비밀번호")
     nickname = Column(String(24), nullable=True, comment="닉네임")
     social_id = Column(String(64), nullable=True, comment="소셜로그인 ID")
     name = Column(String(16), nullable=True, comment="이름")
@@ -58,6 +68,33 @@ class UserBakeryLikes(Base, DateTimeMixin):
     """베이커리 찜 테이블."""
 
     __tablename__ = "user_bakery_likes"
+    __table_args__ = (Index("ix_user_bakery_likes_bakery_id", "bakery_id"),)
 
     user_id = Column(Integer, primary_key=True, comment="유저 ID")
     bakery_id = Column(Integer, primary_key=True, comment="베이커리 ID")
+
+
+class UserBakeryRecommendation(Base, DateTimeMixin):
+    """유저 취향기반 추천 빵집 테이블. (취향 변경시 / 주기적으로 재계산)"""
+
+    __tablename__ = "user_bakery_recommendations"
+    __table_args__ = (
+        Index(
+            "ix_user_bakery_recommendations_user_score",
+            "user_id",
+            "score",
+            "bakery_id",
+        ),
+    )
+
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE", comment="users 테이블 id"),
+        primary_key=True,
+    )
+    bakery_id = Column(Integer, primary_key=True, comment="베이커리 ID")
+    score = Column(
+        Numeric(6, 3),
+        nullable=False,
+        comment="추천 점수 : 일치하는 취향 수 + 평균 별점 / 10",
+    )
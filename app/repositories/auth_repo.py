@@ -2,6 +2,7 @@ import time
 from typing import Optional
 
 import redis
+from sqlalchemy import select
 
 from app.core.auth import get_expiration_time
 from app.model.users import Users
@@ -21,15 +22,16 @@ class AuthRepository:
     ) -> int | None:
         """소셜로그인 유저 정보 기반으로 유저 id값 조회하는 쿼리."""
 
-        user = (
-            self.db.query(Users.id, Users.is_active)
-            .filter(
+        stmt = (
+            select(Users.id, Users.is_active)
+            .where(
                 Users.login_type == login_type,
                 Users.email == email,
                 Users.social_id == social_id,
             )
-            .first()
+            .limit(1)
         )
+        user = (await self.db.execute(stmt)).first()
 
         return user if user else None
 
@@ -38,16 +40,15 @@ class AuthRepository:
 
         user = Users(**{**add_data, "login_type": login_type})
         self.db.add(user)
-        self.db.flush()
-        self.db.refresh(user)
+        await self.db.flush()
+        await self.db.refresh(user)
         return user.id
 
     async def check_completed_onboarding(self, user_id: int) -> bool:
         """온보딩 완료사항여부 반환하는 쿼리."""
 
-        res = (
-            self.db.query(Users.is_preferences_set).filter(Users.id == user_id).first()
-        )
+        stmt = select(Users.is_preferences_set).where(Users.id == user_id)
+        res = (await self.db.execute(stmt)).first()
 
         return res.is_preferences_set if res else False
 
@@ -1,7 +1,7 @@
 from typing import List
 
-from sqlalchemy import and_, asc, desc, null, or_, select
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, asc, desc, null, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.const import (
     BADGE_METRICS,
@@ -15,7 +15,7 @@ from app.schema.badge import AchievedBadge, BadgeItem
 
 
 class BadgeRepository:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
     def __check_achieve_badge_on_review(self, query_result, menu_metrics):
@@ -62,8 +62,8 @@ class BadgeRepository:
     async def get_badges(self, user_id) -> List[BadgeItem]:
         """벳지 데이터를 조회하는 쿼리."""
 
-        res = (
-            self.db.query(
+        stmt = (
+            select(
                 Badge.id,
                 Badge.name,
                 Badge.img_url,
@@ -75,10 +75,10 @@ class BadgeRepository:
                 UserBadge,
                 and_(UserBadge.badge_id == Badge.id, UserBadge.user_id == user_id),
             )
-            .filter(Badge.img_url.isnot(null()))
+            .where(Badge.img_url.isnot(null()))
             .order_by(desc(UserBadge.is_representative).nulls_last(), asc(Badge.id))
-            .all()
         )
+        res = (await self.db.execute(stmt)).all()
 
         return [
             BadgeItem(
@@ -106,16 +106,19 @@ class BadgeRepository:
     async def update_metrics_on_review(self, user_id: int, update_metrics):
         """리뷰했을 때, metric 업데이트 하는 쿼리."""
 
-        self.db.query(UserMetrics).filter(UserMetrics.user_id == user_id).update(
-            update_metrics,
-            synchronize_session=False,
+        stmt = (
+            update(UserMetrics)
+            .where(UserMetrics.user_id == user_id)
+            .values(update_metrics)
+            .execution_options(synchronize_session=False)
         )
+        await self.db.execute(stmt)
 
     async def check_achieve_badges(self, user_id: int, select_columns, menu_metrics):
         """뱃지 받을 거 있는 지 체크"""
 
         stmt = select(*select_columns).where(UserMetrics.user_id == user_id)
-        metrics = self.db.execute(stmt).mappings().first()
+        metrics = (await self.db.execute(stmt)).mappings().first()
 
         checked = self.__check_achieve_badge_on_review(
             query_result=metrics, menu_metrics=menu_metrics
@@ -123,17 +126,17 @@ class BadgeRepository:
 
         if checked:
 
-            res = (
-                self.db.query(
+            stmt = (
+                select(
                     Badge.name,
                     Badge.description,
                     Badge.img_url,
                     BadgeCondition.badge_id,
                 )
                 .join(BadgeCondition, BadgeCondition.badge_id == Badge.id)
-                .filter(or_(*checked))
-                .all()
+                .where(or_(*checked))
             )
+            res = (await self.db.execute(stmt)).all()
 
             return [
                 AchievedBadge(
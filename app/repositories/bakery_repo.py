@@ -1,23 +1,56 @@
-from datetime import datetime
-from typing import List
-
-from sqlalchemy import and_, asc, delete, desc, func, select
-from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.orm import aliased
-from sqlalchemy.orm.session import Session
-
-from app.core.const import ETC_MENU_NAME
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import (
+    JSON,
+    Numeric,
+    Text,
+    and_,
+    asc,
+    cast,
+    delete,
+    desc,
+    exists,
+    func,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    type_coerce,
+    union,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.const import (
+    ETC_MENU_NAME,
+    MAX_BIND_PARAMS,
+    POPULARITY_LIKE_WEIGHT,
+    POPULARITY_RATING_WEIGHT,
+    POPULARITY_REVIEW_WEIGHT,
+    POPULARITY_REVIEW_WINDOW_DAYS,
+    RECENT_VIEW_LIMIT,
+)
+from app.core.exception import InvalidSortParameterException
+from app.core.schedule import operating_schedule
 from app.model.bakery import (
     Bakery,
+    BakeryCard,
     BakeryMenu,
     BakeryPhoto,
+    BakeryPopularity,
     BakeryPreference,
     MenuPhoto,
     OperatingHour,
     RecentBakeryView,
 )
 from app.model.review import Review
-from app.model.users import UserBakeryLikes, UserPreferences
+from app.model.users import (
+    UserBakeryLikes,
+    UserBakeryRecommendation,
+    UserPreferences,
+)
 from app.schema.bakery import (
     BakeryDetail,
     BakeryDetailResponseDTO,
@@ -28,83 +61,140 @@ from app.schema.bakery import (
     RecommendBakery,
     SimpleBakeryMenu,
 )
-from app.utils.converter import operating_hours_to_open_status
-from app.utils.pagination import (
-    build_multi_cursor_filter,
-    build_multi_next_cursor,
-    build_multi_next_cursor_real,
-    build_order_by,
+from app.utils.converter import to_chunks, to_signature_menus
+from app.utils.pagination import SortSpec, pick_sort
+
+# (더보기) 취향 추천 빵집 : 추천 점수 순
+PREFERENCE_SORT = SortSpec(
+    name="preference",
+    column=UserBakeryRecommendation.score,
+    pk_column=UserBakeryRecommendation.bakery_id,
+    index="ix_user_bakery_recommendations_user_score",
+)
+# (더보기) hot한 빵집 : 인기 점수 순
+HOT_BAKERY_SORT = SortSpec(
+    name="hot",
+    column=BakeryPopularity.score,
+    pk_column=BakeryPopularity.bakery_id,
+    index="ix_bakery_popularity_area_score",
 )
-from app.utils.parser import parse_cursor_value
+# 전체 지역(14)은 지역 조건이 없어서 (score, bakery_id) 인덱스를 역순으로 탄다
+HOT_BAKERY_ALL_AREA_SORT = replace(HOT_BAKERY_SORT, index="ix_bakery_popularity_score")
+# 찜한 빵집 : 찜한 날짜 / 리뷰 개수 / 평균 별점 / 이름 순
+LIKED_BAKERY_SORTS = {
+    "created_at": SortSpec(
+        name="liked:created_at",
+        column=UserBakeryLikes.created_at,
+        pk_column=UserBakeryLikes.bakery_id,
+    ),
+    "review_count": SortSpec(
+        name="liked:review_count",
+        column=BakeryCard.review_count,
+        pk_column=BakeryCard.bakery_id,
+        nulls_as=0,
+    ),
+    "avg_rating": SortSpec(
+        name="liked:avg_rating",
+        column=BakeryCard.avg_rating,
+        pk_column=BakeryCard.bakery_id,
+        nulls_as=0,
+    ),
+    "name": SortSpec(
+        name="liked:name", column=BakeryCard.name, pk_column=BakeryCard.bakery_id
+    ),
+}
+
+
+def _area_ids(area_codes: list[str]) -> List[int]:
+    """지역코드 문자열을 commercial_area_id (정수 컬럼) 비교용으로 변환하는 메소드."""
+
+    return [int(code) for code in area_codes]
+
+
+def _signature_img_url(bakery_id):
+    """카드에 보여줄 대표 사진 1장 서브쿼리. (작은 사이즈 우선)"""
+
+    return (
+        select(func.coalesce(BakeryPhoto.thumb_url, BakeryPhoto.img_url))
+        .where(
+            BakeryPhoto.bakery_id == bakery_id,
+            BakeryPhoto.is_signature.is_(True),
+        )
+        .order_by(BakeryPhoto.id)
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+def _signature_menus(bakery_id):
+    """카드에 보여줄 대표 메뉴 이름 목록 서브쿼리. (없으면 빈 배열)"""
+
+    return (
+        select(
+            func.coalesce(
+                # 카드 컬럼(text[])과 비교할 수 있도록 text 로 모으기
+                func.array_agg(
+                    aggregate_order_by(cast(BakeryMenu.name, Text), BakeryMenu.id)
+                ),
+                literal_column("'{}'::text[]"),
+            )
+        )
+        .where(
+            BakeryMenu.bakery_id == bakery_id,
+            BakeryMenu.is_signature.is_(True),
+        )
+        .scalar_subquery()
+    )
 
 
 class BakeryRepository:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
     async def get_bakeries_by_preference(
         self,
         area_codes: list[str],
         user_id: int,
-        target_day_of_week: int,
+        now: datetime,
         page_size: int = 20,
     ) -> List[RecommendBakery]:
-        """(홈) 유저의 취향이 반영된 빵집 조회하는 쿼리."""
+        """(홈) 유저의 취향이 반영된 빵집 조회하는 쿼리. (미리 계산된 추천 순)"""
 
+        # 홈에서는 대표 사진 있는 빵집만 노출
         conditions = [
-            UserPreferences.user_id == user_id,
-            BakeryPhoto.is_signature == True,
+            UserBakeryRecommendation.user_id == user_id,
+            BakeryCard.signature_img_url.isnot(None),
         ]
 
         if area_codes != ["14"]:
-            conditions.append(Bakery.commercial_area_id.in_(area_codes))
+            conditions.append(BakeryCard.commercial_area_id.in_(_area_ids(area_codes)))
 
         stmt = (
             select(
-                Bakery.id,
-                Bakery.name,
-                Bakery.avg_rating,
-                Bakery.commercial_area_id,
-                Bakery.review_count,
-                OperatingHour.is_opened,
-                OperatingHour.close_time,
-                OperatingHour.open_time,
-                BakeryPhoto.img_url,
-            )
-            .distinct(Bakery.id)
-            .select_from(UserPreferences)
-            .join(
-                BakeryPreference,
-                BakeryPreference.preference_id == UserPreferences.preference_id,
-            )
-            .join(Bakery, Bakery.id == BakeryPreference.bakery_id)
-            .join(
-                OperatingHour,
-                and_(
-                    OperatingHour.bakery_id == Bakery.id,
-                    OperatingHour.day_of_week == target_day_of_week,
-                ),
+                BakeryCard.bakery_id.label("id"),
+                BakeryCard.name,
+                BakeryCard.avg_rating,
+                BakeryCard.commercial_area_id,
+                BakeryCard.review_count,
+                BakeryCard.signature_img_url,
             )
+            .select_from(UserBakeryRecommendation)
             .join(
-                BakeryPhoto,
-                and_(
-                    BakeryPhoto.bakery_id == Bakery.id,
-                    BakeryPhoto.is_signature.is_(True),
-                ),
-            )
-            .join(
-                UserBakeryLikes,
-                and_(
-                    UserBakeryLikes.bakery_id == Bakery.id,
-                    UserBakeryLikes.user_id == user_id,
-                ),
-                isouter=True,
+                BakeryCard, BakeryCard.bakery_id == UserBakeryRecommendation.bakery_id
             )
             .where(and_(*conditions))
+            .order_by(
+                desc(UserBakeryRecommendation.score),
+                desc(UserBakeryRecommendation.bakery_id),
+            )
             .limit(page_size)
         )
 
-        res = self.db.execute(stmt).mappings().all()
+        res = (await self.db.execute(stmt)).mappings().all()
+        open_statuses = await operating_schedule.get_open_statuses(
+            self.db, [r.id for r in res], now
+        )
+
         return [
             RecommendBakery(
                 bakery_id=r.id,
@@ -112,12 +202,8 @@ class BakeryRepository:
                 bakery_name=r.name,
                 avg_rating=r.avg_rating,
                 review_count=r.review_count,
-                open_status=operating_hours_to_open_status(
-                    is_opened=r.is_opened,
-                    close_time=r.close_time,
-                    open_time=r.open_time,
-                ),
-                img_url=r.img_url,
+                open_status=open_statuses[r.id],
+                img_url=r.signature_img_url,
             )
             for r in res
         ]
@@ -128,78 +214,47 @@ class BakeryRepository:
         page_size: int,
         area_codes: list[str],
         user_id: int,
-        target_day_of_week: int,
+        now: datetime,
     ):
-        """(더보기) 유저의 취향이 반영된 빵집 조회하는 쿼리"""
+        """(더보기) 유저의 취향이 반영된 빵집 조회하는 쿼리. (미리 계산된 추천 순)"""
 
-        filters = [
-            UserPreferences.user_id == user_id,
-            BakeryPhoto.is_signature == True,
-        ]
+        filters = [UserBakeryRecommendation.user_id == user_id]
 
         # 지역코드에 따른 where절 변경
         if area_codes != ["14"]:
-            filters.append(Bakery.commercial_area_id.in_(area_codes))
+            filters.append(BakeryCard.commercial_area_id.in_(_area_ids(area_codes)))
 
-        # cusor_value 페이징
-        if cursor_value == "0":
-            filters.append(Bakery.id > cursor_value)
-        else:
-            filters.append(Bakery.id <= cursor_value)
+        # cursor_value 페이징 (추천 점수 순)
+        filters.extend(PREFERENCE_SORT.where(cursor_value))
 
         stmt = (
             select(
-                Bakery.id,
-                Bakery.name,
-                Bakery.gu,
-                Bakery.dong,
-                Bakery.avg_rating,
-                Bakery.review_count,
-                Bakery.commercial_area_id,
-                OperatingHour.is_opened,
-                OperatingHour.close_time,
-                OperatingHour.open_time,
-                BakeryPhoto.img_url,
-            )
-            .distinct(Bakery.id)
-            .select_from(UserPreferences)
-            .join(
-                BakeryPreference,
-                BakeryPreference.preference_id == UserPreferences.preference_id,
-            )
-            .join(Bakery, Bakery.id == BakeryPreference.bakery_id)
-            .join(
-                OperatingHour,
-                and_(
-                    OperatingHour.bakery_id == Bakery.id,
-                    OperatingHour.day_of_week == target_day_of_week,
-                ),
+                BakeryCard.bakery_id.label("id"),
+                BakeryCard.name,
+                BakeryCard.gu,
+                BakeryCard.dong,
+                BakeryCard.avg_rating,
+                BakeryCard.review_count,
+                BakeryCard.commercial_area_id,
+                BakeryCard.signature_img_url,
+                BakeryCard.signature_menus,
+                UserBakeryRecommendation.score,
             )
+            .select_from(UserBakeryRecommendation)
             .join(
-                BakeryPhoto,
-                and_(
-                    BakeryPhoto.bakery_id == Bakery.id,
-                    BakeryPhoto.is_signature.is_(True),
-                ),
-                isouter=True,
-            )
-            .join(
-                UserBakeryLikes,
-                and_(
-                    UserBakeryLikes.bakery_id == Bakery.id,
-                    UserBakeryLikes.user_id == user_id,
-                ),
-                isouter=True,
+                BakeryCard, BakeryCard.bakery_id == UserBakeryRecommendation.bakery_id
             )
             .where(and_(*filters))
-            .order_by(desc(Bakery.id))
+            .order_by(*PREFERENCE_SORT.order_by())
             .limit(page_size + 1)
         )
 
-        res = self.db.execute(stmt).mappings().all()
+        res = (await self.db.execute(stmt)).mappings().all()
+        next_cursor = PREFERENCE_SORT.next_cursor(res, page_size)
 
-        has_next = len(res) > page_size
-        next_cursor = str(res[-1].id) if has_next else None
+        open_statuses = await operating_schedule.get_open_statuses(
+            self.db, [r.id for r in res[:page_size]], now
+        )
 
         return next_cursor, [
             LoadMoreBakery(
@@ -208,77 +263,108 @@ class BakeryRepository:
                 commercial_area_id=r.commercial_area_id,
                 avg_rating=r.avg_rating,
                 review_count=r.review_count,
-                open_status=operating_hours_to_open_status(
-                    is_opened=r.is_opened,
-                    close_time=r.close_time,
-                    open_time=r.open_time,
-                ),
-                img_url=r.img_url,
+                open_status=open_statuses[r.id],
+                img_url=r.signature_img_url,
                 gu=r.gu,
                 dong=r.dong,
+                signature_menus=to_signature_menus(r.signature_menus),
             )
             for r in res[:page_size]
         ]
 
-    async def get_signature_menus(self, bakery_ids: list[int]):
-        """베이커리 내 대표메뉴 조회하는 쿼리."""
+    async def refresh_user_recommendations(
+        self, user_ids: List[int], per_area_limit: int
+    ):
+        """유저 취향기반 추천 빵집 재계산하는 쿼리.
 
-        menus = (
-            self.db.query(BakeryMenu.bakery_id, BakeryMenu.name)
-            .filter(
-                BakeryMenu.is_signature == True,
-                BakeryMenu.bakery_id.in_(bakery_ids),
+        추천 점수 : 일치하는 취향 수 + 평균 별점 / 10 (상권별 상위 per_area_limit개만 보관)
+        """
+
+        if not user_ids:
+            return
+
+        matched = (
+            select(
+                UserPreferences.user_id,
+                BakeryPreference.bakery_id,
+                func.count().label("matched"),
+            )
+            .join(
+                BakeryPreference,
+                BakeryPreference.preference_id == UserPreferences.preference_id,
+            )
+            .where(UserPreferences.user_id.in_(user_ids))
+            .group_by(UserPreferences.user_id, BakeryPreference.bakery_id)
+            .subquery()
+        )
+        score = func.round(
+            cast(matched.c.matched + func.coalesce(Bakery.avg_rating, 0) / 10, Numeric),
+            3,
+        )
+        ranked = (
+            select(
+                matched.c.user_id,
+                matched.c.bakery_id,
+                score.label("score"),
+                func.row_number()
+                .over(
+                    partition_by=(matched.c.user_id, Bakery.commercial_area_id),
+                    order_by=(desc(score), desc(Bakery.id)),
+                )
+                .label("rank"),
             )
-            .all()
+            .select_from(matched)
+            .join(Bakery, Bakery.id == matched.c.bakery_id)
+            .subquery()
         )
 
-        return [{"bakery_id": m.bakery_id, "menu_name": m.name} for m in menus]
+        await self.db.execute(
+            delete(UserBakeryRecommendation).where(
+                UserBakeryRecommendation.user_id.in_(user_ids)
+            )
+        )
+        await self.db.execute(
+            insert(UserBakeryRecommendation).from_select(
+                ["user_id", "bakery_id", "score"],
+                select(ranked.c.user_id, ranked.c.bakery_id, ranked.c.score).where(
+                    ranked.c.rank <= per_area_limit
+                ),
+            )
+        )
 
     async def get_bakery_by_area(
-        self, area_codes: list[str], target_day_of_week: int, user_id: int
+        self, area_codes: list[str], now: datetime, user_id: int
     ):
-        """지역코드로 베이터리 조회하는 쿼리."""
-
-        b = aliased(Bakery)
+        """지역코드로 hot한 베이커리 조회하는 쿼리. (인기 점수 순)"""
 
-        conditions = [
-            OperatingHour.day_of_week == target_day_of_week,
-            BakeryPhoto.is_signature == True,
-        ]
+        # 대표 사진 있는 빵집만 노출
+        conditions = [BakeryCard.signature_img_url.isnot(None)]
         if area_codes != ["14"]:
-            conditions.append(b.commercial_area_id.in_(area_codes))
+            conditions.append(
+                BakeryPopularity.commercial_area_id.in_(_area_ids(area_codes))
+            )
 
         stmt = (
             select(
-                b.id.label("bakery_id"),
-                b.id,
-                b.name,
-                b.avg_rating,
-                b.commercial_area_id,
-                b.review_count,
-                OperatingHour.is_opened,
-                OperatingHour.close_time,
-                OperatingHour.open_time,
-                BakeryPhoto.img_url,
-            )
-            .distinct(b.id)
-            .select_from(b)
-            .join(OperatingHour, OperatingHour.bakery_id == b.id)
-            .join(BakeryPhoto, BakeryPhoto.bakery_id == b.id)
-            .join(
-                UserBakeryLikes,
-                and_(
-                    UserBakeryLikes.bakery_id == b.id,
-                    UserBakeryLikes.user_id == user_id,
-                ),
-                isouter=True,
+                BakeryCard.bakery_id.label("id"),
+                BakeryCard.name,
+                BakeryCard.avg_rating,
+                BakeryCard.commercial_area_id,
+                BakeryCard.review_count,
+                BakeryCard.signature_img_url,
             )
-            .where(and_(*conditions))
-            .order_by(b.id, b.avg_rating.desc())
+            .select_from(BakeryPopularity)
+            .join(BakeryCard, BakeryCard.bakery_id == BakeryPopularity.bakery_id)
+            .where(*conditions)
+            .order_by(desc(BakeryPopularity.score), desc(BakeryPopularity.bakery_id))
             .limit(20)
         )
 
-        res = self.db.execute(stmt).mappings().all()
+        res = (await self.db.execute(stmt)).mappings().all()
+
+        open_statuses = await operating_schedule.get_open_statuses(
+            self.db, [r.id for r in res], now
+        )
 
         return [
             RecommendBakery(
@@ -287,12 +373,8 @@ class BakeryRepository:
                 commercial_area_id=r.commercial_area_id,
                 avg_rating=r.avg_rating,
                 review_count=r.review_count,
-                open_status=operating_hours_to_open_status(
-                    is_opened=r.is_opened,
-                    close_time=r.close_time,
-                    open_time=r.open_time,
-                ),
-                img_url=r.img_url,
+                open_status=open_statuses[r.id],
+                img_url=r.signature_img_url,
             )
             for r in res
         ]
@@ -301,70 +383,51 @@ class BakeryRepository:
         self,
         area_codes: list[str],
         user_id: int,
-        target_day_of_week: int,
+        now: datetime,
         cursor_value: str,
         page_size: int,
     ):
-        """(더보기) hot한 빵집 조회하는 쿼리"""
+        """(더보기) hot한 빵집 조회하는 쿼리. (인기 점수 순)"""
 
-        # where clause
-        filters = [BakeryPhoto.is_signature == True]
+        # where clause (대표 사진 있는 빵집만 노출)
+        filters = [BakeryCard.signature_img_url.isnot(None)]
 
+        sort = HOT_BAKERY_ALL_AREA_SORT
         if area_codes != ["14"]:
-            filters.append(Bakery.commercial_area_id.in_(area_codes))
+            filters.append(
+                BakeryPopularity.commercial_area_id.in_(_area_ids(area_codes))
+            )
+            sort = HOT_BAKERY_SORT
 
-        # cusor_value 페이징
-        if cursor_value == "0":
-            filters.append(Bakery.id > cursor_value)
-        else:
-            filters.append(Bakery.id <= cursor_value)
+        # cursor_value 페이징 (인기 점수 순)
+        filters.extend(sort.where(cursor_value))
 
         stmt = (
             select(
-                Bakery.id,
-                Bakery.name,
-                Bakery.gu,
-                Bakery.dong,
-                Bakery.commercial_area_id,
-                Bakery.avg_rating,
-                Bakery.review_count,
-                OperatingHour.is_opened,
-                OperatingHour.close_time,
-                OperatingHour.open_time,
-                BakeryPhoto.img_url,
-            )
-            .distinct(Bakery.id)
-            .select_from(Bakery)
-            .join(
-                OperatingHour,
-                and_(
-                    OperatingHour.bakery_id == Bakery.id,
-                    OperatingHour.day_of_week == target_day_of_week,
-                ),
-            )
-            .join(
-                BakeryPhoto,
-                and_(
-                    BakeryPhoto.bakery_id == Bakery.id,
-                    BakeryPhoto.is_signature.is_(True),
-                ),
-            )
-            .join(
-                UserBakeryLikes,
-                and_(
-                    UserBakeryLikes.bakery_id == Bakery.id,
-                    UserBakeryLikes.user_id == user_id,
-                ),
-                isouter=True,
+                BakeryCard.bakery_id.label("id"),
+                BakeryCard.name,
+                BakeryCard.gu,
+                BakeryCard.dong,
+                BakeryCard.commercial_area_id,
+                BakeryCard.avg_rating,
+                BakeryCard.review_count,
+                BakeryCard.signature_img_url,
+                BakeryCard.signature_menus,
+                BakeryPopularity.score,
             )
-            .where(and_(*filters))
-            .order_by(desc(Bakery.id), desc(Bakery.avg_rating))
+            .select_from(BakeryPopularity)
+            .join(BakeryCard, BakeryCard.bakery_id == BakeryPopularity.bakery_id)
+            .where(*filters)
+            .order_by(*sort.order_by())
             .limit(page_size + 1)
         )
 
-        res = self.db.execute(stmt).mappings().all()
-        has_next = len(res) > page_size
-        next_cursor = str(res[-1].id) if has_next else None
+        res = (await self.db.execute(stmt)).mappings().all()
+        next_cursor = sort.next_cursor(res, page_size)
+
+        open_statuses = await operating_schedule.get_open_statuses(
+            self.db, [r.id for r in res[:page_size]], now
+        )
 
         return next_cursor, [
             LoadMoreBakery(
@@ -373,163 +436,292 @@ class BakeryRepository:
                 bakery_name=r.name,
                 avg_rating=r.avg_rating,
                 review_count=r.review_count,
-                open_status=operating_hours_to_open_status(
-                    is_opened=r.is_opened,
-                    close_time=r.close_time,
-                    open_time=r.open_time,
-                ),
-                img_url=r.img_url,
+                open_status=open_statuses[r.id],
+                img_url=r.signature_img_url,
                 gu=r.gu,
                 dong=r.dong,
+                signature_menus=to_signature_menus(r.signature_menus),
             )
             for r in res[:page_size]
         ]
 
-    async def get_bakery_detail(self, bakery_id: int, target_day_of_week: int):
-        """베이커리 상세정보 조회하는 쿼리."""
-
-        res = (
-            self.db.query(
-                Bakery.id,
-                Bakery.name,
-                Bakery.address,
-                Bakery.phone,
-                Bakery.lat,
-                Bakery.lng,
-                OperatingHour.is_opened,
-                OperatingHour.close_time,
-                OperatingHour.open_time,
-                UserBakeryLikes.bakery_id.label("is_like"),
-            )
-            .select_from(Bakery)
-            .join(
-                OperatingHour,
-                and_(
-                    OperatingHour.bakery_id == Bakery.id,
-                    OperatingHour.day_of_week == target_day_of_week,
-                ),
-                isouter=True,
-            )
-            .join(
-                UserBakeryLikes,
-                and_(UserBakeryLikes.bakery_id == Bakery.id),
-                isouter=True,
-            )
-            .filter(Bakery.id == bakery_id)
-            .first()
+    async def get_popularity_changed_bakery_ids(
+        self, since: datetime, now: datetime
+    ) -> List[int]:
+        """since 이후 인기 점수가 바뀌었을 수 있는 베이커리 id 조회하는 쿼리."""
+
+        window = timedelta(days=POPULARITY_REVIEW_WINDOW_DAYS)
+
+        stmt = union(
+            # 새로 작성된 리뷰 (평균 별점 포함)
+            select(Review.bakery_id).where(Review.created_at > since),
+            # 최근 리뷰 집계 기간에서 빠진 리뷰
+            select(Review.bakery_id).where(
+                Review.created_at > since - window, Review.created_at <= now - window
+            ),
+            # 새로 찜한 베이커리 (redis 표시가 유실된 경우 대비)
+            select(UserBakeryLikes.bakery_id).where(UserBakeryLikes.created_at > since),
+            select(Bakery.id).where(Bakery.updated_at > since),
         )
+        return list((await self.db.execute(stmt)).scalars().all())
 
-        if res:
-            return BakeryDetailResponseDTO(
-                bakery_id=res.id,
-                bakery_name=res.name,
-                mapy=res.lat,
-                mapx=res.lng,
-                address=res.address,
-                phone=res.phone,
-                open_status=operating_hours_to_open_status(
-                    is_opened=res.is_opened,
-                    close_time=res.close_time,
-                    open_time=res.open_time,
-                ),
-                is_like=True if res.is_like else False,
+    async def refresh_bakery_popularity(
+        self, now: datetime, bakery_ids: Optional[List[int]] = None
+    ):
+        """베이커리 인기 점수 재계산하는 쿼리. (bakery_ids 없으면 전체)"""
+
+        recent_reviews = select(
+            Review.bakery_id, func.count().label("review_count")
+        ).where(Review.created_at > now - timedelta(days=POPULARITY_REVIEW_WINDOW_DAYS))
+        likes = select(UserBakeryLikes.bakery_id, func.count().label("like_count"))
+        bakeries = select(Bakery.id, Bakery.commercial_area_id, Bakery.avg_rating)
+
+        if bakery_ids is not None:
+            if not bakery_ids:
+                return
+            recent_reviews = recent_reviews.where(Review.bakery_id.in_(bakery_ids))
+            likes = likes.where(UserBakeryLikes.bakery_id.in_(bakery_ids))
+            bakeries = bakeries.where(Bakery.id.in_(bakery_ids))
+
+        recent_reviews = recent_reviews.group_by(Review.bakery_id).subquery()
+        likes = likes.group_by(UserBakeryLikes.bakery_id).subquery()
+        bakeries = bakeries.subquery()
+
+        review_count = func.coalesce(recent_reviews.c.review_count, 0)
+        like_count = func.coalesce(likes.c.like_count, 0)
+        score = func.round(
+            cast(
+                review_count * POPULARITY_REVIEW_WEIGHT
+                + like_count * POPULARITY_LIKE_WEIGHT
+                + func.coalesce(bakeries.c.avg_rating, 0) * POPULARITY_RATING_WEIGHT,
+                Numeric,
+            ),
+            3,
+        )
+
+        stmt = insert(BakeryPopularity).from_select(
+            [
+                "bakery_id",
+                "commercial_area_id",
+                "recent_review_count",
+                "like_count",
+                "score",
+            ],
+            select(
+                bakeries.c.id,
+                bakeries.c.commercial_area_id,
+                review_count,
+                like_count,
+                score,
             )
+            .select_from(bakeries)
+            .outerjoin(recent_reviews, recent_reviews.c.bakery_id == bakeries.c.id)
+            .outerjoin(likes, likes.c.bakery_id == bakeries.c.id),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[BakeryPopularity.bakery_id],
+            set_={
+                "commercial_area_id": stmt.excluded.commercial_area_id,
+                "recent_review_count": stmt.excluded.recent_review_count,
+                "like_count": stmt.excluded.like_count,
+                "score": stmt.excluded.score,
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
+
+    async def get_card_changed_bakery_ids(self, since: datetime) -> List[int]:
+        """since 이후 빵집/메뉴/사진 정보가 바뀐 베이커리 id 조회하는 쿼리.
+
+        삭제는 updated_at 으로 알 수 없으므로 대표 사진/메뉴가 카드와 다르거나
+        빵집이 없어진 카드도 함께 조회한다.
+        (대표 사진/메뉴가 추가되는 경우는 updated_at 으로 찾을 수 있어서
+        대표 사진/메뉴가 있는 카드만 비교한다)
+        """
+
+        card = BakeryCard
+        stmt = union(
+            select(Bakery.id.label("bakery_id")).where(Bakery.updated_at > since),
+            select(BakeryMenu.bakery_id).where(BakeryMenu.updated_at > since),
+            select(BakeryPhoto.bakery_id).where(BakeryPhoto.updated_at > since),
+            select(card.bakery_id).where(
+                or_(
+                    card.signature_img_url.isnot(None),
+                    func.cardinality(card.signature_menus) > 0,
+                ),
+                or_(
+                    card.signature_img_url.is_distinct_from(
+                        _signature_img_url(card.bakery_id)
+                    ),
+                    card.signature_menus != _signature_menus(card.bakery_id),
+                ),
+            ),
+            select(card.bakery_id)
+            .outerjoin(Bakery, Bakery.id == card.bakery_id)
+            .where(Bakery.id.is_(None)),
+        )
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def refresh_bakery_cards(self, bakery_ids: Optional[List[int]] = None):
+        """베이커리 카드 projection 생성/갱신하는 쿼리. (bakery_ids 없으면 전체)"""
+
+        cards = select(
+            Bakery.id,
+            Bakery.name,
+            Bakery.gu,
+            Bakery.dong,
+            Bakery.commercial_area_id,
+            Bakery.avg_rating,
+            Bakery.review_count,
+            func.coalesce(Bakery.thumbnail_small, Bakery.thumbnail),
+            _signature_img_url(Bakery.id),
+            _signature_menus(Bakery.id),
+        )
+        # 없어진 빵집의 카드 삭제
+        removed = delete(BakeryCard).where(
+            ~exists().where(Bakery.id == BakeryCard.bakery_id)
+        )
+        if bakery_ids is not None:
+            if not bakery_ids:
+                return
+            cards = cards.where(Bakery.id.in_(bakery_ids))
+            removed = removed.where(BakeryCard.bakery_id.in_(bakery_ids))
+
+        await self.db.execute(removed)
+
+        columns = [
+            "bakery_id",
+            "name",
+            "gu",
+            "dong",
+            "commercial_area_id",
+            "avg_rating",
+            "review_count",
+            "thumbnail",
+            "signature_img_url",
+            "signature_menus",
+        ]
+        stmt = insert(BakeryCard).from_select(columns, cards)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[BakeryCard.bakery_id],
+            set_={
+                **{c: stmt.excluded[c] for c in columns[1:]},
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
 
-    async def get_bakery_menu_detail(self, bakery_id: int) -> List[BakeryDetail]:
-        """베이커리 메뉴 정보 조회하는 쿼리"""
+    async def get_bakery_detail(self, bakery_id: int, now: datetime):
+        """베이커리 상세정보(메뉴/사진/영업시간 포함) 한 번에 조회하는 쿼리.
 
-        stmt = (
-            self.db.query(
-                BakeryMenu.name,
-                BakeryMenu.price,
-                BakeryMenu.is_signature,
-                MenuPhoto.img_url,
+        메뉴/사진/영업시간은 json_agg 서브쿼리로 묶어서 DB 왕복 한 번으로 끝낸다.
+        유저별 데이터(찜여부)는 포함하지 않으므로 캐싱해도 된다.
+        """
+
+        menus = (
+            select(
+                func.json_agg(
+                    func.json_build_object(
+                        "menu_name",
+                        BakeryMenu.name,
+                        "price",
+                        BakeryMenu.price,
+                        "is_signature",
+                        BakeryMenu.is_signature,
+                        "img_url",
+                        MenuPhoto.img_url,
+                    )
+                )
             )
             .select_from(BakeryMenu)
             .outerjoin(MenuPhoto, MenuPhoto.menu_id == BakeryMenu.id)
-            .filter(BakeryMenu.bakery_id == bakery_id)
+            .where(BakeryMenu.bakery_id == Bakery.id)
+            .scalar_subquery()
         )
 
-        res = self.db.execute(stmt).mappings().all()
+        photo_url = func.coalesce(BakeryPhoto.detail_url, BakeryPhoto.img_url)
+        photos = (
+            select(func.json_agg(photo_url))
+            .where(BakeryPhoto.bakery_id == Bakery.id, photo_url.isnot(None))
+            .scalar_subquery()
+        )
 
-        return [
-            BakeryDetail(
-                menu_name=r.name,
-                price=r.price,
-                is_signature=r.is_signature,
-                img_url=r.img_url,
+        operating_hours = (
+            select(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_object(
+                            "day_of_week",
+                            OperatingHour.day_of_week,
+                            "open_time",
+                            func.to_char(OperatingHour.open_time, "HH24:MI"),
+                            "close_time",
+                            func.to_char(OperatingHour.close_time, "HH24:MI"),
+                            "is_opened",
+                            OperatingHour.is_opened,
+                        ),
+                        OperatingHour.day_of_week,
+                    )
+                )
             )
-            for r in res
-        ]
-
-    async def get_bakery_photos(self, bakery_id: int) -> List[str]:
-        """베이커리 썸네일 조회하는 메소드."""
-
-        res = (
-            self.db.query(BakeryPhoto.img_url)
-            .filter(BakeryPhoto.bakery_id == bakery_id)
-            .all()
+            .where(OperatingHour.bakery_id == Bakery.id)
+            .scalar_subquery()
         )
 
-        return [r.img_url for r in res if r.img_url] if res else []
+        stmt = select(
+            Bakery.id,
+            Bakery.name,
+            Bakery.address,
+            Bakery.phone,
+            Bakery.lat,
+            Bakery.lng,
+            type_coerce(menus, JSON).label("menus"),
+            type_coerce(photos, JSON).label("photos"),
+            type_coerce(operating_hours, JSON).label("operating_hours"),
+        ).where(Bakery.id == bakery_id)
 
-    async def insert_recent_viewed_bakeries(self, user_id: int, bakery_id: int):
-        """최근 조회한 베이커리 테이블에 적재하는 쿼리."""
+        res = (await self.db.execute(stmt)).first()
 
-        stmt = (
-            insert(RecentBakeryView)
-            .values(
-                user_id=user_id,
-                bakery_id=bakery_id,
+        if res:
+            open_statuses = await operating_schedule.get_open_statuses(
+                self.db, [res.id], now
+            )
+            return BakeryDetailResponseDTO(
+                bakery_id=res.id,
+                bakery_name=res.name,
+                mapy=res.lat,
+                mapx=res.lng,
+                address=res.address,
+                phone=res.phone,
+                open_status=open_statuses[res.id],
+                operating_hours=[
+                    BakeryOperatingHour(**h) for h in res.operating_hours or []
+                ],
+                bakery_img_urls=res.photos or [],
+                menus=[BakeryDetail(**m) for m in res.menus or []],
             )
-            .on_conflict_do_nothing(index_elements=["user_id", "bakery_id"])
-        )
-
-        self.db.execute(stmt)
 
-    async def get_bakery_operating_hours(self, bakery_id: int):
-        """베이커리 전체 영업시간 가져오는 쿼리."""
+    async def check_like_bakery(self, user_id: int, bakery_id: int) -> bool:
+        """베이커리 찜여부 조회하는 쿼리."""
 
-        res = (
-            self.db.query(
-                OperatingHour.day_of_week,
-                OperatingHour.open_time,
-                OperatingHour.close_time,
-                OperatingHour.is_opened,
+        stmt = select(
+            exists().where(
+                UserBakeryLikes.bakery_id == bakery_id,
+                UserBakeryLikes.user_id == user_id,
             )
-            .filter(OperatingHour.bakery_id == bakery_id)
-            .all()
-        )
-
-        return (
-            [
-                BakeryOperatingHour(
-                    day_of_week=r.day_of_week,
-                    open_time=(r.open_time).strftime("%H:%M") if r.open_time else None,
-                    close_time=(
-                        (r.close_time).strftime("%H:%M") if r.close_time else None
-                    ),
-                    is_opened=r.is_opened,
-                )
-                for r in res
-            ]
-            if res
-            else []
         )
+        return (await self.db.execute(stmt)).scalar()
 
     async def get_bakery_menus(self, bakery_id):
         """베이커리 메뉴 조회하는 쿼리."""
 
-        res = (
-            self.db.query(
-                BakeryMenu.id,
-                BakeryMenu.name,
-                BakeryMenu.is_signature,
-                BakeryMenu.bread_type_id,
-            )
-            .filter(BakeryMenu.bakery_id == bakery_id)
-            .all()
-        )
+        stmt = select(
+            BakeryMenu.id,
+            BakeryMenu.name,
+            BakeryMenu.is_signature,
+            BakeryMenu.bread_type_id,
+        ).where(BakeryMenu.bakery_id == bakery_id)
+        res = (await self.db.execute(stmt)).all()
 
         menus = [
             SimpleBakeryMenu(
@@ -559,86 +751,84 @@ class BakeryRepository:
         user_id: int,
         sort_by: str,  # "created_at" | "review_count" | "avg_rating" | "name"
         direction: str,
-        target_day_of_week: int,
+        now: datetime,
         cursor_value: str,
         page_size: int,
     ):
         """방문한 빵집 (내가 리뷰 쓴 빵집 ) 조회하는 쿼리."""
 
-        # 실제 정렬에 들어갈 컬럼 Review.like_count
-        if sort_by == "created_at":
-            sort_column = getattr(Review, sort_by)
-        else:
-            sort_column = getattr(Bakery, sort_by)
-
-        # 보조 정렬을 위하나 고유성 가지고 잇는 컬럼 Review.id
-        sort_pk_column = getattr(Bakery, "id")
-        # order by 형태 완성
-        order_by = build_order_by(sort_column, sort_pk_column, direction)
-
-        # like_count:review_id -> like_count 실제값, review_id 실제값
-        sort_value, cursor_id = parse_cursor_value(cursor_value, sort_by)
-        filters = build_multi_cursor_filter(
-            sort_column=sort_column,
-            sort_pk_column=sort_pk_column,
-            sort_value=sort_value,
-            cursor_id=cursor_id,
-            direction=direction,
-        )
-
+        # 실제 정렬에 들어갈 컬럼 (created_at : 리뷰 작성일)
+        sort_columns = {
+            "created_at": Review.created_at,
+            "review_count": BakeryCard.review_count,
+            "avg_rating": BakeryCard.avg_rating,
+            "name": BakeryCard.name,
+        }
+        if sort_by not in sort_columns or direction not in ("asc", "desc"):
+            raise InvalidSortParameterException()
+
+        # 빵집별로 정렬 기준에 맞는 리뷰 1건만 남기기
+        order = desc if direction == "desc" else asc
         row_number = (
             func.row_number()
-            .over(partition_by=Bakery.id, order_by=order_by)
+            .over(
+                partition_by=BakeryCard.bakery_id,
+                order_by=order(sort_columns[sort_by]),
+            )
             .label("rn")
         )
 
         subq = (
             select(
-                Bakery.id,
-                Bakery.name,
-                Bakery.gu,
-                Bakery.dong,
-                Bakery.avg_rating,
-                Bakery.review_count,
-                Bakery.thumbnail,
-                Bakery.commercial_area_id,
-                OperatingHour.is_opened,
-                OperatingHour.open_time,
-                OperatingHour.close_time,
+                BakeryCard.bakery_id.label("id"),
+                BakeryCard.name,
+                BakeryCard.gu,
+                BakeryCard.dong,
+                BakeryCard.avg_rating,
+                BakeryCard.review_count,
+                BakeryCard.thumbnail,
+                BakeryCard.signature_menus,
+                BakeryCard.commercial_area_id,
                 Review.created_at,
                 row_number,
             )
             .join(
-                Review, and_(Review.bakery_id == Bakery.id, Review.user_id == user_id)
-            )
-            .join(
-                OperatingHour,
+                Review,
                 and_(
-                    OperatingHour.bakery_id == Bakery.id,
-                    OperatingHour.day_of_week == target_day_of_week,
+                    Review.bakery_id == BakeryCard.bakery_id, Review.user_id == user_id
                 ),
-                isouter=True,
             )
-            .filter(*filters)
             .subquery()
         )
 
-        is_desc = direction == "desc"
+        # 빵집 단위로 남긴 결과에서 keyset 페이징 (리뷰 개수/평균 별점은 NULL이면 0)
+        sort = pick_sort(
+            {
+                k: SortSpec(
+                    name=f"visited:{k}",
+                    column=subq.c[k],
+                    pk_column=subq.c.id,
+                    nulls_as=0 if k in ("review_count", "avg_rating") else None,
+                )
+                for k in sort_columns
+            },
+            sort_by,
+            direction,
+        )
 
         stmt = (
             select(subq)
-            .where(subq.c.rn == 1)
-            .order_by(
-                desc(subq.c[sort_by]) if is_desc else subq.c[sort_by],
-                desc(subq.c.id) if is_desc else subq.c.id,
-            )
+            .where(subq.c.rn == 1, *sort.where(cursor_value))
+            .order_by(*sort.order_by())
             .limit(page_size + 1)
         )
 
-        res = self.db.execute(stmt).mappings().all()
-        next_cursor = build_multi_next_cursor_real(
-            sort_by=sort_by, res=res, page_size=page_size
+        res = (await self.db.execute(stmt)).mappings().all()
+        next_cursor = sort.next_cursor(res, page_size)
+        open_statuses = await operating_schedule.get_open_statuses(
+            self.db, [r.id for r in res[:page_size]], now
         )
+
         return next_cursor, [
             GuDongMenuBakery(
                 bakery_id=r.id,
@@ -649,11 +839,8 @@ class BakeryRepository:
                 review_count=r.review_count,
                 commercial_area_id=r.commercial_area_id,
                 img_url=r.thumbnail,
-                open_status=operating_hours_to_open_status(
-                    is_opened=r.is_opened,
-                    close_time=r.close_time,
-                    open_time=r.open_time,
-                ),
+                open_status=open_statuses[r.id],
+                signature_menus=to_signature_menus(r.signature_menus),
             )
             for r in res[:page_size]
         ]
@@ -663,64 +850,48 @@ class BakeryRepository:
     ):
         """해당 베이커리에 오늘 유저가 작성한 리뷰 조회하는 쿼리."""
 
-        written_review = (
-            self.db.query(Review)
-            .filter(
+        stmt = (
+            select(Review.id)
+            .where(
                 Review.user_id == user_id,
                 Review.bakery_id == bakery_id,
                 start_time <= Review.created_at,
                 end_time >= Review.created_at,
             )
-            .first()
+            .limit(1)
         )
+        written_review = (await self.db.execute(stmt)).first()
 
         return True if written_review else False
 
-    async def check_already_liked_bakery(self, user_id: int, bakery_id: int):
-        """이미 찜 했는지 체크하는 쿼리."""
+    async def like_bakery(self, user_id: int, bakery_id: int) -> bool:
+        """베이커리 찜하는 쿼리. (이미 찜한 경우 False)"""
 
-        return (
-            self.db.query(UserBakeryLikes)
-            .filter(
-                UserBakeryLikes.user_id == user_id,
-                UserBakeryLikes.bakery_id == bakery_id,
-            )
-            .first()
+        stmt = (
+            insert(UserBakeryLikes)
+            .values(user_id=user_id, bakery_id=bakery_id)
+            .on_conflict_do_nothing(index_elements=["user_id", "bakery_id"])
+            .returning(UserBakeryLikes.bakery_id)
         )
+        return (await self.db.execute(stmt)).first() is not None
 
-    async def like_bakery(self, user_id: int, bakery_id: int):
-        """베이커리 찜하는 쿼리."""
-        like_bakery = UserBakeryLikes(user_id=user_id, bakery_id=bakery_id)
-        self.db.add(like_bakery)
+    async def dislike_bakery(self, user_id: int, bakery_id: int) -> bool:
+        """베이커리 찜 해제하는 쿼리. (이미 찜 해제된 경우 False)"""
 
-    async def check_already_disliked_bakery(self, user_id: int, bakery_id: int):
-        """이미 찜 해제여부 체크하는 쿼리."""
-
-        return (
-            self.db.query(UserBakeryLikes)
-            .filter(
+        stmt = (
+            delete(UserBakeryLikes)
+            .where(
                 UserBakeryLikes.user_id == user_id,
                 UserBakeryLikes.bakery_id == bakery_id,
             )
-            .first()
-        )
-
-    async def dislike_bakery(self, user_id: int, bakery_id: int):
-        """베이커리 찜 해제하는 쿼리."""
-
-        like_bakery = (
-            self.db.query(UserBakeryLikes)
-            .filter_by(user_id=user_id, bakery_id=bakery_id)
-            .first()
+            .returning(UserBakeryLikes.bakery_id)
         )
-
-        if like_bakery:
-            self.db.delete(like_bakery)
+        return (await self.db.execute(stmt)).first() is not None
 
     async def get_like_bakeries(
         self,
         user_id: int,
-        target_day_of_week: int,
+        now: datetime,
         sort_by: str,
         direction: str,
         cursor_value: str,
@@ -728,64 +899,38 @@ class BakeryRepository:
     ):
         """찜한 베이커리 조회하는 쿼리."""
 
-        # 실제 정렬에 들어갈 컬럼 Review.like_count
-        if sort_by == "created_at":
-            sort_column = getattr(UserBakeryLikes, sort_by)
-        else:
-            sort_column = getattr(Bakery, sort_by)
-        # 보조 정렬을 위하나 고유성 가지고 잇는 컬럼 Review.id
-        sort_pk_column = getattr(Bakery, "id")
-        # order by 형태 완성
-        order_by = build_order_by(sort_column, sort_pk_column, direction)
-
-        # like_count:review_id -> like_count 실제값, review_id 실제값
-        sort_value, cursor_id = parse_cursor_value(cursor_value, sort_by)
-        filters = build_multi_cursor_filter(
-            sort_column=sort_column,
-            sort_pk_column=sort_pk_column,
-            sort_value=sort_value,
-            cursor_id=cursor_id,
-            direction=direction,
-        )
+        sort = pick_sort(LIKED_BAKERY_SORTS, sort_by, direction)
 
         stmt = (
             select(
-                Bakery.id,
-                Bakery.name,
-                Bakery.avg_rating,
-                Bakery.review_count,
-                Bakery.gu,
-                Bakery.dong,
-                Bakery.thumbnail,
-                Bakery.commercial_area_id,
-                OperatingHour.close_time,
-                OperatingHour.open_time,
-                OperatingHour.is_opened,
+                BakeryCard.bakery_id.label("id"),
+                BakeryCard.name,
+                BakeryCard.avg_rating,
+                BakeryCard.review_count,
+                BakeryCard.gu,
+                BakeryCard.dong,
+                BakeryCard.thumbnail,
+                BakeryCard.signature_menus,
+                BakeryCard.commercial_area_id,
                 UserBakeryLikes.created_at,
             )
             .join(
                 UserBakeryLikes,
                 and_(
-                    UserBakeryLikes.bakery_id == Bakery.id,
+                    UserBakeryLikes.bakery_id == BakeryCard.bakery_id,
                     UserBakeryLikes.user_id == user_id,
                 ),
             )
-            .join(
-                OperatingHour,
-                and_(
-                    OperatingHour.bakery_id == Bakery.id,
-                    OperatingHour.day_of_week == target_day_of_week,
-                ),
-                isouter=True,
-            )
-            .filter(*filters)
-            .order_by(*order_by)
+            .filter(*sort.where(cursor_value))
+            .order_by(*sort.order_by())
             .limit(page_size + 1)
         )
 
-        res = self.db.execute(stmt).mappings().all()
-        next_cursor = build_multi_next_cursor_real(
-            sort_by=sort_by, res=res, page_size=page_size
+        res = (await self.db.execute(stmt)).mappings().all()
+        next_cursor = sort.next_cursor(res, page_size)
+
+        open_statuses = await operating_schedule.get_open_statuses(
+            self.db, [r.id for r in res[:page_size]], now
         )
 
         return next_cursor, [
@@ -798,48 +943,42 @@ class BakeryRepository:
                 dong=r.dong,
                 commercial_area_id=r.commercial_area_id,
                 img_url=r.thumbnail,
-                open_status=operating_hours_to_open_status(
-                    is_opened=r.is_opened,
-                    close_time=r.close_time,
-                    open_time=r.open_time,
-                ),
+                open_status=open_statuses[r.id],
+                signature_menus=to_signature_menus(r.signature_menus),
             )
             for r in res[:page_size]
         ]
 
-    async def get_recent_viewed_bakeries(self, user_id: int, target_day_of_week: int):
-        """최근 조회한 빵집 20개 조회하는 쿼리."""
-
-        res = (
-            self.db.query(
-                Bakery.id,
-                Bakery.name,
-                Bakery.commercial_area_id,
-                Bakery.thumbnail,
-                Bakery.avg_rating,
-                Bakery.review_count,
-                OperatingHour.is_opened,
-                OperatingHour.close_time,
-                OperatingHour.open_time,
-            )
-            .join(
-                RecentBakeryView,
-                and_(
-                    RecentBakeryView.bakery_id == Bakery.id,
-                    RecentBakeryView.user_id == user_id,
-                ),
-            )
-            .join(
-                OperatingHour,
-                and_(
-                    OperatingHour.bakery_id == Bakery.id,
-                    OperatingHour.day_of_week == target_day_of_week,
-                ),
-                isouter=True,
-            )
+    async def get_recent_views(self, user_id: int) -> List[Tuple[int, float]]:
+        """최근 조회한 빵집 (bakery_id, 조회시각) 최신순 조회하는 쿼리."""
+
+        stmt = (
+            select(RecentBakeryView.bakery_id, RecentBakeryView.created_at)
+            .where(RecentBakeryView.user_id == user_id)
             .order_by(desc(RecentBakeryView.created_at))
-            .limit(20)
-            .all()
+            .limit(RECENT_VIEW_LIMIT)
+        )
+        res = (await self.db.execute(stmt)).all()
+
+        return [(r.bakery_id, r.created_at.timestamp()) for r in res]
+
+    async def get_bakery_cards(
+        self, bakery_ids: List[int], now: datetime
+    ) -> List[RecentViewedBakery]:
+        """최근 조회한 빵집 리스트에 보여줄 베이커리 카드 조회하는 쿼리."""
+
+        stmt = select(
+            BakeryCard.bakery_id.label("id"),
+            BakeryCard.name,
+            BakeryCard.commercial_area_id,
+            BakeryCard.thumbnail,
+            BakeryCard.avg_rating,
+            BakeryCard.review_count,
+        ).where(BakeryCard.bakery_id.in_(bakery_ids))
+        res = (await self.db.execute(stmt)).all()
+
+        open_statuses = await operating_schedule.get_open_statuses(
+            self.db, [r.id for r in res], now
         )
 
         return [
@@ -850,17 +989,63 @@ class BakeryRepository:
                 img_url=r.thumbnail,
                 avg_rating=r.avg_rating,
                 review_count=r.review_count,
-                open_status=operating_hours_to_open_status(
-                    is_opened=r.is_opened,
-                    close_time=r.close_time,
-                    open_time=r.open_time,
-                ),
+                open_status=open_statuses[r.id],
             )
             for r in res
         ]
 
+    async def sync_recent_views(self, views: Dict[int, List[Tuple[int, float]]]):
+        """redis의 유저별 최근 조회 목록을 DB에 반영하는 쿼리.
+
+        조회시각은 갱신하고, 목록에서 밀려난 빵집은 삭제한다.
+        """
+
+        views = {u: v[:RECENT_VIEW_LIMIT] for u, v in views.items() if v}
+        if not views:
+            return
+
+        # 삭제된 빵집은 제외 (FK 위반으로 배치 전체가 롤백되지 않도록)
+        bakery_ids = list({b for user_views in views.values() for b, _ in user_views})
+        existing_ids = set()
+        for chunk in to_chunks(bakery_ids, MAX_BIND_PARAMS):
+            stmt = select(Bakery.id).where(Bakery.id.in_(chunk))
+            existing_ids.update((await self.db.execute(stmt)).scalars().all())
+
+        rows = [
+            {
+                "user_id": user_id,
+                "bakery_id": bakery_id,
+                "created_at": datetime.fromtimestamp(viewed_at, tz=timezone.utc),
+            }
+            for user_id, user_views in views.items()
+            for bakery_id, viewed_at in user_views
+            if bakery_id in existing_ids
+        ]
+        # bind parameter 개수 제한에 맞춰서 나눠서 upsert (row당 3개)
+        for chunk in to_chunks(rows, MAX_BIND_PARAMS // 3):
+            stmt = insert(RecentBakeryView).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "bakery_id"],
+                set_={"created_at": stmt.excluded.created_at, "updated_at": func.now()},
+            )
+            await self.db.execute(stmt)
+
+        # 목록에서 밀려난 빵집 삭제 (유저당 user_id 1개 + 유지할 (user_id, bakery_id) 쌍)
+        user_ids = list(views)
+        for chunk in to_chunks(
+            user_ids, MAX_BIND_PARAMS // (1 + 2 * RECENT_VIEW_LIMIT)
+        ):
+            keep = [(u, b) for u in chunk for b, _ in views[u]]
+            stmt = delete(RecentBakeryView).where(
+                RecentBakeryView.user_id.in_(chunk),
+                tuple_(RecentBakeryView.user_id, RecentBakeryView.bakery_id).not_in(
+                    keep
+                ),
+            )
+            await self.db.execute(stmt)
+
     async def delete_recent_viewed_bakeries(self, user_id: int):
         """최근에 조회한 빵집 삭제하는 쿼리."""
 
         stmt = delete(RecentBakeryView).where(RecentBakeryView.user_id == user_id)
-        self.db.execute(stmt)
+        await self.db.execute(stmt)
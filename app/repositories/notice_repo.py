@@ -1,6 +1,6 @@
 from typing import List
 
-from sqlalchemy import asc, desc
+from sqlalchemy import asc, desc, select
 
 from app.model.notice import NoticeItems, Notices
 from app.schema.notice import Notice
@@ -13,12 +13,12 @@ class NoticeRepository:
     async def get_notices(self):
         """공지를 조회하는 쿼리."""
 
-        res = (
-            self.db.query(Notices.id, Notices.title, NoticeItems.content)
+        stmt = (
+            select(Notices.id, Notices.title, NoticeItems.content)
             .join(NoticeItems, NoticeItems.notice_id == Notices.id)
             .order_by(desc(Notices.created_at), asc(NoticeItems.order_item))
-            .all()
         )
+        res = (await self.db.execute(stmt)).all()
 
         return [
             Notice(notice_id=r.id, notice_title=r.title, content=r.content) for r in res
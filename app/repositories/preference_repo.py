@@ -1,7 +1,8 @@
 from collections import defaultdict
 from typing import List
 
-from sqlalchemy.orm.session import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exception import UnknownException
 from app.model.users import Preferences
@@ -9,7 +10,7 @@ from app.schema.preferences import PreferenceResponseDTO, PreferenceType
 
 
 class PreferenceRepository:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
     @staticmethod
@@ -30,7 +31,7 @@ class PreferenceRepository:
     async def get_preference_options(self):
         """취향항목 전체 조회 쿼리."""
         try:
-            res = self.db.query(Preferences).all()
+            res = (await self.db.execute(select(Preferences))).scalars().all()
             return self.convert_list_to_model(res)
         except Exception as e:
             raise UnknownException(detail=str(e))
@@ -39,11 +40,10 @@ class PreferenceRepository:
         """특정 취향항목 조회하는 쿼리."""
 
         try:
-            res = (
-                self.db.query(Preferences.id, Preferences.name)
-                .filter(Preferences.type == option_type)
-                .all()
+            stmt = select(Preferences.id, Preferences.name).where(
+                Preferences.type == option_type
             )
+            res = (await self.db.execute(stmt)).all()
             return [PreferenceType(id=r.id, name=r.name) for r in res]
 
         except Exception as e:
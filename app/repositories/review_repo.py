@@ -1,25 +1,64 @@
-from typing import List, Optional
-
-from fastapi import UploadFile
-from sqlalchemy import and_, desc, or_, select
-from sqlalchemy.orm import Session
-
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import (
+    Integer,
+    Numeric,
+    and_,
+    cast,
+    column,
+    delete,
+    func,
+    or_,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.const import (
+    IMAGE_VARIANT_DETAIL,
+    IMAGE_VARIANT_FULL,
+    IMAGE_VARIANT_THUMB,
+    MAX_BIND_PARAMS,
+)
 from app.model.bakery import Bakery, BakeryMenu
 from app.model.review import Review, ReviewBakeryMenu, ReviewLike, ReviewPhoto
 from app.model.users import Users
 from app.schema.review import BakeryReview, MyBakeryReview
+from app.utils.converter import to_chunks
 from app.utils.date import get_now_by_timezone, get_today_end, get_today_start
-from app.utils.pagination import (
-    build_multi_cursor_filter,
-    build_multi_next_cursor_real,
-    build_next_cursor,
-    build_order_by,
-)
-from app.utils.parser import parse_cursor_value
+from app.utils.pagination import SortSpec, pick_sort
+
+# 내가 작성한 리뷰 : 최신순
+MY_REVIEW_SORT = SortSpec(name="my_reviews", pk_column=Review.id)
+# 베이커리 리뷰 : 좋아요 순 / 작성일 순 / 별점 순
+BAKERY_REVIEW_SORTS = {
+    "like_count": SortSpec(
+        name="bakery_reviews:like_count",
+        column=Review.like_count,
+        pk_column=Review.id,
+        index="ix_reviews_bakery_like_count",
+    ),
+    "created_at": SortSpec(
+        name="bakery_reviews:created_at",
+        column=Review.created_at,
+        pk_column=Review.id,
+        index="ix_reviews_bakery_created_at",
+    ),
+    "rating": SortSpec(
+        name="bakery_reviews:rating",
+        column=Review.rating,
+        pk_column=Review.id,
+        index="ix_reviews_bakery_rating",
+        nulls_as=0,
+    ),
+}
 
 
 class ReviewRepository:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
     async def get_my_reviews_by_bakery_id(
@@ -32,10 +71,7 @@ class ReviewRepository:
             Review.bakery_id == bakery_id,
         ]
 
-        if cursor_value == "0":
-            filters.append(Review.id > cursor_value)
-        else:
-            filters.append(Review.id <= cursor_value)
+        filters.extend(MY_REVIEW_SORT.where(cursor_value))
 
         stmt = (
             select(
@@ -56,14 +92,12 @@ class ReviewRepository:
                 isouter=True,
             )
             .filter(*filters)
-            .order_by(desc(Review.id))
+            .order_by(*MY_REVIEW_SORT.order_by())
             .limit(page_size + 1)
         )
 
-        res = self.db.execute(stmt).mappings().all()
-        next_cursor = build_next_cursor(
-            res=res, target_column="id", page_size=page_size
-        )
+        res = (await self.db.execute(stmt)).mappings().all()
+        next_cursor = MY_REVIEW_SORT.next_cursor(res, page_size)
 
         return next_cursor, [
             MyBakeryReview(
@@ -82,11 +116,18 @@ class ReviewRepository:
     async def get_my_review_photos_by_bakery_id(self, review_ids: List[int]):
         """리뷰 내 사진 조회하는 쿼리."""
 
-        return (
-            self.db.query(ReviewPhoto.review_id, ReviewPhoto.img_url)
-            .filter(ReviewPhoto.review_id.in_(review_ids))
-            .all()
-        )
+        # variant가 없는 예전 사진은 원본 경로로 대체
+        stmt = select(
+            ReviewPhoto.review_id,
+            ReviewPhoto.img_url,
+            func.coalesce(ReviewPhoto.thumb_url, ReviewPhoto.img_url).label(
+                "thumb_url"
+            ),
+            func.coalesce(ReviewPhoto.detail_url, ReviewPhoto.img_url).label(
+                "detail_url"
+            ),
+        ).where(ReviewPhoto.review_id.in_(review_ids))
+        return (await self.db.execute(stmt)).all()
 
     async def get_my_review_menus_by_bakery_id(self, review_ids: List[int]):
         """리뷰한 베이커리 메뉴 조회하는 쿼리."""
@@ -98,16 +139,15 @@ class ReviewRepository:
             .filter(ReviewBakeryMenu.review_id.in_(review_ids))
         )
 
-        return self.db.execute(stmt).mappings().all()
+        return (await self.db.execute(stmt)).mappings().all()
 
     async def get_bakery_summary(self, bakery_id: int):
         """베이커리 평점이랑 리뷰 개수 조회하는 쿼리."""
 
-        return (
-            self.db.query(Bakery.review_count, Bakery.avg_rating)
-            .filter(Bakery.id == bakery_id)
-            .first()
+        stmt = select(Bakery.review_count, Bakery.avg_rating).where(
+            Bakery.id == bakery_id
         )
+        return (await self.db.execute(stmt)).first()
 
     async def get_review_by_bakery_id(
         self,
@@ -120,22 +160,8 @@ class ReviewRepository:
     ):
         """리뷰 주요데이터 조회하는 쿼리."""
 
-        # 실제 정렬에 들어갈 컬럼 Review.like_count
-        sort_column = getattr(Review, sort_by)
-        # 보조 정렬을 위하나 고유성 가지고 잇는 컬럼 Review.id
-        sort_pk_column = getattr(Review, "id")
-        # order by 형태 완성
-        order_by = build_order_by(sort_column, sort_pk_column, direction)
-
-        # like_count:review_id -> like_count 실제값, review_id 실제값
-        sort_value, cursor_id = parse_cursor_value(cursor_value, sort_by)
-        filters = build_multi_cursor_filter(
-            sort_column=sort_column,
-            sort_pk_column=sort_pk_column,
-            sort_value=sort_value,
-            cursor_id=cursor_id,
-            direction=direction,
-        )
+        sort = pick_sort(BAKERY_REVIEW_SORTS, sort_by, direction)
+        filters = sort.where(cursor_value)
 
         filters.append(
             and_(
@@ -168,15 +194,13 @@ class ReviewRepository:
                 isouter=True,
             )
             .filter(*filters)
-            .order_by(*order_by)
+            .order_by(*sort.order_by())
             .limit(page_size + 1)
         )
 
-        res = self.db.execute(stmt).mappings().all()
+        res = (await self.db.execute(stmt)).mappings().all()
 
-        next_cursor = build_multi_next_cursor_real(
-            sort_by=sort_by, res=res, page_size=page_size
-        )
+        next_cursor = sort.next_cursor(res, page_size)
 
         return next_cursor, [
             BakeryReview(
@@ -195,18 +219,18 @@ class ReviewRepository:
     async def get_today_review(self, user_id: int, bakery_id: int):
         """오늘 작성한 리뷰 있는 지 조회하는 쿼리."""
 
-        review = (
-            self.db.query(Review.id)
-            .filter(
+        stmt = (
+            select(Review.id)
+            .where(
                 Review.user_id == user_id,
                 Review.bakery_id == bakery_id,
                 Review.created_at >= get_today_start(),
                 Review.created_at <= get_today_end(),
             )
-            .first()
+            .limit(1)
         )
 
-        return review
+        return (await self.db.execute(stmt)).first()
 
     async def insert_extra_menu(self, bakery_id: int, consumed_menus: dict):
         """기타 메뉴 추가하는 쿼리."""
@@ -219,7 +243,7 @@ class ReviewRepository:
         )
 
         self.db.add(bakery_menu)
-        self.db.flush()
+        await self.db.flush()
 
         for c in consumed_menus:
             if c["menu_id"] == -1:
@@ -250,7 +274,7 @@ class ReviewRepository:
         )
 
         self.db.add(review_info)
-        self.db.flush()
+        await self.db.flush()
         return review_info.id
 
     async def bulk_insert_review_menus(self, review_id: int, consumed_menus: dict):
@@ -263,81 +287,126 @@ class ReviewRepository:
             for c in consumed_menus
         ]
         self.db.add_all(add_data)
-        self.db.flush()
+        await self.db.flush()
 
-    async def update_avg_rating_and_review_count(
-        self,
-        bakery_id: int,
-        rating: float,
-        review_imgs: Optional[List[UploadFile]] = None,
-    ):
-        """베이커리 평점 및 리뷰 개수 업데이트 하는 메소드."""
+    async def update_avg_rating_and_review_count(self, bakery_id: int, rating: float):
+        """베이커리 평점 및 리뷰 개수 업데이트 하는 쿼리.
 
-        # 1. 베이커리 조회
-        bakery_stat = self.db.query(Bakery).filter(Bakery.id == bakery_id).first()
+        SET 절의 컬럼은 갱신 전 값을 참조하므로 한 번의 UPDATE로 원자적으로 계산된다.
+        (동시 리뷰 작성 시에도 row lock으로 순서대로 반영)
+        """
 
-        if bakery_stat:
+        review_count = func.coalesce(Bakery.review_count, 0)
+        avg_rating = func.coalesce(Bakery.avg_rating, 0)
 
-            # 2. 업데이트할 데이터 계산.
-            avg_rating, review_count = (
-                bakery_stat.avg_rating,
-                bakery_stat.review_count,
+        stmt = (
+            update(Bakery)
+            .where(Bakery.id == bakery_id)
+            .values(
+                review_count=review_count + 1,
+                avg_rating=func.round(
+                    cast(
+                        (avg_rating * review_count + rating) / (review_count + 1),
+                        Numeric,
+                    ),
+                    1,
+                ),
             )
-            new_count = review_count + 1
-            new_rating = round(((avg_rating * review_count) + rating) / new_count, 1)
-
-            # 3. 업데이트
-            bakery_stat.review_count = new_count
-            bakery_stat.avg_rating = new_rating
-
-            if review_imgs:
-                self.db.flush()
+            .returning(Bakery.avg_rating, Bakery.review_count)
+            .execution_options(synchronize_session=False)
+        )
+        return (await self.db.execute(stmt)).first()
 
-    async def bulk_insert_review_imgs(self, review_id: int, filenames: List[str]):
-        """리뷰 이미지 한 번에 저장하는 쿼리."""
-        add_data = [ReviewPhoto(review_id=review_id, img_url=f) for f in filenames]
+    async def bulk_insert_review_imgs(
+        self, review_id: int, filenames: List[Dict[str, str]]
+    ):
+        """리뷰 이미지 한 번에 저장하는 쿼리. (filenames : 이미지별 {variant: 파일명})"""
+        add_data = [
+            ReviewPhoto(
+                review_id=review_id,
+                img_url=f[IMAGE_VARIANT_FULL],
+                thumb_url=f[IMAGE_VARIANT_THUMB],
+                detail_url=f[IMAGE_VARIANT_DETAIL],
+            )
+            for f in filenames
+        ]
         self.db.add_all(add_data)
 
-    async def check_like_review(self, user_id: int, review_id: int):
-        """리뷰에 대한 좋아요여부 체크하는 쿼리."""
+    async def get_review_photo_state(self, review_id: int) -> Optional[bool]:
+        """리뷰 존재여부와 리뷰 이미지가 이미 저장됐는지 조회하는 쿼리. (리뷰가 없으면 None)"""
 
-        return (
-            self.db.query(ReviewLike)
-            .filter(ReviewLike.review_id == review_id, ReviewLike.user_id == user_id)
-            .first()
+        has_photo = (
+            select(ReviewPhoto.id).where(ReviewPhoto.review_id == review_id).exists()
         )
+        stmt = select(has_photo.label("has_photo")).where(Review.id == review_id)
+        res = (await self.db.execute(stmt)).first()
 
-    async def like_review(self, user_id: int, review_id: int):
-        """리뷰 좋아요 쿼리."""
+        return None if res is None else res.has_photo
 
-        review = ReviewLike(user_id=user_id, review_id=review_id)
-        self.db.add(review)
-        self.db.flush()
+    async def get_review_like_state(self, user_id: int, review_id: int):
+        """리뷰 존재여부와 유저의 좋아요 여부 조회하는 쿼리. (리뷰가 없으면 None)"""
 
-    async def update_like_review(self, review_id: int, count_value: int):
-        """리뷰 count 업데이트 하는 쿼리."""
+        stmt = (
+            select(ReviewLike.user_id)
+            .select_from(Review)
+            .outerjoin(
+                ReviewLike,
+                and_(ReviewLike.review_id == Review.id, ReviewLike.user_id == user_id),
+            )
+            .where(Review.id == review_id)
+        )
+        res = (await self.db.execute(stmt)).first()
 
-        review = self.db.query(Review).filter(Review.id == review_id).first()
-        review.like_count += count_value
+        return None if res is None else res.user_id is not None
 
-    async def check_dislike_review(self, user_id: int, review_id: int):
-        """리뷰에 대한 좋아요 해지여부 체크하는 쿼리."""
+    async def apply_review_likes(
+        self, likes: List[Tuple[int, int]], unlikes: List[Tuple[int, int]]
+    ) -> Dict[int, int]:
+        """버퍼에 쌓인 (user_id, review_id) 좋아요/해지 한 번에 반영하는 쿼리.
 
-        return (
-            self.db.query(ReviewLike)
-            .filter(ReviewLike.review_id == review_id, ReviewLike.user_id == user_id)
-            .first()
-        )
+        실제로 insert/delete 된 row 기준으로 like_count를 증감하므로
+        같은 요청이 두 번 반영되어도 개수가 틀어지지 않는다.
+        """
 
-    async def dislike_review(self, user_id: int, review_id: int):
-        """리뷰 좋아요 해지 쿼리."""
+        deltas = Counter()
+        # (user_id, review_id) / (review_id, delta) 한 쌍당 bind parameter 2개
+        chunk_size = MAX_BIND_PARAMS // 2
 
-        like_review = (
-            self.db.query(ReviewLike)
-            .filter(ReviewLike.user_id == user_id, ReviewLike.review_id == review_id)
-            .first()
-        )
+        for chunk in to_chunks(likes, chunk_size):
+            stmt = (
+                insert(ReviewLike)
+                .values([{"user_id": u, "review_id": r} for u, r in chunk])
+                .on_conflict_do_nothing(index_elements=["user_id", "review_id"])
+                .returning(ReviewLike.review_id)
+            )
+            deltas.update((await self.db.execute(stmt)).scalars().all())
+
+        # 큰 (user_id, review_id) IN 목록은 식이 깊어져서 VALUES 로 조인
+        for chunk in to_chunks(unlikes, chunk_size):
+            v = values(
+                column("user_id", Integer), column("review_id", Integer), name="v"
+            ).data(chunk)
+            stmt = (
+                delete(ReviewLike)
+                .where(
+                    ReviewLike.user_id == v.c.user_id,
+                    ReviewLike.review_id == v.c.review_id,
+                )
+                .returning(ReviewLike.review_id)
+            )
+            deltas.subtract((await self.db.execute(stmt)).scalars().all())
+
+        changed = [(r, d) for r, d in deltas.items() if d]
+        for chunk in to_chunks(changed, chunk_size):
+            v = values(
+                column("review_id", Integer), column("delta", Integer), name="v"
+            ).data(chunk)
+            stmt = (
+                update(Review)
+                .where(Review.id == v.c.review_id)
+                .values(like_count=Review.like_count + v.c.delta)
+                .execution_options(synchronize_session=False)
+            )
+            await self.db.execute(stmt)
 
-        if like_review:
-            self.db.delete(like_review)
-            self.db.flush()
+        return dict(changed)
@@ -1,80 +1,87 @@
-from sqlalchemy import and_, desc, or_, select
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import List, Optional
 
-from app.core.exception import UnknownException
-from app.model.bakery import Bakery, BakeryMenu, BakeryPhoto, OperatingHour
-from app.model.users import UserBakeryLikes
+from sqlalchemy import Numeric, case, cast, delete, func, select, union
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.const import ETC_MENU_NAME
+from app.core.schedule import operating_schedule
+from app.core.suggest import SuggestSource
+from app.model.bakery import Bakery, BakeryCard, BakeryMenu, BakerySearchDocument
 from app.schema.search import SearchBakery
-from app.utils.converter import operating_hours_to_open_status
-from app.utils.pagination import build_next_cursor, convert_limit_and_offset
+from app.utils.converter import to_search_document, to_signature_menus
+from app.utils.hangul import is_choseong_only, normalize_text, to_choseong, to_jamo
+from app.utils.pagination import SortSpec
+
+SEARCH_DOCUMENT_BATCH_SIZE = 1000
 
 
 class SearchRepository:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
     async def search_bakeries_by_keyword(
         self,
         keyword: str,
         user_id: int,
-        target_day_of_week: int,
+        now: datetime,
         cursor_value: str,
         page_size: int,
     ):
-        """키워드로 베이커리 조회하는 쿼리."""
+        """키워드로 베이커리 조회하는 쿼리. (관련도 높은 순)"""
 
-        filters = [
-            or_(
-                Bakery.name.ilike(f"{keyword}%"),
-                BakeryMenu.name.ilike(f"{keyword}%"),
-            )
-        ]
+        doc = BakerySearchDocument
+        keyword = normalize_text(keyword)
 
-        if cursor_value == "0":
-            filters.append(Bakery.id > cursor_value)
+        # 초성으로만 입력한 경우 초성 문서에서, 그 외에는 자모 문서에서 검색
+        # (자모로 풀어서 비교하므로 입력 중인 "소금빠", "소금ㅃ" 도 일치)
+        if is_choseong_only(keyword):
+            target = doc.choseong
         else:
-            filters.append(Bakery.id <= cursor_value)
+            target, keyword = doc.jamo, to_jamo(keyword)
+
+        # 관련도 : 문서 앞부분(빵집이름) 일치 가산점 + 단어 유사도
+        score = func.round(
+            cast(
+                case((target.startswith(keyword, autoescape=True), 1.0), else_=0.0)
+                + func.word_similarity(keyword, target),
+                Numeric,
+            ),
+            4,
+        )
+
+        # cursor_value 페이징 (관련도 순)
+        sort = SortSpec(
+            name="search", column=score, pk_column=doc.bakery_id, key="score"
+        )
+        filters = [target.contains(keyword, autoescape=True), *sort.where(cursor_value)]
 
         stmt = (
             select(
-                Bakery.id,
-                Bakery.name,
-                Bakery.gu,
-                Bakery.dong,
-                Bakery.avg_rating,
-                Bakery.review_count,
-                Bakery.thumbnail,
-                Bakery.commercial_area_id,
-                OperatingHour.is_opened,
-                OperatingHour.open_time,
-                OperatingHour.close_time,
-            )
-            .join(BakeryMenu, Bakery.id == BakeryMenu.bakery_id)
-            .join(
-                OperatingHour,
-                and_(
-                    OperatingHour.bakery_id == Bakery.id,
-                    OperatingHour.day_of_week == target_day_of_week,
-                ),
-                isouter=True,
+                BakeryCard.bakery_id.label("id"),
+                BakeryCard.name,
+                BakeryCard.gu,
+                BakeryCard.dong,
+                BakeryCard.avg_rating,
+                BakeryCard.review_count,
+                BakeryCard.thumbnail,
+                BakeryCard.signature_menus,
+                BakeryCard.commercial_area_id,
+                score.label("score"),
             )
-            .join(
-                UserBakeryLikes,
-                and_(
-                    UserBakeryLikes.bakery_id == Bakery.id,
-                    UserBakeryLikes.user_id == user_id,
-                ),
-                isouter=True,
-            )
-            .where(*and_(*filters))
-            .distinct(Bakery.id)
-            .order_by(desc(Bakery.id))
+            .select_from(doc)
+            .join(BakeryCard, BakeryCard.bakery_id == doc.bakery_id)
+            .where(*filters)
+            .order_by(*sort.order_by())
             .limit(page_size + 1)
         )
 
-        res = self.db.execute(stmt).all()
-        next_cursor = build_next_cursor(
-            res=res, target_column="id", page_size=page_size
+        res = (await self.db.execute(stmt)).mappings().all()
+        next_cursor = sort.next_cursor(res, page_size)
+
+        open_statuses = await operating_schedule.get_open_statuses(
+            self.db, [r.id for r in res[:page_size]], now
         )
 
         return next_cursor, [
@@ -87,11 +94,122 @@ class SearchRepository:
                 dong=r.dong,
                 img_url=r.thumbnail,
                 commercial_area_id=r.commercial_area_id,
-                open_status=operating_hours_to_open_status(
-                    is_opened=r.is_opened,
-                    close_time=r.close_time,
-                    open_time=r.open_time,
-                ),
+                open_status=open_statuses[r.id],
+                signature_menus=to_signature_menus(r.signature_menus),
             )
             for r in res[:page_size]
         ]
+
+    async def get_bakery_ids_changed_since(self, since: datetime) -> List[int]:
+        """since 이후 빵집/메뉴 정보가 바뀐 베이커리 id 조회하는 쿼리.
+
+        삭제는 updated_at 으로 알 수 없으므로 메뉴 수가 문서와 다르거나
+        빵집이 없어진 문서도 함께 조회한다.
+        """
+
+        doc = BakerySearchDocument
+        menu_counts = (
+            select(BakeryMenu.bakery_id, func.count().label("menu_count"))
+            .where(BakeryMenu.name != ETC_MENU_NAME)
+            .group_by(BakeryMenu.bakery_id)
+            .subquery()
+        )
+
+        stmt = union(
+            select(Bakery.id.label("bakery_id")).where(Bakery.updated_at > since),
+            select(BakeryMenu.bakery_id).where(BakeryMenu.updated_at > since),
+            select(doc.bakery_id)
+            .outerjoin(menu_counts, menu_counts.c.bakery_id == doc.bakery_id)
+            .where(doc.menu_count != func.coalesce(menu_counts.c.menu_count, 0)),
+            select(doc.bakery_id)
+            .outerjoin(Bakery, Bakery.id == doc.bakery_id)
+            .where(Bakery.id.is_(None)),
+        )
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def upsert_search_documents(self, bakery_ids: Optional[List[int]] = None):
+        """베이커리 검색 문서 생성/갱신하는 쿼리. (bakery_ids 없으면 전체)"""
+
+        bakery_stmt = select(Bakery.id, Bakery.name, Bakery.gu, Bakery.dong)
+        menu_stmt = select(BakeryMenu.bakery_id, BakeryMenu.name).where(
+            BakeryMenu.name != ETC_MENU_NAME
+        )
+        if bakery_ids is not None:
+            if not bakery_ids:
+                return
+            bakery_stmt = bakery_stmt.where(Bakery.id.in_(bakery_ids))
+            menu_stmt = menu_stmt.where(BakeryMenu.bakery_id.in_(bakery_ids))
+
+        bakeries = (await self.db.execute(bakery_stmt)).all()
+        menus = {}
+        for m in (await self.db.execute(menu_stmt.order_by(BakeryMenu.id))).all():
+            menus.setdefault(m.bakery_id, []).append(m.name)
+
+        # 없어진 빵집의 문서 삭제
+        if bakery_ids is not None:
+            removed_ids = set(bakery_ids) - {b.id for b in bakeries}
+            if removed_ids:
+                await self.db.execute(
+                    delete(BakerySearchDocument).where(
+                        BakerySearchDocument.bakery_id.in_(removed_ids)
+                    )
+                )
+
+        documents = []
+        for b in bakeries:
+            menu_names = menus.get(b.id, [])
+            document = to_search_document(b.name, b.gu, b.dong, menu_names)
+            documents.append(
+                {
+                    "bakery_id": b.id,
+                    "document": document,
+                    "choseong": to_choseong(document),
+                    "jamo": to_jamo(document),
+                    "menu_count": len(menu_names),
+                }
+            )
+
+        for i in range(0, len(documents), SEARCH_DOCUMENT_BATCH_SIZE):
+            stmt = insert(BakerySearchDocument).values(
+                documents[i : i + SEARCH_DOCUMENT_BATCH_SIZE]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[BakerySearchDocument.bakery_id],
+                set_={
+                    "document": stmt.excluded.document,
+                    "choseong": stmt.excluded.choseong,
+                    "jamo": stmt.excluded.jamo,
+                    "menu_count": stmt.excluded.menu_count,
+                    "updated_at": func.now(),
+                },
+            )
+            await self.db.execute(stmt)
+
+    async def get_suggest_sources(
+        self, bakery_ids: Optional[List[int]] = None
+    ) -> List[SuggestSource]:
+        """자동완성 색인용 빵집이름/메뉴이름 조회하는 쿼리. (bakery_ids 없으면 전체)"""
+
+        bakery_stmt = select(Bakery.id, Bakery.name, Bakery.review_count)
+        menu_stmt = select(BakeryMenu.bakery_id, BakeryMenu.name).where(
+            BakeryMenu.name != ETC_MENU_NAME
+        )
+        if bakery_ids is not None:
+            if not bakery_ids:
+                return []
+            bakery_stmt = bakery_stmt.where(Bakery.id.in_(bakery_ids))
+            menu_stmt = menu_stmt.where(BakeryMenu.bakery_id.in_(bakery_ids))
+
+        menus = {}
+        for m in (await self.db.execute(menu_stmt)).all():
+            menus.setdefault(m.bakery_id, []).append(m.name)
+
+        return [
+            SuggestSource(
+                bakery_id=b.id,
+                name=b.name,
+                review_count=b.review_count or 0,
+                menu_names=tuple(menus.get(b.id, [])),
+            )
+            for b in (await self.db.execute(bakery_stmt)).all()
+        ]
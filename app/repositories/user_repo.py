@@ -1,11 +1,12 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
-from sqlalchemy import desc, inspect
-from sqlalchemy.orm.session import Session
+from sqlalchemy import delete, desc, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exception import UnknownException
 from app.model.badge import Badge, UserBadge
-from app.model.bakery import Bakery
+from app.model.bakery import Bakery, BakeryPreference
 from app.model.report import BreadReport
 from app.model.review import Review, ReviewLike
 from app.model.users import Preferences, UserPreferences, Users
@@ -15,18 +16,23 @@ from app.schema.users import (
     BreadReportResponeDTO,
     UserProfileResponseDTO,
 )
-from app.utils.pagination import convert_limit_and_offset
+from app.utils.pagination import SortSpec, convert_limit_and_offset
+
+# 나의 리뷰 : 최신순
+USER_REVIEW_SORT = SortSpec(name="user_reviews", pk_column=Review.id)
+# 빵말정산 월별 항목 : 최신순
+BREAD_REPORT_SORT = SortSpec(name="bread_reports", pk_column=BreadReport.id)
 
 
 class UserRepository:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
     async def get_user_profile(self, user_id: int):
         """유저 프로필 조회 쿼리."""
 
-        res = (
-            self.db.query(
+        stmt = (
+            select(
                 Users.nickname,
                 Users.profile_img,
                 Badge.name.label("badge_name"),
@@ -35,10 +41,11 @@ class UserRepository:
             .select_from(UserBadge)
             .join(Badge, UserBadge.badge_id == Badge.id)
             .join(Users, Users.id == UserBadge.user_id)
-            .filter(UserBadge.user_id == user_id)
+            .where(UserBadge.user_id == user_id)
             .order_by(UserBadge.is_representative.desc(), UserBadge.id.asc())
-            .first()
+            .limit(1)
         )
+        res = (await self.db.execute(stmt)).first()
 
         if res:
             return UserProfileResponseDTO(
@@ -50,36 +57,36 @@ class UserRepository:
 
     async def delete_user(self, user_id: int):
         """회원 탈퇴하는 쿼리."""
-        self.db.query(Users).filter(Users.id == user_id).update(
-            {Users.is_active: False}
-        )
+        stmt = update(Users).where(Users.id == user_id).values(is_active=False)
+        await self.db.execute(stmt)
 
     async def restore_user(self, email: str):
         """회원 탈퇴 복구하는 쿼리."""
 
-        user = self.db.query(Users).filter(Users.email == email).first()
+        stmt = select(Users).where(Users.email == email)
+        user = (await self.db.execute(stmt)).scalars().first()
         if user:
             user.is_active = True
 
     async def find_user_by_nickname(self, nickname: str, user_id: int) -> bool:
         """nickname 조회하는 쿼리.."""
 
-        is_exist = (
-            self.db.query(Users.id)
-            .filter(Users.nickname == nickname, Users.id != user_id)
-            .first()
+        stmt = (
+            select(Users.id)
+            .where(Users.nickname == nickname, Users.id != user_id)
+            .limit(1)
         )
+        is_exist = (await self.db.execute(stmt)).first()
 
         return True if is_exist else False
 
     async def has_set_preferences(self, user_id: int) -> bool:
         """이미 취향설정 했는지에 대한 여부 조회하는 쿼리."""
 
-        has_set = (
-            self.db.query(Users.is_preferences_set)
-            .filter(Users.id == user_id, Users.is_preferences_set == True)
-            .first()
+        stmt = select(Users.is_preferences_set).where(
+            Users.id == user_id, Users.is_preferences_set == True
         )
+        has_set = (await self.db.execute(stmt)).first()
 
         return True if has_set else False
 
@@ -91,33 +98,66 @@ class UserRepository:
         # bulk insert할 데이터 가공
         maps = [{"user_id": user_id, "preference_id": pid} for pid in preference_ids]
 
-        user_preferences = inspect(UserPreferences)
-        self.db.bulk_insert_mappings(user_preferences, maps)
+        if maps:
+            await self.db.execute(insert(UserPreferences), maps)
 
     async def update_user_info(self, user_id: int, target_field):
         """유저 정보 수정하는 쿼리."""
 
-        user = self.db.query(Users).filter(Users.id == user_id).first()
+        stmt = select(Users).where(Users.id == user_id)
+        user = (await self.db.execute(stmt)).scalars().first()
         for key, value in target_field.items():
             setattr(user, key, value)
 
     async def update_preference_state(self, user_id: int):
         """취향설정 완료 상태 변경하는 쿼리."""
 
-        user = self.db.query(Users).filter(Users.id == user_id).first()
+        stmt = select(Users).where(Users.id == user_id)
+        user = (await self.db.execute(stmt)).scalars().first()
         if user:
             user.is_preferences_set = True
 
+    async def get_user_preference_ids(self, user_id: int) -> List[int]:
+        """유저 취향 id 목록 조회하는 쿼리."""
+
+        stmt = select(UserPreferences.preference_id).where(
+            UserPreferences.user_id == user_id
+        )
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def get_preference_user_ids(
+        self, after_user_id: int, limit: int, since: Optional[datetime] = None
+    ):
+        """취향설정한 유저 id를 after_user_id 이후로 limit개 조회하는 쿼리.
+
+        since가 있으면 그 이후 바뀐 빵집과 취향이 하나라도 겹치는 유저만 조회.
+        """
+
+        stmt = (
+            select(UserPreferences.user_id)
+            .distinct()
+            .where(UserPreferences.user_id > after_user_id)
+            .order_by(UserPreferences.user_id)
+            .limit(limit)
+        )
+        if since is not None:
+            changed_preference_ids = (
+                select(BakeryPreference.preference_id)
+                .join(Bakery, Bakery.id == BakeryPreference.bakery_id)
+                .where(Bakery.updated_at > since)
+            )
+            stmt = stmt.where(UserPreferences.preference_id.in_(changed_preference_ids))
+        return list((await self.db.execute(stmt)).scalars().all())
+
     async def get_user_preferences(self, user_id: int):
         """유저 취향 조회하는 쿼리."""
 
-        res = (
-            self.db.query(
-                UserPreferences.preference_id, Preferences.type, Preferences.name
-            )
+        stmt = (
+            select(UserPreferences.preference_id, Preferences.type, Preferences.name)
             .join(Preferences, Preferences.id == UserPreferences.preference_id)
-            .filter(UserPreferences.user_id == user_id)
-        ).all()
+            .where(UserPreferences.user_id == user_id)
+        )
+        res = (await self.db.execute(stmt)).all()
 
         return [
             {
@@ -134,12 +174,13 @@ class UserRepository:
         """유저 취향 제거하는 쿼리."""
 
         try:
-            self.db.query(UserPreferences).filter(
+            stmt = delete(UserPreferences).where(
                 UserPreferences.user_id == user_id,
                 UserPreferences.preference_id.in_(delete_preferences),
-            ).delete()
+            )
+            await self.db.execute(stmt)
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             raise UnknownException(detail=str(e))
 
     async def get_user_bread_report(
@@ -147,16 +188,16 @@ class UserRepository:
     ):
         """빵말정산 조회하는 쿼리."""
 
-        res = (
-            self.db.query(BreadReport)
-            .filter(
+        stmt = (
+            select(BreadReport)
+            .where(
                 BreadReport.user_id == user_id,
                 BreadReport.year.in_(target_years),
                 BreadReport.month.in_(target_months),
             )
             .order_by(desc(BreadReport.id))
-            .all()
         )
+        res = (await self.db.execute(stmt)).scalars().all()
 
         if res:
             return BreadReportResponeDTO(
@@ -179,15 +220,10 @@ class UserRepository:
     async def get_user_reviews(self, cursor_value: str, page_size: int, user_id: int):
         """나의 리뷰 조회하는 쿼리."""
 
-        filters = [Review.user_id == user_id]
+        filters = [Review.user_id == user_id, *USER_REVIEW_SORT.where(cursor_value)]
 
-        if cursor_value == "0":
-            filters.append(Review.id > cursor_value)
-        else:
-            filters.append(Review.id <= cursor_value)
-
-        res = (
-            self.db.query(
+        stmt = (
+            select(
                 Review.id,
                 Review.content,
                 Review.rating,
@@ -201,14 +237,13 @@ class UserRepository:
             .distinct(Review.id)
             .join(Bakery, Bakery.id == Review.bakery_id)
             .join(ReviewLike, ReviewLike.review_id == Review.id, isouter=True)
-            .filter(*filters)
-            .order_by(desc(Review.id))
-            .limit(limit=page_size + 1)
-            .all()
+            .where(*filters)
+            .order_by(*USER_REVIEW_SORT.order_by())
+            .limit(page_size + 1)
         )
+        res = (await self.db.execute(stmt)).all()
 
-        has_next = len(res) > page_size
-        next_cursor = str(res[-1].id) if has_next else None
+        next_cursor = USER_REVIEW_SORT.next_cursor(res, page_size)
 
         return next_cursor, [
             UserReview(
@@ -230,25 +265,23 @@ class UserRepository:
     ):
         """유저 빵말정산 항목 조회하는 쿼리."""
 
-        filters = [BreadReport.user_id == user_id]
-        if cursor_value == "0":
-            filters.append(BreadReport.id > cursor_value)
-        else:
-            filters.append(BreadReport.id <= cursor_value)
+        filters = [
+            BreadReport.user_id == user_id,
+            *BREAD_REPORT_SORT.where(cursor_value),
+        ]
 
-        res = (
-            self.db.query(BreadReport.id, BreadReport.year, BreadReport.month)
-            .filter(*filters)
-            .order_by(desc(BreadReport.id))
+        stmt = (
+            select(BreadReport.id, BreadReport.year, BreadReport.month)
+            .where(*filters)
+            .order_by(*BREAD_REPORT_SORT.order_by())
             .limit(page_size + 1)
-            .all()
         )
+        res = (await self.db.execute(stmt)).all()
 
         if not res:
             return None, []
 
-        has_next = len(res) > page_size
-        next_cursor = str(res[-1].id) if has_next else None
+        next_cursor = BREAD_REPORT_SORT.next_cursor(res, page_size)
 
         return next_cursor, [
             BreadReportMonthlyDTO(
@@ -261,20 +294,29 @@ class UserRepository:
     async def derepresent_badge_if_exist(self, user_id: int):
         """대표뱃지가 있을 경우 해지하는 쿼리."""
 
-        self.db.query(UserBadge).filter(
-            UserBadge.user_id == user_id, UserBadge.is_representative == True
-        ).update({UserBadge.is_representative: False})
+        stmt = (
+            update(UserBadge)
+            .where(UserBadge.user_id == user_id, UserBadge.is_representative == True)
+            .values(is_representative=False)
+        )
+        await self.db.execute(stmt)
 
     async def represent_badge(self, badge_id: int, user_id: int):
         """특정 뱃지를 대표뱃지로 설정하는 쿼리."""
 
-        self.db.query(UserBadge).filter(
-            UserBadge.user_id == user_id, UserBadge.badge_id == badge_id
-        ).update({UserBadge.is_representative: True})
+        stmt = (
+            update(UserBadge)
+            .where(UserBadge.user_id == user_id, UserBadge.badge_id == badge_id)
+            .values(is_representative=True)
+        )
+        await self.db.execute(stmt)
 
     async def derepresent_user_badge(self, badge_id: int, user_id: int):
         """특정 뱃지를 대표뱃지에서 해지하는 쿼리."""
 
-        self.db.query(UserBadge).filter(
-            UserBadge.user_id == user_id, UserBadge.badge_id == badge_id
-        ).update({UserBadge.is_representative: False})
+        stmt = (
+            update(UserBadge)
+            .where(UserBadge.user_id == user_id, UserBadge.badge_id == badge_id)
+            .values(is_representative=False)
+        )
+        await self.db.execute(stmt)
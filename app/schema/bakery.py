@@ -4,6 +4,7 @@ from typing import List, Optional
 from pydantic import BaseModel, Field
 
 from app.schema.common import Paging
+from app.schema.review import BakeryReviewReponseDTO
 
 
 class CommonBakery(BaseModel):
@@ -110,6 +111,13 @@ class BakeryDetailResponseDTO(BaseModel):
     menus: Optional[List[BakeryDetail]] = Field(default=[], description="베이커리 메뉴")
 
 
+class BakeryOverviewResponseDTO(BaseModel):
+    """베이커리 상세 화면 통합 응답 모델."""
+
+    detail: BakeryDetailResponseDTO = Field(..., description="베이커리 상세정보")
+    reviews: BakeryReviewReponseDTO = Field(..., description="첫 페이지 리뷰")
+
+
 class SimpleBakeryMenu(BaseModel):
     """리뷰 작성할 때, 조회되는 베이커리 메뉴"""
 
@@ -12,6 +12,12 @@ class ReviewMenu(BaseModel):
 
 class ReviewPhoto(BaseModel):
     img_url: str = Field(..., description="리뷰 사진")
+    thumb_url: Optional[str] = Field(
+        default=None, description="리뷰 사진 (작은 사이즈)"
+    )
+    detail_url: Optional[str] = Field(
+        default=None, description="리뷰 사진 (중간 사이즈)"
+    )
 
 
 class MyBakeryReview(BaseModel):
@@ -27,3 +27,24 @@ class SearchBakeryResponseDTO(BaseModel):
     next_cursor: Optional[str] = Field(
         default=None, description="다음페이지 조회를 위한 cursor_value 값"
     )
+
+
+class Suggestion(BaseModel):
+    """검색어 자동완성 항목"""
+
+    text: str = Field(..., description="자동완성 텍스트")
+    type: str = Field(
+        ...,
+        description="""
+    자동완성 종류\n
+    bakery : 빵집이름
+    menu : 메뉴이름
+    """,
+    )
+    bakery_id: Optional[int] = Field(
+        default=None, description="베이커리 id (type이 bakery인 경우만)"
+    )
+
+
+class SuggestResponseDTO(BaseModel):
+    items: List[Suggestion] = Field(default=[], description="자동완성 데이터")
@@ -3,13 +3,12 @@ from typing import Optional
 import httpx
 import jwt
 import redis
-import requests
-from sqlalchemy.orm.session import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import create_jwt_token
 from app.core.config import Configs
-from app.core.const import APPLE_PUBLIC_KEYS_URL
 from app.core.exception import UnknownException, WithdrawnMemberException
+from app.core.jwks import apple_jwks
 from app.model.users import Users
 from app.repositories.auth_repo import AuthRepository
 from app.repositories.badge_repo import BadgeRepository
@@ -22,7 +21,7 @@ configs = Configs()
 class AuthService:
     def __init__(
         self,
-        db: Optional[Session] = None,
+        db: Optional[AsyncSession] = None,
         redis: Optional[redis.Redis] = None,
     ):
         self.db = db
@@ -63,22 +62,15 @@ class AuthService:
             except httpx.RequestError as e:
                 raise UnknownException(detail=f"카카오 API 요청 중 오류 발생: {str(e)}")
 
-    def __decode_apple_token(self, id_token: str):
+    async def __decode_apple_token(self, id_token: str):
         """애플 토큰 decoding"""
 
-        # 1. 애플 공개키 가져오기
-        apple_pub_key = requests.get(APPLE_PUBLIC_KEYS_URL).json()["keys"]
-
-        # 2. 토큰 헤더에서 kid 추출
+        # 1. 토큰 헤더에서 kid 추출
         headers = jwt.get_unverified_header(id_token)
         kid = headers["kid"]
 
-        # kid가 일치하는 공개키 찾기
-        public_key = None
-        for key in apple_pub_key:
-            if key["kid"] == kid:
-                public_key = jwt.algorithms.RSAAlgorithm.from_jwk(key)
-                break
+        # 2. kid가 일치하는 애플 공개키 찾기 (캐시된 JWKS 사용)
+        public_key = await apple_jwks.get_key(kid)
 
         if not public_key:
             raise Exception("Apple public key not found")
@@ -109,7 +101,9 @@ class AuthService:
                 }
 
             elif login_type == "APPLE" and social_access_token and self.db:
-                social_data = self.__decode_apple_token(id_token=social_access_token)
+                social_data = await self.__decode_apple_token(
+                    id_token=social_access_token
+                )
                 social_id, email = social_data.get("sub"), social_data.get("email")
                 social_data = {"social_id": social_id, "email": email}
                 add_data = {
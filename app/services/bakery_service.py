@@ -1,29 +1,103 @@
-from sqlalchemy.orm.session import Session
-
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from typing import List, Optional
+
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.bakery_cache import BLOCK_DETAIL, BLOCK_MENUS, bakery_static_cache
+from app.core.cache import (
+    build_feed_cache_key,
+    evict_bakery_feeds,
+    get_cached_bakery_cards,
+    get_cached_feed,
+    set_cached_bakery_cards,
+    set_cached_feed,
+)
+from app.core.config import Configs
+from app.core.database import run_after_commit, start_session
 from app.core.exception import (
     AlreadyDislikedException,
     AlreadyLikedException,
+    InvalidCursorException,
+    InvalidSortParameterException,
     NotFoundException,
     UnknownException,
 )
+from app.core.job_lock import refresh_since_last_run, run_as_leader
+from app.core.popularity import mark_dirty_bakeries, take_dirty_bakeries
+from app.core.recent_view import (
+    clear_recent_views,
+    get_recent_views,
+    get_recent_views_bulk,
+    mark_dirty_users,
+    record_recent_view,
+    seed_recent_views,
+    take_dirty_users,
+)
+from app.core.schedule import operating_schedule
 from app.repositories.bakery_repo import BakeryRepository
+from app.repositories.user_repo import UserRepository
 from app.schema.bakery import (
     BakeryDetailResponseDTO,
+    BakeryOverviewResponseDTO,
     GuDongMenuBakeryResponseDTO,
     LoadMoreBakeryResponseDTO,
+    RecentViewedBakery,
+    RecommendBakery,
+    SimpleBakeryMenu,
     WrittenReview,
 )
 from app.schema.common import Paging
-from app.utils.converter import merge_menus_with_bakeries, to_cursor_str
+from app.services.review_service import Review
+from app.utils.converter import to_cursor_str
 from app.utils.date import get_now_by_timezone, get_today_end, get_today_start
 from app.utils.parser import build_sort_clause, parse_comma_to_list
 from app.utils.validator import validate_area_code
 
+config = Configs()
+logger = logging.getLogger("bread-api")
+
+# 한 번에 DB에 반영할 최근 조회 유저 수
+RECENT_VIEW_FLUSH_BATCH = 500
+# 한 주기에 인기 점수를 재계산할 찜/찜 해제 베이커리 수
+BAKERY_POPULARITY_DIRTY_BATCH = 5000
+# 한 번에 추천 빵집을 재계산할 유저 수
+RECOMMENDATION_REFRESH_BATCH = 500
+# 인기 점수 / 카드 / 추천 갱신 주기 사이에 커밋된 데이터를 놓치지 않도록 겹쳐서 조회
+BAKERY_POPULARITY_REFRESH_OVERLAP = timedelta(seconds=60)
+BAKERY_CARD_REFRESH_OVERLAP = timedelta(seconds=60)
+RECOMMENDATION_REFRESH_OVERLAP = timedelta(seconds=60)
+# 인스턴스 중 한 곳에서만 실행하는 주기적 작업 이름
+BAKERY_POPULARITY_JOB = "bakery_popularity_refresh"
+BAKERY_CARD_JOB = "bakery_card_refresh"
+RECOMMENDATION_JOB = "recommendation_refresh"
+
+recommend_bakeries_adapter = TypeAdapter(List[RecommendBakery])
+bakery_detail_adapter = TypeAdapter(BakeryDetailResponseDTO)
+bakery_card_adapter = TypeAdapter(RecentViewedBakery)
+simple_menus_adapter = TypeAdapter(List[SimpleBakeryMenu])
+
 
 class BakeryService:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
+    async def _refresh_open_status(
+        self, bakeries: List[RecommendBakery], now: datetime
+    ) -> List[RecommendBakery]:
+        """캐시된 빵집 목록의 영업상태를 현재시각 기준으로 갱신하는 메소드."""
+
+        open_statuses = await operating_schedule.get_open_statuses(
+            self.db, [b.bakery_id for b in bakeries], now
+        )
+        for b in bakeries:
+            b.open_status = open_statuses[b.bakery_id]
+        return bakeries
+
     async def get_recommend_bakeries_by_preference(self, area_code: str, user_id: int):
         """(홈) 유저의 취향이 반영된 빵집 조회하는 비즈니스 로직."""
 
@@ -33,14 +107,37 @@ class BakeryService:
             # 지역코드 유효성 체크
             validate_area_code(area_codes=area_codes)
             # 오늘 요일
-            target_day_of_week = get_now_by_timezone().weekday()
+            now = get_now_by_timezone()
+            target_day_of_week = now.weekday()
+
+            # 같은 취향 조합 + 지역 + 요일이면 결과가 같으므로 캐시 조회
+            preference_ids = await UserRepository(self.db).get_user_preference_ids(
+                user_id=user_id
+            )
+            cache_key = build_feed_cache_key(
+                feed="preference",
+                area_codes=area_codes,
+                target_day_of_week=target_day_of_week,
+                preference_ids=preference_ids,
+            )
+            cached = await get_cached_feed(cache_key, recommend_bakeries_adapter)
+            if cached is not None:
+                # 영업상태는 캐싱 시점이 아닌 현재시각 기준으로 다시 계산
+                return await self._refresh_open_status(cached, now)
 
             # 유저 취향 + 지역 기반으로 빵집 조회
-            return await BakeryRepository(self.db).get_bakeries_by_preference(
+            bakeries = await BakeryRepository(self.db).get_bakeries_by_preference(
                 area_codes=area_codes,
                 user_id=user_id,
-                target_day_of_week=target_day_of_week,
+                now=now,
+            )
+            await set_cached_feed(
+                cache_key,
+                recommend_bakeries_adapter,
+                bakeries,
+                bakery_ids=[b.bakery_id for b in bakeries],
             )
+            return bakeries
         except Exception as e:
             raise UnknownException(detail=str(e))
 
@@ -54,8 +151,8 @@ class BakeryService:
             area_codes = parse_comma_to_list(area_code)
             # 지역코드 유효성 체크
             validate_area_code(area_codes=area_codes)
-            # 오늘 요일
-            target_day_of_week = get_now_by_timezone().weekday()
+            # 현재시각 (영업상태 계산용)
+            now = get_now_by_timezone()
 
             # 베이커리 정보 조회
             bakery_repo = BakeryRepository(db=self.db)
@@ -64,24 +161,18 @@ class BakeryService:
                 page_size=page_size,
                 area_codes=area_codes,
                 user_id=user_id,
-                target_day_of_week=target_day_of_week,
+                now=now,
             )
 
             # 베이커리 조회결과 없을 때, 반환값
             if not bakeries:
                 return LoadMoreBakeryResponseDTO()
 
-            # 베이커리 시그니처 메뉴 정보 조회
-            menus = await bakery_repo.get_signature_menus(
-                bakery_ids=[b.bakery_id for b in bakeries]
-            )
-            # 베이커리 정보 + 시그니처 메뉴 정보 병합
-            bakery_infos = merge_menus_with_bakeries(bakeries=bakeries, menus=menus)
-            return LoadMoreBakeryResponseDTO(
-                items=bakery_infos, next_cursor=next_cursor
-            )
+            return LoadMoreBakeryResponseDTO(items=bakeries, next_cursor=next_cursor)
 
         except Exception as e:
+            if isinstance(e, (InvalidCursorException, InvalidSortParameterException)):
+                raise e
             raise UnknownException(detail=str(e))
 
     async def get_bakery_by_area(self, area_code: str, user_id: int):
@@ -91,11 +182,29 @@ class BakeryService:
             area_codes = parse_comma_to_list(area_code)
             # 지역코드 유효성 체크
             validate_area_code(area_codes=area_codes)
-            target_day_of_week = get_now_by_timezone().weekday()
+            now = get_now_by_timezone()
+            target_day_of_week = now.weekday()
 
-            return await BakeryRepository(self.db).get_bakery_by_area(
-                area_codes, target_day_of_week, user_id
+            cache_key = build_feed_cache_key(
+                feed="hot",
+                area_codes=area_codes,
+                target_day_of_week=target_day_of_week,
             )
+            cached = await get_cached_feed(cache_key, recommend_bakeries_adapter)
+            if cached is not None:
+                # 영업상태는 캐싱 시점이 아닌 현재시각 기준으로 다시 계산
+                return await self._refresh_open_status(cached, now)
+
+            bakeries = await BakeryRepository(self.db).get_bakery_by_area(
+                area_codes, now, user_id
+            )
+            await set_cached_feed(
+                cache_key,
+                recommend_bakeries_adapter,
+                bakeries,
+                bakery_ids=[b.bakery_id for b in bakeries],
+            )
+            return bakeries
         except Exception as e:
             raise UnknownException(detail=str(e))
 
@@ -108,14 +217,14 @@ class BakeryService:
             area_codes = parse_comma_to_list(area_code)
             # 지역코드 유효성 체크
             validate_area_code(area_codes=area_codes)
-            target_day_of_week = get_now_by_timezone().weekday()
+            now = get_now_by_timezone()
             bakery_repo = BakeryRepository(self.db)
 
             # 빵집 정보
             next_cursor, bakeries = await bakery_repo.get_more_hot_bakeries(
                 area_codes=area_codes,
                 user_id=user_id,
-                target_day_of_week=target_day_of_week,
+                now=now,
                 cursor_value=cursor_value,
                 page_size=page_size,
             )
@@ -123,67 +232,81 @@ class BakeryService:
             if not bakeries:
                 return LoadMoreBakeryResponseDTO()
 
-            # 빵 시그니처 메뉴 정보
-            menus = await bakery_repo.get_signature_menus(
-                bakery_ids=[b.bakery_id for b in bakeries]
-            )
-
-            bakery_infos = merge_menus_with_bakeries(bakeries=bakeries, menus=menus)
-
-            return LoadMoreBakeryResponseDTO(
-                items=bakery_infos, next_cursor=next_cursor
-            )
+            return LoadMoreBakeryResponseDTO(items=bakeries, next_cursor=next_cursor)
         except Exception as e:
+            if isinstance(e, (InvalidCursorException, InvalidSortParameterException)):
+                raise e
             raise UnknownException(detail=str(e))
 
     async def get_bakery_detail(self, user_id: int, bakery_id: int):
         """베이커리 상세 조회하는 비즈니스 로직."""
 
         bakery_repo = BakeryRepository(db=self.db)
-        target_day_of_week = get_now_by_timezone().weekday()
+        now = get_now_by_timezone()
 
         try:
-            # 1. 베이커리 정보 가져오기
-            bakery = await bakery_repo.get_bakery_detail(
-                bakery_id=bakery_id, target_day_of_week=target_day_of_week
+            # 1. 베이커리 정보/메뉴/썸네일/영업시간 가져오기 (캐시 우선)
+            bakery = await bakery_static_cache.get(
+                bakery_id=bakery_id,
+                block=BLOCK_DETAIL,
+                adapter=bakery_detail_adapter,
+                loader=lambda: bakery_repo.get_bakery_detail(
+                    bakery_id=bakery_id, now=now
+                ),
             )
 
             if not bakery:
                 raise NotFoundException(detail="해당 베이커리를 찾을 수 없습니다.")
 
-            # 2. 베이커리 메뉴 가져오기
-            menus = await bakery_repo.get_bakery_menu_detail(bakery_id=bakery_id)
-
-            # 3. 베이커리 썸네일 가져오기
-            photos = await bakery_repo.get_bakery_photos(bakery_id=bakery_id)
-
-            # 4. 베이커리 영업시간 가져오기
-            operating_hours = await bakery_repo.get_bakery_operating_hours(
-                bakery_id=bakery_id
+            # 2. 찜여부 조회
+            is_like = await bakery_repo.check_like_bakery(
+                user_id=user_id, bakery_id=bakery_id
             )
 
-            # 5. 최근 조회한 베이커리 테이블에 적재하기
-            await bakery_repo.insert_recent_viewed_bakeries(
-                user_id=user_id, bakery_id=bakery.bakery_id
+            # 2.1 최근 조회한 베이커리 기록 (redis에 쌓고 flusher가 DB 반영)
+            await record_recent_view(
+                user_id=user_id, bakery_id=bakery_id, viewed_at=time.time()
             )
 
-            return BakeryDetailResponseDTO(
-                **bakery.model_dump(
-                    exclude={"menus", "bakery_img_urls", "operating_hours"}
-                ),
-                menus=menus,
-                bakery_img_urls=photos,
-                operating_hours=operating_hours,
+            # 3. 유저/시간에 따라 바뀌는 값만 실시간으로 채우기
+            open_statuses = await operating_schedule.get_open_statuses(
+                self.db, [bakery_id], now
+            )
+            return bakery.model_copy(
+                update={"is_like": is_like, "open_status": open_statuses[bakery_id]}
             )
         except Exception as e:
             if isinstance(e, NotFoundException):
                 raise e
             raise UnknownException(detail=str(e))
 
+    async def get_bakery_overview(
+        self, user_id: int, bakery_id: int, page_size: int, sort_clause: str
+    ):
+        """베이커리 상세 화면에 필요한 상세정보 + 첫 페이지 리뷰 조회하는 비즈니스 로직."""
+
+        # 1. 베이커리 상세정보
+        detail = await self.get_bakery_detail(user_id=user_id, bakery_id=bakery_id)
+
+        # 2. 첫 페이지 리뷰
+        reviews = await Review(db=self.db).get_reviews_by_bakery_id(
+            user_id=user_id,
+            bakery_id=bakery_id,
+            cursor_value="0||0",
+            page_size=page_size,
+            sort_clause=sort_clause,
+        )
+
+        return BakeryOverviewResponseDTO(detail=detail, reviews=reviews)
+
     async def get_bakery_menus(self, bakery_id: int):
         try:
-            return await BakeryRepository(db=self.db).get_bakery_menus(
-                bakery_id=bakery_id
+            bakery_repo = BakeryRepository(db=self.db)
+            return await bakery_static_cache.get(
+                bakery_id=bakery_id,
+                block=BLOCK_MENUS,
+                adapter=simple_menus_adapter,
+                loader=lambda: bakery_repo.get_bakery_menus(bakery_id=bakery_id),
             )
         except Exception as e:
             raise UnknownException(detail=str(e))
@@ -194,14 +317,14 @@ class BakeryService:
         try:
             bakery_repo = BakeryRepository(db=self.db)
             sort_by, direction = build_sort_clause(sort_clause=sort_clause)
-            target_day_of_week = get_now_by_timezone().weekday()
+            now = get_now_by_timezone()
 
             # 1. 베이커리 검색
             next_cursor, bakeries = await bakery_repo.get_visited_bakery(
                 user_id=user_id,
                 sort_by=sort_by,
                 direction=direction,
-                target_day_of_week=target_day_of_week,
+                now=now,
                 cursor_value=cursor_value,
                 page_size=page_size,
             )
@@ -209,16 +332,10 @@ class BakeryService:
             if not bakeries:
                 return GuDongMenuBakeryResponseDTO()
 
-            # 2. 시그니처 메뉴 검색
-            menus = await bakery_repo.get_signature_menus(
-                bakery_ids=[b.bakery_id for b in bakeries]
-            )
-            bakery_info = merge_menus_with_bakeries(bakeries=bakeries, menus=menus)
-
-            return GuDongMenuBakeryResponseDTO(
-                items=bakery_info, next_cursor=next_cursor
-            )
+            return GuDongMenuBakeryResponseDTO(items=bakeries, next_cursor=next_cursor)
         except Exception as e:
+            if isinstance(e, (InvalidCursorException, InvalidSortParameterException)):
+                raise e
             print(str(e))
             raise UnknownException(detail=str(e))
 
@@ -247,34 +364,38 @@ class BakeryService:
         bakery_repo = BakeryRepository(db=self.db)
 
         try:
-            # 1. 이미 찜여부 체크하는 로직. ( 중복 찜 방지 차 )
-            is_liked = await bakery_repo.check_already_liked_bakery(
-                user_id=user_id,
-                bakery_id=bakery_id,
+            # 1. 해당 베이커리 찜하기 (이미 찜한 경우 insert 되지 않음)
+            is_liked = await bakery_repo.like_bakery(
+                user_id=user_id, bakery_id=bakery_id
             )
-            if is_liked:
+            # 2. 이미 찜여부 체크하는 로직. ( 중복 찜 방지 차 )
+            if not is_liked:
                 raise AlreadyLikedException()
-            # 2. 해당 베이커리 찜하기
-            await bakery_repo.like_bakery(user_id=user_id, bakery_id=bakery_id)
+            # 3. 인기 점수는 주기적 갱신에서 재계산되도록 표시
+            run_after_commit(self.db, lambda: mark_dirty_bakeries([bakery_id]))
+            # 4. 해당 베이커리가 포함된 피드 캐시 무효화
+            run_after_commit(self.db, lambda: evict_bakery_feeds([bakery_id]))
         except Exception as e:
             if isinstance(e, AlreadyLikedException):
                 raise e
             raise UnknownException(detail=str(e))
 
     async def dislike_bakery(self, user_id: int, bakery_id: int):
-        """베이커리 찜하는 비즈니스 로직."""
+        """베이커리 찜 해제하는 비즈니스 로직."""
         bakery_repo = BakeryRepository(db=self.db)
 
         try:
-            # 1. 이미 찜여부 체크하는 로직. ( 중복 찜 방지 차 )
-            is_disliked = await bakery_repo.check_already_disliked_bakery(
+            # 1. 해당 베이커리 찜 삭제 (이미 해제된 경우 delete 되지 않음)
+            is_disliked = await bakery_repo.dislike_bakery(
                 user_id=user_id, bakery_id=bakery_id
             )
+            # 2. 이미 찜 해제여부 체크하는 로직. ( 중복 해제 방지 차 )
             if not is_disliked:
                 raise AlreadyDislikedException()
-
-            # 2. 해당 베이커리 찜 삭제
-            await bakery_repo.dislike_bakery(user_id=user_id, bakery_id=bakery_id)
+            # 3. 인기 점수는 주기적 갱신에서 재계산되도록 표시
+            run_after_commit(self.db, lambda: mark_dirty_bakeries([bakery_id]))
+            # 4. 해당 베이커리가 포함된 피드 캐시 무효화
+            run_after_commit(self.db, lambda: evict_bakery_feeds([bakery_id]))
         except Exception as e:
             if isinstance(e, AlreadyDislikedException):
                 raise e
@@ -286,12 +407,12 @@ class BakeryService:
         """내가 찜한 빵집 조회하는 비즈니스 로직."""
         bakery_repo = BakeryRepository(db=self.db)
         sort_by, direction = build_sort_clause(sort_clause=sort_clause)
-        target_day_of_week = get_now_by_timezone().weekday()
+        now = get_now_by_timezone()
         try:
             # 1. 베이커리 조회
             next_cursor, bakeries = await bakery_repo.get_like_bakeries(
                 user_id=user_id,
-                target_day_of_week=target_day_of_week,
+                now=now,
                 sort_by=sort_by,
                 direction=direction,
                 cursor_value=cursor_value,
@@ -301,27 +422,49 @@ class BakeryService:
             if not bakeries:
                 return GuDongMenuBakeryResponseDTO()
 
-            # 2. 메뉴 조회
-            menus = await bakery_repo.get_signature_menus(
-                bakery_ids=[b.bakery_id for b in bakeries]
-            )
-
-            bakery_infos = merge_menus_with_bakeries(bakeries=bakeries, menus=menus)
-
-            return GuDongMenuBakeryResponseDTO(
-                items=bakery_infos, next_cursor=next_cursor
-            )
+            return GuDongMenuBakeryResponseDTO(items=bakeries, next_cursor=next_cursor)
         except Exception as e:
+            if isinstance(e, (InvalidCursorException, InvalidSortParameterException)):
+                raise e
             raise UnknownException(detail=str(e))
 
     async def get_recent_viewed_bakeries(self, user_id: int):
         """최근에 조회한 베이커리 조회하는 비즈니스 로직."""
 
+        bakery_repo = BakeryRepository(db=self.db)
+        now = get_now_by_timezone()
+
         try:
-            target_day_of_week = get_now_by_timezone().weekday()
-            return await BakeryRepository(db=self.db).get_recent_viewed_bakeries(
-                user_id=user_id, target_day_of_week=target_day_of_week
+            # 1. 최근 조회한 베이커리 목록 (redis에 없으면 DB에서 가져와서 채우기)
+            views = await get_recent_views(user_id=user_id)
+            if views is None:
+                views = await bakery_repo.get_recent_views(user_id=user_id)
+                await seed_recent_views(user_id=user_id, views=views)
+
+            bakery_ids = [bakery_id for bakery_id, _ in views]
+
+            # 2. 베이커리 카드 조회 (캐시에 없는 것만 DB 조회)
+            cards = await get_cached_bakery_cards(bakery_ids, bakery_card_adapter)
+            missing = [b for b in bakery_ids if b not in cards]
+            if missing:
+                loaded = {
+                    c.bakery_id: c
+                    for c in await bakery_repo.get_bakery_cards(
+                        bakery_ids=missing, now=now
+                    )
+                }
+                await set_cached_bakery_cards(loaded, bakery_card_adapter)
+                cards.update(loaded)
+
+            # 3. 영업상태는 실시간으로 채워서 최근 조회순으로 반환
+            open_statuses = await operating_schedule.get_open_statuses(
+                self.db, bakery_ids, now
             )
+            return [
+                cards[b].model_copy(update={"open_status": open_statuses[b]})
+                for b in bakery_ids
+                if b in cards
+            ]
         except Exception as e:
             raise UnknownException(str(e))
 
@@ -332,5 +475,175 @@ class BakeryService:
             await BakeryRepository(db=self.db).delete_recent_viewed_bakeries(
                 user_id=user_id
             )
+            await clear_recent_views(user_id=user_id)
         except Exception as e:
             raise UnknownException(str(e))
+
+
+async def flush_recent_views():
+    """redis에 쌓인 최근 조회한 베이커리를 DB에 반영하는 메소드."""
+
+    while True:
+        # 1. 반영할 유저 꺼내기
+        user_ids = await take_dirty_users(RECENT_VIEW_FLUSH_BATCH)
+        if not user_ids:
+            return
+
+        try:
+            # 2. 유저별 최근 조회 목록 DB 반영
+            views = await get_recent_views_bulk(user_ids)
+            async with start_session() as db:
+                await BakeryRepository(db=db).sync_recent_views(views)
+        except Exception:
+            # 3. 실패한 유저는 다음 주기에 다시 반영
+            await mark_dirty_users(user_ids)
+            raise
+
+
+async def flush_recent_views_periodically():
+    """최근 조회한 베이커리 주기적으로 DB에 반영하는 백그라운드 작업."""
+
+    while True:
+        try:
+            await flush_recent_views()
+        except Exception:
+            logger.exception("recent view flush failed")
+        await asyncio.sleep(config.RECENT_VIEW_FLUSH_SECONDS)
+
+
+async def refresh_recommendations(since: Optional[datetime] = None):
+    """추천 빵집 배치 단위로 재계산하는 메소드.
+
+    since 이후 별점/지역이 바뀐 빵집과 취향이 겹치는 유저만, 없으면 취향설정한 전체 유저.
+    (취향 변경은 저장할 때 바로 재계산)
+    """
+
+    last_user_id = 0
+    while True:
+        async with start_session() as db:
+            # 1. 재계산할 유저 조회
+            user_ids = await UserRepository(db=db).get_preference_user_ids(
+                after_user_id=last_user_id,
+                limit=RECOMMENDATION_REFRESH_BATCH,
+                since=since,
+            )
+            if not user_ids:
+                return
+
+            # 2. 유저별 추천 빵집 재계산 (배치마다 commit)
+            await BakeryRepository(db=db).refresh_user_recommendations(
+                user_ids=user_ids,
+                per_area_limit=config.RECOMMENDATION_PER_AREA_LIMIT,
+            )
+        last_user_id = user_ids[-1]
+
+
+async def refresh_recommendations_periodically():
+    """별점 변경이 반영되도록 주기적으로 추천 빵집 재계산하는 백그라운드 작업.
+
+    인스턴스 중 한 곳에서만 실행한다.
+    """
+
+    while True:
+        try:
+            await run_as_leader(
+                RECOMMENDATION_JOB,
+                config.RECOMMENDATION_REFRESH_SECONDS,
+                partial(
+                    refresh_since_last_run,
+                    RECOMMENDATION_JOB,
+                    refresh_recommendations,
+                    RECOMMENDATION_REFRESH_OVERLAP,
+                ),
+            )
+        except Exception:
+            logger.exception("recommendation refresh failed")
+        await asyncio.sleep(config.RECOMMENDATION_REFRESH_SECONDS)
+
+
+async def refresh_bakery_popularity(since: Optional[datetime] = None):
+    """베이커리 인기 점수 갱신하는 메소드. (since 이후 바뀐 베이커리만, 없으면 전체)"""
+
+    now = get_now_by_timezone()
+    # 1. 찜/찜 해제된 베이커리 꺼내기 (전체 갱신이어도 비워둔다)
+    dirty_ids = await take_dirty_bakeries(BAKERY_POPULARITY_DIRTY_BATCH)
+
+    try:
+        async with start_session() as db:
+            bakery_repo = BakeryRepository(db=db)
+
+            # 2. 변경된 베이커리 조회
+            bakery_ids = None
+            if since is not None:
+                changed_ids = await bakery_repo.get_popularity_changed_bakery_ids(
+                    since=since, now=now
+                )
+                bakery_ids = list({*changed_ids, *dirty_ids})
+
+            # 3. 인기 점수 재계산
+            await bakery_repo.refresh_bakery_popularity(now=now, bakery_ids=bakery_ids)
+    except Exception:
+        # 4. 실패한 베이커리는 다음 주기에 다시 반영
+        await mark_dirty_bakeries(dirty_ids)
+        raise
+
+
+async def refresh_bakery_popularity_periodically():
+    """주기적으로 바뀐 베이커리만 인기 점수 갱신하는 백그라운드 작업.
+
+    인스턴스 중 한 곳에서만 실행한다.
+    """
+
+    while True:
+        try:
+            await run_as_leader(
+                BAKERY_POPULARITY_JOB,
+                config.BAKERY_POPULARITY_REFRESH_SECONDS,
+                partial(
+                    refresh_since_last_run,
+                    BAKERY_POPULARITY_JOB,
+                    refresh_bakery_popularity,
+                    BAKERY_POPULARITY_REFRESH_OVERLAP,
+                ),
+            )
+        except Exception:
+            logger.exception("bakery popularity refresh failed")
+
+        await asyncio.sleep(config.BAKERY_POPULARITY_REFRESH_SECONDS)
+
+
+async def refresh_bakery_cards(since: Optional[datetime] = None):
+    """베이커리 카드 projection 갱신하는 메소드. (since 이후 바뀐 베이커리만, 없으면 전체)"""
+
+    async with start_session() as db:
+        bakery_repo = BakeryRepository(db=db)
+
+        bakery_ids = None
+        if since is not None:
+            bakery_ids = await bakery_repo.get_card_changed_bakery_ids(since=since)
+
+        await bakery_repo.refresh_bakery_cards(bakery_ids=bakery_ids)
+
+
+async def refresh_bakery_cards_periodically():
+    """주기적으로 바뀐 베이커리만 카드 projection 갱신하는 백그라운드 작업.
+
+    인스턴스 중 한 곳에서만 실행한다.
+    """
+
+    while True:
+        try:
+            await run_as_leader(
+                BAKERY_CARD_JOB,
+                config.BAKERY_CARD_REFRESH_SECONDS,
+                partial(
+                    refresh_since_last_run,
+                    BAKERY_CARD_JOB,
+                    refresh_bakery_cards,
+                    BAKERY_CARD_REFRESH_OVERLAP,
+                ),
+            )
+        except Exception:
+            logger.exception("bakery card refresh failed")
+
+        await asyncio.sleep(config.BAKERY_CARD_REFRESH_SECONDS)
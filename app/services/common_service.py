@@ -1,10 +1,10 @@
-from sqlalchemy.orm.session import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.common_repo import CommonRepository
 
 
 class CommonService:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
     async def get_area_code(self):
@@ -4,7 +4,7 @@ from operator import attrgetter, itemgetter
 from typing import List
 
 from pydantic import TypeAdapter
-from sqlalchemy.orm.session import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exception import UnknownException
 from app.repositories.notice_repo import NoticeRepository
@@ -12,7 +12,7 @@ from app.schema.notice import NoticeResponseDTO
 
 
 class NoticeService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     async def get_notices(self):
@@ -1,21 +1,53 @@
+import asyncio
 import json
+import logging
+import time
 from collections import defaultdict
 from typing import List, Optional
 
 from fastapi import File, UploadFile
-from sqlalchemy.orm.session import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.bakery_cache import bakery_static_cache
 from app.core.base import BaseResponse
+from app.core.cache import evict_bakery_cards, evict_bakery_feeds
+from app.core.config import Configs
+from app.core.database import run_after_commit, start_session
 from app.core.exception import (
     AlreadyDislikedException,
     AlreadyLikedException,
     DailyReviewLimitExceededExecption,
+    InvalidCursorException,
+    InvalidImageFileException,
+    InvalidSortParameterException,
     NotFoundException,
     UnknownException,
 )
+from app.core.image_queue import (
+    ack_review_image_job,
+    delete_review_image_blobs,
+    enqueue_review_image_job,
+    get_review_image_blobs,
+    new_review_image_worker_id,
+    pop_review_image_job,
+    register_review_image_worker,
+    release_review_image_worker,
+    requeue_review_image_job,
+    requeue_stale_review_image_jobs,
+    retry_or_dead_letter,
+)
+from app.core.review_like import (
+    buffer_review_like,
+    clear_flushing_likes,
+    get_buffered_like,
+    merge_buffered_review_likes,
+    parse_pending_likes,
+    take_pending_likes,
+)
 from app.model.badge import UserMetrics
 from app.model.review import Review as ReviewSchema
 from app.repositories.badge_repo import BadgeRepository
+from app.repositories.bakery_repo import BakeryRepository
 from app.repositories.review_repo import ReviewRepository
 from app.schema.common import Paging
 from app.schema.review import (
@@ -26,21 +58,22 @@ from app.schema.review import (
     ReviewMenu,
     ReviewPhoto,
 )
-from app.utils.converter import convert_img_to_webp, to_cursor_str
+from app.utils.converter import convert_images_to_webp, to_cursor_str
 from app.utils.date import get_now_by_timezone
-from app.utils.pagination import build_multi_cursor_filter, build_order_by
 from app.utils.parser import (
     build_select_columns_metrics_on_review,
     build_sort_clause,
     build_update_metrics_on_review,
-    parse_cursor_value,
 )
 from app.utils.upload import upload_multiple_to_supabase_storage
 from app.utils.validator import upload_image_file_validation
 
+config = Configs()
+logger = logging.getLogger("bread-api")
+
 
 class Review:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
     async def get_reviews_by_bakery_id(
@@ -92,7 +125,13 @@ class Review:
                 )
                 photo_maps = defaultdict(list)
                 for p in photos:
-                    photo_maps[p.review_id].append(ReviewPhoto(img_url=p.img_url))
+                    photo_maps[p.review_id].append(
+                        ReviewPhoto(
+                            img_url=p.img_url,
+                            thumb_url=p.thumb_url,
+                            detail_url=p.detail_url,
+                        )
+                    )
 
                 # 3. 리뷰한 베이커리 메뉴 조회
                 review_menus = await review_repo.get_my_review_menus_by_bakery_id(
@@ -102,6 +141,11 @@ class Review:
                 for r in review_menus:
                     review_menu_maps[r.review_id].append(ReviewMenu(menu_name=r.name))
 
+                # 4. 아직 DB에 반영되지 않은 좋아요 합치기
+                review_infos = await merge_buffered_review_likes(
+                    user_id=user_id, reviews=review_infos
+                )
+
                 return BakeryReviewReponseDTO(
                     avg_rating=avg_rating,
                     review_count=review_count,
@@ -118,6 +162,8 @@ class Review:
 
             return BakeryReviewReponseDTO()
         except Exception as e:
+            if isinstance(e, (InvalidCursorException, InvalidSortParameterException)):
+                raise e
             if isinstance(e, NotFoundException):
                 raise e
             raise UnknownException(detail=str(e))
@@ -145,7 +191,13 @@ class Review:
                 )
                 photo_maps = defaultdict(list)
                 for p in photos:
-                    photo_maps[p.review_id].append(ReviewPhoto(img_url=p.img_url))
+                    photo_maps[p.review_id].append(
+                        ReviewPhoto(
+                            img_url=p.img_url,
+                            thumb_url=p.thumb_url,
+                            detail_url=p.detail_url,
+                        )
+                    )
 
                 # 3. 리뷰한 베이커리 메뉴 조회
                 review_menus = await review_repo.get_my_review_menus_by_bakery_id(
@@ -155,6 +207,11 @@ class Review:
                 for r in review_menus:
                     review_menu_maps[r.review_id].append(ReviewMenu(menu_name=r.name))
 
+                # 4. 아직 DB에 반영되지 않은 좋아요 합치기
+                review_infos = await merge_buffered_review_likes(
+                    user_id=user_id, reviews=review_infos
+                )
+
                 return BakeryMyReviewReponseDTO(
                     next_cursor=next_cursor,
                     items=[
@@ -169,6 +226,8 @@ class Review:
 
             return BakeryMyReviewReponseDTO()
         except Exception as e:
+            if isinstance(e, (InvalidCursorException, InvalidSortParameterException)):
+                raise e
             raise UnknownException(detail=str(e))
 
     async def write_bakery_review(
@@ -197,6 +256,10 @@ class Review:
                 if reviewed_today:
                     raise DailyReviewLimitExceededExecption()
 
+            # 1.1 파일 첨부 시, 올바른 이미지 확장자인지 체크
+            if review_imgs:
+                upload_image_file_validation(img_list=review_imgs)
+
             # 2. consumed_menus 직렬화
             consumed_menus_json = json.loads(consumed_menus)
             # 3. menu_id값으로 -1이 있는 경우, 기타메뉴 insert
@@ -204,6 +267,10 @@ class Review:
                 consumed_menus_json = await review_repo.insert_extra_menu(
                     bakery_id=bakery_id, consumed_menus=consumed_menus_json
                 )
+                # 3.1 메뉴가 바뀌었으므로 베이커리 정적 데이터 캐시 버전 올리기
+                run_after_commit(
+                    self.db, lambda: bakery_static_cache.bump_version([bakery_id])
+                )
 
             # 4. 리뷰 데이터 insert
             target_day_of_week = get_now_by_timezone().weekday()
@@ -222,24 +289,16 @@ class Review:
             )
 
             # 6. 리뷰 개수 및 평점 update
-            # TODO Redis로 처리할 것
             await review_repo.update_avg_rating_and_review_count(
-                bakery_id=bakery_id, rating=rating, review_imgs=review_imgs
+                bakery_id=bakery_id, rating=rating
             )
-
-            # 7. 리뷰 이미지 insert
-            if review_imgs:
-                # 5.1 파일 첨부 시, 올바른 이미지 확장자인지 체크
-                upload_image_file_validation(img_list=review_imgs)
-                # 5.2 이미지 파일 중 webp 이외의 파일들을 webp 확장자로 변환
-                uploaded_files = await convert_img_to_webp(img_list=review_imgs)
-                # 5.3 이미지 파일 bucket 업로드
-                await upload_multiple_to_supabase_storage(files=uploaded_files)
-                # 5.4 이미지 파일 DB에 insert
-                filenames = [filename for _, filename in uploaded_files]
-                await review_repo.bulk_insert_review_imgs(
-                    review_id=review_id, filenames=filenames
-                )
+            # 리스트용 베이커리 카드의 평점/리뷰 개수도 같은 트랜잭션에서 갱신
+            await BakeryRepository(db=self.db).refresh_bakery_cards(
+                bakery_ids=[bakery_id]
+            )
+            # 6.1 평점/리뷰 개수가 바뀌었으므로 해당 베이커리가 포함된 피드/카드 캐시 무효화
+            run_after_commit(self.db, lambda: evict_bakery_feeds([bakery_id]))
+            run_after_commit(self.db, lambda: evict_bakery_cards([bakery_id]))
 
             # ----------------------------- 리뷰 | 소비한 빵 타입 metrics
             badge_repo = BadgeRepository(db=self.db)
@@ -270,48 +329,206 @@ class Review:
                 # 8.5 뱃지 적재
                 badge_ids = [c.badge_id for c in checked]
                 await badge_repo.achieve_badges(user_id=user_id, badge_ids=badge_ids)
+
+            # 9. 리뷰 이미지 큐 적재 (백그라운드로 변환/업로드/insert)
+            # commit 전에 적재해서 redis 장애시 리뷰도 롤백되도록 한다.
+            # commit 전에 꺼낸 작업은 워커가 리뷰가 보일 때까지 다시 큐에 넣는다.
+            if review_imgs:
+                images = [(await img.read(), img.filename) for img in review_imgs]
+                await enqueue_review_image_job(review_id, images)
+
+            if checked:
                 return checked
         except Exception as e:
             if isinstance(e, DailyReviewLimitExceededExecption):
                 raise e
+            if isinstance(e, InvalidImageFileException):
+                raise e
             raise UnknownException(detail=str(e))
 
     async def like_review(self, user_id: int, review_id: int):
-        """리뷰 좋아요를 하는 비즈니스 로직."""
-
-        review_repo = ReviewRepository(db=self.db)
+        """리뷰 좋아요를 하는 비즈니스 로직. (버퍼에 기록 후 flusher가 DB 반영)"""
 
         try:
-            # 1. 이미 리뷰에 대한 좋아요 여부 체크
-            review = await review_repo.check_like_review(
-                user_id=user_id, review_id=review_id
+            # 1. 리뷰 좋아요 버퍼에 기록
+            changed = await self._buffer_review_like(
+                user_id=user_id, review_id=review_id, is_like=True
             )
-            if review:
+            # 2. 이미 리뷰에 대한 좋아요 여부 체크
+            if not changed:
                 raise AlreadyLikedException()
-            # 2. 리뷰 좋아여
-            await review_repo.like_review(user_id=user_id, review_id=review_id)
-            # 3. 베이커리의 리뷰 개수 update
-            await review_repo.update_like_review(review_id=review_id, count_value=1)
         except Exception as e:
             if isinstance(e, AlreadyLikedException):
                 raise e
+            if isinstance(e, NotFoundException):
+                raise e
             raise UnknownException(detail=str(e))
 
     async def dislike_review(self, user_id: int, review_id: int):
-        review_repo = ReviewRepository(db=self.db)
+        """리뷰 좋아요 해지하는 비즈니스 로직. (버퍼에 기록 후 flusher가 DB 반영)"""
 
         try:
-            # 1. 이미 리뷰에 대한 좋아요 해지여부 체크
-            review = await review_repo.check_dislike_review(
-                user_id=user_id, review_id=review_id
+            # 1. 리뷰 좋아요 해지 버퍼에 기록
+            changed = await self._buffer_review_like(
+                user_id=user_id, review_id=review_id, is_like=False
             )
-            if not review:
+            # 2. 이미 리뷰에 대한 좋아요 해지여부 체크
+            if not changed:
                 raise AlreadyDislikedException()
-            # 2. 리뷰 좋아요 해지
-            await review_repo.dislike_review(user_id=user_id, review_id=review_id)
-            # 3. 베이커리의 리뷰 개수 update
-            await review_repo.update_like_review(review_id=review_id, count_value=-1)
         except Exception as e:
             if isinstance(e, AlreadyDislikedException):
                 raise e
+            if isinstance(e, NotFoundException):
+                raise e
             raise UnknownException(detail=str(e))
+
+    async def _buffer_review_like(self, user_id: int, review_id: int, is_like: bool):
+        """좋아요 상태를 버퍼에 기록하는 메소드. (상태가 바뀌지 않으면 False)"""
+
+        # 1. 버퍼에 상태가 있으면 DB 조회 생략
+        db_is_like = await get_buffered_like(user_id=user_id, review_id=review_id)
+        if db_is_like is None:
+            db_is_like = await ReviewRepository(db=self.db).get_review_like_state(
+                user_id=user_id, review_id=review_id
+            )
+            if db_is_like is None:
+                raise NotFoundException(detail="해당 리뷰를 찾을 수 없습니다.")
+
+        # 2. 상태가 바뀌는 경우에만 좋아요 상태/개수 증감값 기록
+        return await buffer_review_like(
+            user_id=user_id,
+            review_id=review_id,
+            is_like=is_like,
+            db_is_like=db_is_like,
+        )
+
+
+async def flush_review_likes():
+    """버퍼에 쌓인 리뷰 좋아요를 DB에 한 번에 반영하는 메소드."""
+
+    # 1. 반영할 버퍼 가져오기
+    pending = await take_pending_likes()
+    if not pending:
+        return
+
+    # 2. review_likes insert/delete 및 like_count 증감
+    likes, unlikes = parse_pending_likes(pending)
+    async with start_session() as db:
+        await ReviewRepository(db=db).apply_review_likes(likes=likes, unlikes=unlikes)
+
+    # 3. 반영 완료된 버퍼 삭제
+    await clear_flushing_likes()
+
+
+async def flush_review_likes_periodically():
+    """리뷰 좋아요 버퍼 주기적으로 DB에 반영하는 백그라운드 작업."""
+
+    while True:
+        try:
+            await flush_review_likes()
+        except Exception:
+            logger.exception("review like flush failed")
+        await asyncio.sleep(config.REVIEW_LIKE_FLUSH_SECONDS)
+
+
+async def process_review_image_job(job: dict) -> bool:
+    """리뷰 이미지 후처리 작업. (webp 변환 -> 버킷 업로드 -> 리뷰 이미지 insert)
+
+    같은 작업이 다시 처리되어도 이미지가 중복 저장되지 않는다.
+    리뷰가 아직 commit 되지 않아서 나중에 다시 처리해야 하면 False 반환.
+    """
+
+    review_id = job["review_id"]
+
+    # 1. 리뷰 / 이미지 저장 여부 확인
+    async with start_session() as db:
+        has_photo = await ReviewRepository(db=db).get_review_photo_state(review_id)
+    if has_photo is None:
+        # commit 전에 꺼낸 작업이면 다시 처리, 오래됐으면 롤백된 리뷰이므로 버림
+        enqueued_at = job.get("enqueued_at", 0)
+        if time.time() - enqueued_at < config.REVIEW_IMAGE_COMMIT_GRACE_SECONDS:
+            return False
+        logger.warning(f"review image job dropped (no review) : {review_id}")
+        await delete_review_image_blobs(job)
+        return True
+
+    if not has_photo:
+        # 2. 원본 이미지 조회
+        images = await get_review_image_blobs(job)
+        if images is None:
+            raise UnknownException(detail="리뷰 이미지 원본이 만료되었습니다.")
+
+        # 3. 이미지 파일 사이즈별(thumb/detail/full) webp로 변환
+        variants = await convert_images_to_webp(images)
+        # 4. 이미지 파일 bucket 업로드
+        await upload_multiple_to_supabase_storage(
+            files=[f for v in variants for f in v.values()]
+        )
+        # 5. 이미지 파일 DB에 insert (다른 워커가 먼저 저장했으면 건너뜀)
+        filenames = [
+            {name: filename for name, (_, filename) in v.items()} for v in variants
+        ]
+        async with start_session() as db:
+            review_repo = ReviewRepository(db=db)
+            if await review_repo.get_review_photo_state(review_id) is False:
+                await review_repo.bulk_insert_review_imgs(
+                    review_id=review_id, filenames=filenames
+                )
+
+    # 6. 원본 삭제
+    # insert 까지 끝난 작업이므로 실패해도 재시도하지 않는다.
+    # 원본은 REVIEW_IMAGE_BLOB_TTL 이 지나면 만료된다.
+    try:
+        await delete_review_image_blobs(job)
+    except Exception:
+        logger.exception(f"review image blob cleanup failed : {review_id}")
+    return True
+
+
+async def run_review_image_worker():
+    """리뷰 이미지 후처리 큐 소비하는 백그라운드 작업.
+
+    작업은 처리중 목록으로 옮겨서 꺼내고 처리가 끝난 뒤에 지운다. (ack)
+    죽은 워커의 처리중 작업은 시작할 때 큐로 되돌리고,
+    종료(cancel)될 때는 자기 처리중 작업을 큐로 되돌린다.
+    """
+
+    worker_id = new_review_image_worker_id()
+    try:
+        await register_review_image_worker(worker_id)
+        await requeue_stale_review_image_jobs()
+    except Exception:
+        logger.exception("review image worker register failed")
+
+    try:
+        while True:
+            try:
+                await register_review_image_worker(worker_id)
+                popped = await pop_review_image_job(worker_id, timeout=5)
+            except Exception:
+                logger.exception("review image job pop failed")
+                await asyncio.sleep(1)
+                continue
+
+            if popped is None:
+                continue
+
+            raw, job = popped
+            try:
+                if await process_review_image_job(job):
+                    await ack_review_image_job(worker_id, raw)
+                else:
+                    # 리뷰 commit 대기 (attempts 증가 없이 다시 적재)
+                    await asyncio.sleep(1)
+                    await requeue_review_image_job(worker_id, raw, job)
+            except Exception as e:
+                logger.exception(f"review image job failed : {job['review_id']}")
+                try:
+                    await retry_or_dead_letter(worker_id, raw, job, reason=str(e))
+                except Exception:
+                    logger.exception(f"review image job requeue failed : {job}")
+    finally:
+        try:
+            await release_review_image_worker(worker_id)
+        except Exception:
+            logger.exception(f"review image worker release failed : {worker_id}")
@@ -1,16 +1,43 @@
-from sqlalchemy.orm import Session
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from typing import List, Optional
 
-from app.core.exception import UnknownException
-from app.repositories.bakery_repo import BakeryRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import Configs
+from app.core.database import start_session
+from app.core.exception import (
+    InvalidCursorException,
+    InvalidSortParameterException,
+    UnknownException,
+)
+from app.core.job_lock import refresh_since_last_run, run_as_leader
+from app.core.suggest import suggest_index
+from app.core.suggest_changes import (
+    SUGGEST_CHANGED_RETENTION_SECONDS,
+    get_suggest_changes,
+    record_suggest_changes,
+)
 from app.repositories.search_repo import SearchRepository
 from app.schema.common import Paging
-from app.schema.search import SearchBakeryResponseDTO
-from app.utils.converter import merge_menus_with_bakeries, to_cursor_str
+from app.schema.search import SearchBakeryResponseDTO, Suggestion, SuggestResponseDTO
+from app.utils.converter import to_cursor_str
 from app.utils.date import get_now_by_timezone
 
+config = Configs()
+logger = logging.getLogger("bread-api")
+
+# 갱신 중에 바뀐 데이터를 놓치지 않도록 이전 갱신 시작시각보다 조금 앞에서부터 조회
+SEARCH_DOCUMENT_REFRESH_OVERLAP = timedelta(seconds=60)
+# 인스턴스 중 한 곳에서만 실행하는 주기적 작업 이름
+SEARCH_DOCUMENT_JOB = "search_document_refresh"
+
 
 class SearchService:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
     async def search_bakeries_by_keyword(
@@ -20,14 +47,14 @@ class SearchService:
 
         try:
             # 1. 베이커리 검색
-            target_day_of_week = get_now_by_timezone().weekday()
+            now = get_now_by_timezone()
 
             next_cursor, bakeries = await SearchRepository(
                 db=self.db
             ).search_bakeries_by_keyword(
                 keyword=keyword,
                 user_id=user_id,
-                target_day_of_week=target_day_of_week,
+                now=now,
                 cursor_value=cursor_value,
                 page_size=page_size,
             )
@@ -35,12 +62,101 @@ class SearchService:
             if not bakeries:
                 return SearchBakeryResponseDTO()
 
-            # 2. 베이커리 메뉴 검색
-            menus = await BakeryRepository(db=self.db).get_signature_menus(
-                bakery_ids=[b.bakery_id for b in bakeries]
-            )
+            return SearchBakeryResponseDTO(items=bakeries, next_cursor=next_cursor)
+        except Exception as e:
+            if isinstance(e, (InvalidCursorException, InvalidSortParameterException)):
+                raise e
+            raise UnknownException(detail=str(e))
+
+    async def refresh_search_documents(
+        self,
+        since: Optional[datetime] = None,
+        bakery_ids: Optional[List[int]] = None,
+    ):
+        """베이커리 검색 문서 갱신하는 비즈니스 로직.
+
+        since가 있으면 그 이후 바뀐 베이커리만, 둘 다 없으면 전체 갱신.
+        바뀐 베이커리는 인스턴스마다 자동완성 색인에 반영하도록 기록한다.
+        """
+
+        search_repo = SearchRepository(db=self.db)
+
+        if bakery_ids is None and since is not None:
+            bakery_ids = await search_repo.get_bakery_ids_changed_since(since=since)
+
+        await search_repo.upsert_search_documents(bakery_ids=bakery_ids)
+        # 전체 갱신은 인스턴스마다 시작할 때 색인 전체를 만들므로 기록하지 않음
+        if bakery_ids:
+            await record_suggest_changes(bakery_ids)
+
+    async def refresh_suggest_index(self, since: Optional[float] = None):
+        """이 인스턴스의 자동완성 색인 갱신하는 비즈니스 로직.
+
+        since (unix time) 이후 기록된 베이커리만, 없으면 전체 갱신.
+        """
+
+        search_repo = SearchRepository(db=self.db)
+
+        if since is None or since < time.time() - SUGGEST_CHANGED_RETENTION_SECONDS:
+            suggest_index.replace_all(await search_repo.get_suggest_sources())
+            return
 
-            bakery_info = merge_menus_with_bakeries(bakeries=bakeries, menus=menus)
-            return SearchBakeryResponseDTO(items=bakery_info, next_cursor=next_cursor)
+        bakery_ids = await get_suggest_changes(since=since)
+        if bakery_ids:
+            sources = await search_repo.get_suggest_sources(bakery_ids=bakery_ids)
+            suggest_index.update(bakery_ids, sources)
+
+    @staticmethod
+    def get_suggestions(keyword: str, size: int) -> SuggestResponseDTO:
+        """검색어 자동완성 비즈니스 로직. (DB 조회 없이 메모리 색인에서 조회)"""
+
+        try:
+            return SuggestResponseDTO(
+                items=[
+                    Suggestion(text=e.text, type=e.type, bakery_id=e.bakery_id)
+                    for e in suggest_index.search(keyword=keyword, size=size)
+                ]
+            )
         except Exception as e:
             raise UnknownException(detail=str(e))
+
+
+async def refresh_search_documents(since: Optional[datetime] = None):
+    """베이커리 검색 문서 갱신하는 메소드. (since 이후 바뀐 베이커리만, 없으면 전체)"""
+
+    async with start_session() as db:
+        await SearchService(db=db).refresh_search_documents(since=since)
+
+
+async def refresh_search_documents_periodically():
+    """주기적으로 바뀐 베이커리만 검색 문서/자동완성 색인 갱신하는 백그라운드 작업.
+
+    검색 문서(DB)는 인스턴스 중 한 곳에서만 갱신하고,
+    자동완성 색인(메모리)은 인스턴스마다 기록된 베이커리를 가져가서 반영한다.
+    """
+
+    since = None
+    while True:
+        started_at = time.time()
+        try:
+            await run_as_leader(
+                SEARCH_DOCUMENT_JOB,
+                config.SEARCH_DOCUMENT_REFRESH_SECONDS,
+                partial(
+                    refresh_since_last_run,
+                    SEARCH_DOCUMENT_JOB,
+                    refresh_search_documents,
+                    SEARCH_DOCUMENT_REFRESH_OVERLAP,
+                ),
+            )
+        except Exception:
+            logger.exception("search document refresh failed")
+
+        try:
+            async with start_session() as db:
+                await SearchService(db=db).refresh_suggest_index(since=since)
+            since = started_at - SEARCH_DOCUMENT_REFRESH_OVERLAP.total_seconds()
+        except Exception:
+            logger.exception("suggest index refresh failed")
+
+        await asyncio.sleep(config.SEARCH_DOCUMENT_REFRESH_SECONDS)
@@ -1,17 +1,25 @@
 import asyncio
-import math
+import logging
 import random
-import ssl
 from datetime import datetime
+from functools import partial
 from typing import List, Optional
 
 import httpx
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Configs
 from app.core.exception import UnknownException
+from app.core.http import request
+from app.core.job_lock import run_as_leader
+from app.core.tour_cache import (
+    build_tour_cache_key,
+    get_tour_items,
+    refresh_tour_items,
+)
 from app.schema.tour import EventPopupResponseDTO, TourResponseDTO
 from app.utils.converter import (
+    AREA_TO_SIGUNGU,
     area_to_sigungu,
     replace_space_with_plus,
     transform_tour_response,
@@ -20,6 +28,17 @@ from app.utils.date import get_now_by_timezone
 from app.utils.parser import parse_comma_to_list
 
 config = Configs()
+logger = logging.getLogger("bread-api")
+
+FESTIVAL_ENDPOINT = "searchFestival2"
+TOUR_ENDPOINT = "areaBasedList2"
+# 전체 지역(14)은 시.군구 코드 없이 조회
+ALL_SIGUNGU = 14
+
+# 관광공사 API 정상 응답 코드
+TOUR_RESULT_OK = "0000"
+# 인스턴스 중 한 곳에서만 실행하는 주기적 작업 이름
+TOUR_CACHE_JOB = "tour_cache_prewarm"
 
 CAT_CODE = {
     "A01": "자연",
@@ -30,21 +49,38 @@ CAT_CODE = {
 }
 
 
+def check_tour_response(r: httpx.Response) -> dict:
+    """관광공사 API 응답이 정상인지 확인하고 body 반환하는 메소드.
+
+    호출 한도 초과 / 인증 오류 등은 items 없이 오거나 XML로 내려오므로,
+    빈 목록으로 캐시를 덮어쓰지 않도록 예외를 발생시킨다.
+    """
+
+    if r.status_code != 200:
+        raise UnknownException(detail=f"tour api http error : {r.status_code}")
+
+    try:
+        res = r.json()
+        header = res["response"]["header"]
+    except (ValueError, KeyError, TypeError):
+        raise UnknownException(detail=f"tour api invalid response : {r.text[:200]}")
+
+    code, message = header.get("resultCode"), header.get("resultMsg")
+    if code != TOUR_RESULT_OK:
+        raise UnknownException(detail=f"tour api error : {code} {message}")
+    return res
+
+
 class TourService:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
     @staticmethod
     async def request_with_ssl(method: str, url: str, params: Optional[dict] = None):
-        """SSL context를 설정한 AsyncClient 요청용 공통 메소드."""
-
-        ssl_context = ssl.create_default_context()
-        ssl_context.set_ciphers("DEFAULT")
+        """공용 AsyncClient(keep-alive 커넥션 재사용)로 요청하는 공통 메소드."""
 
-        async with httpx.AsyncClient(verify=ssl_context) as client:
-            if method == "GET":
-                r = await client.get(url=url, params=params)
-                return r.json()
+        r = await request(method=method, url=url, params=params)
+        return check_tour_response(r)
 
     @staticmethod
     def __filter_events_today(events: List):
@@ -92,11 +128,11 @@ class TourService:
 
         return random.sample(only_img_exist, 5)
 
-    async def get_area_event(self, area_code: str):
-        """지역행사 조회하는 API"""
-        sigungu_codes = area_to_sigungu(area_code)
+    @classmethod
+    async def fetch_festivals(cls, sigungu: int) -> List[dict]:
+        """시.군구 지역행사 조회하는 관광공사 API 호출 메소드."""
 
-        param_base = {
+        params = {
             "numOfRows": 10,
             "pageNo": 1,
             "MobileOS": "ETC",
@@ -106,27 +142,57 @@ class TourService:
             "serviceKey": config.ORG_TOUR_SECRET_KEY,
             "_type": "json",
         }
+        if sigungu != ALL_SIGUNGU:
+            params["sigunguCode"] = sigungu
+
+        res = await cls.request_with_ssl(
+            method="GET",
+            url=f"{config.REQ_URL_DOMAIN}/{FESTIVAL_ENDPOINT}",
+            params=params,
+        )
+        return transform_tour_response(response=[res], transformed_r=[])
+
+    @classmethod
+    async def fetch_tours(cls, sigungu: int, cat: str) -> List[dict]:
+        """시.군구 + 카테고리별 관광지 조회하는 관광공사 API 호출 메소드."""
+
+        params = {
+            "numOfRows": config.TOUR_CACHE_ROWS,
+            "pageNo": 1,
+            "MobileOS": "ETC",
+            "MobileApp": "bread-pilgrim",
+            "areaCode": 6,
+            "serviceKey": config.ORG_TOUR_SECRET_KEY,
+            "_type": "json",
+            "cat1": cat,
+        }
+        if sigungu != ALL_SIGUNGU:
+            params["sigunguCode"] = sigungu
+
+        res = await cls.request_with_ssl(
+            method="GET",
+            url=f"{config.REQ_URL_DOMAIN}/{TOUR_ENDPOINT}",
+            params=params,
+        )
+        return transform_tour_response(response=[res], transformed_r=[])
+
+    async def get_area_event(self, area_code: str):
+        """지역행사 조회하는 API"""
+        sigungu_codes = area_to_sigungu(area_code)
 
         try:
+            # 시.군구별 캐시 조회 (없으면 API 호출)
             task = [
-                self.request_with_ssl(
-                    method="GET",
-                    url=f"{config.REQ_URL_DOMAIN}/searchFestival2",
-                    params=(
-                        param_base
-                        if area_code == "14"
-                        else {
-                            **param_base,
-                            "sigunguCode": s,
-                        }
-                    ),
+                get_tour_items(
+                    key=build_tour_cache_key(FESTIVAL_ENDPOINT, s),
+                    fetcher=partial(self.fetch_festivals, s),
                 )
                 for s in sigungu_codes
             ]
 
             res = await asyncio.gather(*task)
-            transformed_r = transform_tour_response(response=res, transformed_r=[])
-            return self.__filter_events_today(transformed_r) if transformed_r else None
+            events = [e for r in res for e in r]
+            return self.__filter_events_today(events) if events else None
         except Exception as e:
             raise UnknownException(detail=str(e))
 
@@ -137,38 +203,66 @@ class TourService:
         sigungu_codes = area_to_sigungu(area_code)
         # 다중 관광지 카테고리 리스트로 변환
         tour_cats = parse_comma_to_list(tour_cat)
-        combos = [(s, c) for s in sigungu_codes for c in tour_cats]
-
-        print("combos", combos, math.ceil(40 / len(combos)))
-
-        params_base = {
-            "numOfRows": math.ceil(20 / len(combos)),
-            "pageNo": 1,
-            "MobileOS": "ETC",
-            "MobileApp": "bread-pilgrim",
-            "areaCode": 6,
-            "serviceKey": config.ORG_TOUR_SECRET_KEY,
-            "_type": "json",
-        }
 
         try:
-            task = []
-            for s in sigungu_codes:
-                for cat in tour_cats:
-                    param = {**params_base, "cat1": cat}
-                    if area_code != "14":
-                        param["sigunguCode"] = s
-                    task.append(
-                        self.request_with_ssl(
-                            method="GET",
-                            url=f"{config.REQ_URL_DOMAIN}/areaBasedList2",
-                            params=param,
-                        )
-                    )
+            # 시.군구 + 카테고리별 캐시 조회 (없으면 API 호출)
+            task = [
+                get_tour_items(
+                    key=build_tour_cache_key(TOUR_ENDPOINT, s, cat),
+                    fetcher=partial(self.fetch_tours, s, cat),
+                )
+                for s in sigungu_codes
+                for cat in tour_cats
+            ]
 
             res = await asyncio.gather(*task)
-            transformed_r = transform_tour_response(response=res, transformed_r=[])
-            return self.__proceed_tour_data(transformed_r) if transformed_r else []
+            tours = [t for r in res for t in r]
+            return self.__proceed_tour_data(tours) if tours else []
 
         except Exception as e:
             raise UnknownException(detail=str(e))
+
+
+async def prewarm_tour_cache():
+    """전체 시.군구 + 카테고리 관광공사 데이터 캐시 미리 적재하는 메소드."""
+
+    sigungu_codes = {s for codes in AREA_TO_SIGUNGU.values() for s in codes}
+    sigungu_codes.add(ALL_SIGUNGU)
+
+    task = []
+    for s in sigungu_codes:
+        task.append(
+            refresh_tour_items(
+                key=build_tour_cache_key(FESTIVAL_ENDPOINT, s),
+                fetcher=partial(TourService.fetch_festivals, s),
+            )
+        )
+        for cat in CAT_CODE:
+            task.append(
+                refresh_tour_items(
+                    key=build_tour_cache_key(TOUR_ENDPOINT, s, cat),
+                    fetcher=partial(TourService.fetch_tours, s, cat),
+                )
+            )
+
+    res = await asyncio.gather(*task, return_exceptions=True)
+    failed = [r for r in res if isinstance(r, Exception)]
+    if failed:
+        logger.warning(f"tour cache prewarm failed : {len(failed)}/{len(res)}")
+
+
+async def refresh_tour_cache_periodically():
+    """주기적으로 관광공사 데이터 캐시 갱신하는 백그라운드 작업.
+
+    캐시는 redis에 공유되므로 인스턴스 중 한 곳에서만 실행한다.
+    """
+
+    while True:
+        try:
+            await run_as_leader(
+                TOUR_CACHE_JOB, config.TOUR_CACHE_REFRESH_SECONDS, prewarm_tour_cache
+            )
+        except Exception:
+            logger.exception("tour cache prewarm failed")
+
+        await asyncio.sleep(config.TOUR_CACHE_REFRESH_SECONDS)
@@ -1,13 +1,18 @@
 from collections import defaultdict
 from datetime import datetime
 
-from sqlalchemy.orm.session import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import Configs
 from app.core.exception import (
     DuplicateException,
+    InvalidCursorException,
+    InvalidSortParameterException,
     RequestDataMissingException,
     UnknownException,
 )
+from app.core.review_like import merge_buffered_review_likes
+from app.repositories.bakery_repo import BakeryRepository
 from app.repositories.review_repo import ReviewRepository
 from app.repositories.user_repo import UserRepository
 from app.schema.review import ReviewMenu, ReviewPhoto, UserReview, UserReviewReponseDTO
@@ -22,9 +27,11 @@ from app.schema.users import (
 )
 from app.utils.date import get_now_by_timezone
 
+config = Configs()
+
 
 class UserService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     async def get_user_profile(self, user_id: int):
@@ -96,6 +103,11 @@ class UserService:
 
             # 5. 취향설정 완료여부 변경
             await user_repo.update_preference_state(user_id=user_id)
+
+            # 6. 취향기반 추천 빵집 계산
+            await BakeryRepository(db=self.db).refresh_user_recommendations(
+                user_ids=[user_id], per_area_limit=config.RECOMMENDATION_PER_AREA_LIMIT
+            )
         except Exception as e:
             if isinstance(e, DuplicateException):
                 raise e
@@ -193,6 +205,11 @@ class UserService:
                 await user_repo.bulk_insert_user_perferences(
                     user_id=user_id, preference_ids=add_preferences
                 )
+
+            # 3. 바뀐 취향으로 추천 빵집 재계산
+            await BakeryRepository(db=self.db).refresh_user_recommendations(
+                user_ids=[user_id], per_area_limit=config.RECOMMENDATION_PER_AREA_LIMIT
+            )
         except Exception as e:
             if isinstance(e, RequestDataMissingException):
                 raise e
@@ -245,7 +262,18 @@ class UserService:
             )
             photo_maps = defaultdict(list)
             for p in photos:
-                photo_maps[p.review_id].append(ReviewPhoto(img_url=p.img_url))
+                photo_maps[p.review_id].append(
+                    ReviewPhoto(
+                        img_url=p.img_url,
+                        thumb_url=p.thumb_url,
+                        detail_url=p.detail_url,
+                    )
+                )
+
+            # 4. 아직 DB에 반영되지 않은 좋아요 합치기
+            reviews = await merge_buffered_review_likes(
+                user_id=user_id, reviews=reviews
+            )
 
             return UserReviewReponseDTO(
                 next_cursor=next_cursor,
@@ -259,6 +287,8 @@ class UserService:
                 ],
             )
         except Exception as e:
+            if isinstance(e, (InvalidCursorException, InvalidSortParameterException)):
+                raise e
             raise UnknownException(detail=str(e))
 
     async def get_user_bread_report_monthly(
@@ -274,6 +304,8 @@ class UserService:
             )
             return BreadReportMonthlyResponseDTO(next_cursor=next_cursor, items=res)
         except Exception as e:
+            if isinstance(e, (InvalidCursorException, InvalidSortParameterException)):
+                raise e
             raise UnknownException(detail=str(e))
 
     async def represent_user_badge(self, badge_id: int, user_id: int):
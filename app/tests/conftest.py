@@ -1 +1,2 @@
 from app.tests.fixtures.auth import *
+from app.tests.fixtures.redis import *
@@ -0,0 +1,21 @@
+import os
+from argparse import Namespace
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+MIGRATIONS_DIR = Path(__file__).resolve().parents[3] / "migrations"
+
+
+def upgrade_schema():
+    """운영과 같은 스키마로 검사하도록 alembic 마이그레이션 적용하는 메소드.
+
+    env.py 가 asyncio.run 으로 실행되므로 이벤트 루프 안에서는 별도 스레드에서 호출한다.
+    """
+
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    config.cmd_opts = Namespace(x=[f"url={TEST_DATABASE_URL}"])
+    command.upgrade(config, "head")
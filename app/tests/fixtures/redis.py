@@ -0,0 +1,20 @@
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis, FakeServer
+
+import app.core.redis as redis_module
+
+
+@pytest_asyncio.fixture
+async def fake_redis(monkeypatch):
+    """get_redis / get_binary_redis 가 같은 fakeredis 서버를 쓰도록 바꾸는 fixture."""
+
+    server = FakeServer()
+    redis = FakeAsyncRedis(server=server, decode_responses=True)
+    binary_redis = FakeAsyncRedis(server=server, decode_responses=False)
+    monkeypatch.setattr(redis_module, "_redis", redis)
+    monkeypatch.setattr(redis_module, "_binary_redis", binary_redis)
+
+    yield redis
+
+    await redis.aclose()
+    await binary_redis.aclose()
@@ -0,0 +1,149 @@
+"""베이커리 카드/인기 점수 갱신 쿼리 테스트.
+
+TEST_DATABASE_URL 로 지정한 로컬 PostgreSQL에 alembic 마이그레이션을 적용하고,
+테스트가 끝나면 롤백한다.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.model.bakery import (
+    Bakery,
+    BakeryCard,
+    BakeryMenu,
+    BakeryPhoto,
+    BakeryPopularity,
+    BakeryPreference,
+)
+from app.model.users import Preferences, UserPreferences, Users
+from app.repositories.bakery_repo import BakeryRepository
+from app.repositories.user_repo import UserRepository
+from app.tests.fixtures.database import TEST_DATABASE_URL, upgrade_schema
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL 미설정 (로컬 PostgreSQL 필요)"
+)
+
+BAKERY_ID = 900001
+# updated_at 으로는 찾을 수 없는 변경만 조회되도록 미래 시각 기준
+FUTURE = datetime.now(timezone.utc) + timedelta(days=1)
+
+
+@pytest_asyncio.fixture
+async def bakery_db():
+    """테스트용 빵집 하나를 만든 세션 반환하는 fixture."""
+
+    await asyncio.to_thread(upgrade_schema)
+
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    async with engine.connect() as conn:
+        db = AsyncSession(bind=conn)
+        db.add(Bakery(id=BAKERY_ID, name="빵집", address="부산", avg_rating=4.5))
+        await db.flush()
+        try:
+            yield db
+        finally:
+            await db.close()
+            await conn.rollback()
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_deleted_bakery_popularity_removed(bakery_db):
+    repo = BakeryRepository(bakery_db)
+    await repo.refresh_bakery_popularity(now=datetime.now(), bakery_ids=[BAKERY_ID])
+    popularity = select(BakeryPopularity.bakery_id).where(
+        BakeryPopularity.bakery_id == BAKERY_ID
+    )
+    assert await bakery_db.scalar(popularity) == BAKERY_ID
+
+    await bakery_db.execute(delete(Bakery).where(Bakery.id == BAKERY_ID))
+
+    assert await bakery_db.scalar(popularity) is None
+
+
+async def _card(db: AsyncSession):
+    return (
+        await db.execute(
+            select(BakeryCard.signature_img_url, BakeryCard.signature_menus).where(
+                BakeryCard.bakery_id == BAKERY_ID
+            )
+        )
+    ).first()
+
+
+@pytest.mark.asyncio
+async def test_removed_signature_card_refreshed(bakery_db):
+    repo = BakeryRepository(bakery_db)
+    photo = BakeryPhoto(
+        id=BAKERY_ID, bakery_id=BAKERY_ID, img_url="a.jpg", is_signature=True
+    )
+    menu = BakeryMenu(
+        id=BAKERY_ID, bakery_id=BAKERY_ID, name="소금빵", is_signature=True
+    )
+    bakery_db.add_all([photo, menu])
+    await bakery_db.flush()
+    await repo.refresh_bakery_cards(bakery_ids=[BAKERY_ID])
+    assert tuple(await _card(bakery_db)) == ("a.jpg", ["소금빵"])
+    assert BAKERY_ID not in await repo.get_card_changed_bakery_ids(since=FUTURE)
+
+    await bakery_db.delete(photo)
+    await bakery_db.delete(menu)
+    await bakery_db.flush()
+
+    changed_ids = await repo.get_card_changed_bakery_ids(since=FUTURE)
+    assert BAKERY_ID in changed_ids
+    await repo.refresh_bakery_cards(bakery_ids=changed_ids)
+    assert tuple(await _card(bakery_db)) == (None, [])
+
+
+@pytest.mark.asyncio
+async def test_deleted_bakery_card_removed(bakery_db):
+    repo = BakeryRepository(bakery_db)
+    await repo.refresh_bakery_cards(bakery_ids=[BAKERY_ID])
+
+    await bakery_db.execute(delete(Bakery).where(Bakery.id == BAKERY_ID))
+
+    changed_ids = await repo.get_card_changed_bakery_ids(since=FUTURE)
+    assert BAKERY_ID in changed_ids
+    await repo.refresh_bakery_cards(bakery_ids=changed_ids)
+    assert await _card(bakery_db) is None
+
+
+@pytest.mark.asyncio
+async def test_recommendation_changed_user_ids(bakery_db):
+    # 유저 1 : 빵집과 겹치는 취향 / 유저 2 : 겹치지 않는 취향
+    matched_user, other_user = BAKERY_ID, BAKERY_ID + 1
+    bakery_db.add_all(
+        [
+            Preferences(id=BAKERY_ID, name="담백한 빵"),
+            Preferences(id=BAKERY_ID + 1, name="달콤한 빵"),
+            Users(id=matched_user, login_type="KAKAO", email="a@test.com"),
+            Users(id=other_user, login_type="KAKAO", email="b@test.com"),
+        ]
+    )
+    await bakery_db.flush()
+    bakery_db.add_all(
+        [
+            UserPreferences(user_id=matched_user, preference_id=BAKERY_ID),
+            UserPreferences(user_id=other_user, preference_id=BAKERY_ID + 1),
+            BakeryPreference(bakery_id=BAKERY_ID, preference_id=BAKERY_ID),
+        ]
+    )
+    await bakery_db.flush()
+
+    async def user_ids(since):
+        return await UserRepository(bakery_db).get_preference_user_ids(
+            after_user_id=BAKERY_ID - 1, limit=10, since=since
+        )
+
+    assert await user_ids(None) == [matched_user, other_user]
+    assert await user_ids(FUTURE - timedelta(days=2)) == [matched_user]
+    assert await user_ids(FUTURE) == []
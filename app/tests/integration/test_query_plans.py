@@ -0,0 +1,458 @@
+"""API에서 실행되는 조회 쿼리의 실행계획 회귀 테스트.
+
+TEST_DATABASE_URL (postgresql+asyncpg://...) 로 지정한 로컬 PostgreSQL에
+alembic 마이그레이션으로 스키마를 새로 만들고 데이터를 채운 뒤, 각 리포지토리 쿼리를
+EXPLAIN 해서 주요 테이블을 Seq Scan 으로 읽으면 실패한다. (ko_KR.utf8 collation 필요)
+
+enable_seqscan = off 로 실행하므로 Seq Scan 이 남아있다면 탈 수 있는 인덱스가 없다는 뜻이다.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.schedule import OperatingSchedule
+from app.model import area, badge, bakery, notice, report, review, users  # noqa: F401
+from app.model.base import Base
+from app.repositories.bakery_repo import (
+    HOT_BAKERY_ALL_AREA_SORT,
+    HOT_BAKERY_SORT,
+    PREFERENCE_SORT,
+    BakeryRepository,
+)
+from app.repositories.review_repo import BAKERY_REVIEW_SORTS, ReviewRepository
+from app.repositories.search_repo import SearchRepository
+from app.repositories.user_repo import UserRepository
+from app.tests.fixtures.database import TEST_DATABASE_URL, upgrade_schema
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL 미설정 (로컬 PostgreSQL 필요)"
+)
+
+# 데이터가 계속 쌓이는 테이블 (공통코드성 테이블은 Seq Scan 허용)
+HOT_TABLES = {
+    "users",
+    "bakeries",
+    "bakery_menus",
+    "bakery_photos",
+    "menu_photos",
+    "operating_hours",
+    "bakery_cards",
+    "bakery_popularity",
+    "bakery_search_documents",
+    "user_bakery_recommendations",
+    "user_bakery_likes",
+    "recent_bakery_views",
+    "reviews",
+    "review_photos",
+    "review_bakery_menus",
+    "review_likes",
+    "bread_reports",
+}
+
+USER_COUNT = 2000
+BAKERY_COUNT = 5000
+REVIEW_COUNT = 50000
+
+SEED_SQL = [
+    f"""
+    INSERT INTO users (id, login_type, email, nickname, is_preferences_set)
+    SELECT g, 'KAKAO', 'user' || g || '@test.com', '유저' || g, true
+    FROM generate_series(1, {USER_COUNT}) g
+    """,
+    f"""
+    INSERT INTO bakeries
+        (id, name, address, gu, dong, lat, lng, commercial_area_id, avg_rating,
+         review_count, thumbnail)
+    SELECT g, '빵집' || g, '부산 수영구 ' || g, '수영구', '광안' || g % 100 || '동',
+        35.15 + g / 1000000.0, 129.11 + g / 1000000.0, 1 + g % 13, (g % 50) / 10.0,
+        g % 40, 'https://img.test/bakery/' || g
+    FROM generate_series(1, {BAKERY_COUNT}) g
+    """,
+    f"""
+    INSERT INTO bakery_menus (id, name, is_signature, price, bakery_id, bread_type_id)
+    SELECT g, '메뉴' || g, g % 5 = 0, 3000 + g % 10 * 500, 1 + g % {BAKERY_COUNT},
+        1 + g % 40
+    FROM generate_series(1, {BAKERY_COUNT * 5}) g
+    """,
+    f"""
+    INSERT INTO menu_photos (id, menu_id, img_url)
+    SELECT g, g, 'https://img.test/menu/' || g
+    FROM generate_series(1, {BAKERY_COUNT * 5}, 2) g
+    """,
+    f"""
+    INSERT INTO bakery_photos (id, bakery_id, img_url, is_signature)
+    SELECT g, 1 + g % {BAKERY_COUNT}, 'https://img.test/photo/' || g, g % 3 = 0
+    FROM generate_series(1, {BAKERY_COUNT * 3}) g
+    """,
+    f"""
+    INSERT INTO operating_hours
+        (id, bakery_id, day_of_week, open_time, close_time, is_opened)
+    SELECT g, 1 + (g - 1) / 7, (g - 1) % 7, '09:00', '21:00', (g - 1) % 7 <> 6
+    FROM generate_series(1, {BAKERY_COUNT * 7}) g
+    """,
+    f"""
+    INSERT INTO reviews
+        (id, bakery_id, user_id, content, rating, like_count, day_of_week,
+         is_private, created_at)
+    SELECT g, 1 + g % {BAKERY_COUNT}, 1 + g % {USER_COUNT}, '맛있어요 ' || g,
+        1 + g % 5, g % 30, g % 7, g % 10 = 0, now() - g * interval '1 minute'
+    FROM generate_series(1, {REVIEW_COUNT}) g
+    """,
+    f"""
+    INSERT INTO review_photos (id, review_id, img_url)
+    SELECT g, g, 'https://img.test/review/' || g
+    FROM generate_series(1, {REVIEW_COUNT}) g
+    """,
+    f"""
+    INSERT INTO review_bakery_menus (id, review_id, menu_id, quantity)
+    SELECT g, g, 1 + g % {BAKERY_COUNT * 5}, 1
+    FROM generate_series(1, {REVIEW_COUNT}) g
+    """,
+    f"""
+    INSERT INTO review_likes (user_id, review_id)
+    SELECT 1 + g % {USER_COUNT}, g
+    FROM generate_series(1, {REVIEW_COUNT}, 3) g
+    """,
+    f"""
+    INSERT INTO user_bakery_likes (user_id, bakery_id)
+    SELECT 1 + g % {USER_COUNT}, 1 + (g * 7) % {BAKERY_COUNT}
+    FROM generate_series(1, {USER_COUNT * 10}) g
+    ON CONFLICT DO NOTHING
+    """,
+    f"""
+    INSERT INTO recent_bakery_views (user_id, bakery_id)
+    SELECT 1 + g % {USER_COUNT}, 1 + (g * 13) % {BAKERY_COUNT}
+    FROM generate_series(1, {USER_COUNT * 10}) g
+    ON CONFLICT DO NOTHING
+    """,
+    f"""
+    INSERT INTO user_bakery_recommendations (user_id, bakery_id, score)
+    SELECT u, 1 + (u * 31 + k * 17) % {BAKERY_COUNT}, round(k / 10.0, 3)
+    FROM generate_series(1, {USER_COUNT}) u, generate_series(1, 50) k
+    ON CONFLICT DO NOTHING
+    """,
+    f"""
+    INSERT INTO bread_reports
+        (id, user_id, year, month, visited_areas, bread_types, daily_avg_quantity,
+         weekly_distribution, visit_count, monthly_consumption_gap, total_quantity,
+         total_price, price_diff_from_last_month, review_count, liked_count,
+         received_likes_count)
+    SELECT g, 1 + (g - 1) / 12, 2025, 1 + (g - 1) % 12, '{{"광안리•민락": 4}}',
+        '{{"건강한 빵": 1}}', 1.5, '{{"1": 3}}', 4, 0.5, 6, 18000, 2000, 2, 3, 1
+    FROM generate_series(1, {USER_COUNT * 12}) g
+    """,
+]
+
+_seeded = False
+
+
+async def _seed(engine):
+    """스키마를 새로 만들고 테스트 데이터 채우는 메소드."""
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+
+    # 운영과 같은 인덱스로 검사하도록 마이그레이션으로 스키마 생성
+    await asyncio.to_thread(upgrade_schema)
+
+    async with engine.begin() as conn:
+        for sql in SEED_SQL:
+            await conn.execute(text(sql))
+
+    # 카드/인기점수/검색문서는 실제 갱신 쿼리로 채우기
+    async with AsyncSession(bind=engine) as db:
+        await BakeryRepository(db).refresh_bakery_cards()
+        await BakeryRepository(db).refresh_bakery_popularity(now=datetime.now())
+        await SearchRepository(db).upsert_search_documents()
+        await db.commit()
+
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE"))
+
+
+@pytest_asyncio.fixture
+async def plan_db():
+    """Seq Scan 을 끈 세션과, 그 세션에서 실행된 쿼리 목록 반환하는 fixture."""
+
+    global _seeded
+
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    if not _seeded:
+        await _seed(engine)
+        _seeded = True
+
+    statements = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        # EXPLAIN 은 ANALYZE 없이는 실행하지 않으므로 쓰기 쿼리도 같이 검사
+        if not executemany and statement.lstrip().upper().startswith(
+            ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+        ):
+            statements.append((statement, parameters))
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SET enable_seqscan = off"))
+        statements.clear()
+        db = AsyncSession(bind=conn)
+        try:
+            yield conn, db, statements
+        finally:
+            await db.close()
+            await conn.rollback()
+
+    await engine.dispose()
+
+
+async def explain(conn, statements) -> list:
+    """캡쳐한 쿼리들의 실행계획 노드 목록 반환하는 메소드."""
+
+    nodes = []
+    for statement, parameters in list(statements):
+        res = await conn.exec_driver_sql(
+            "EXPLAIN (FORMAT JSON) " + statement, parameters
+        )
+        plan = res.scalar()
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+
+        stack = [plan[0]["Plan"]]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.get("Plans", []))
+    return nodes
+
+
+NOW = datetime(2025, 7, 22, 12, 0)
+
+# (이름, 쿼리 실행 함수, 타야 하는 인덱스)
+# 쿼리 실행 함수가 (next_cursor, items) 를 반환하면 다음 페이지 쿼리도 검사한다.
+CASES = [
+    (
+        "preference_home",
+        lambda db, c: BakeryRepository(db).get_bakeries_by_preference(
+            area_codes=["14"], user_id=1, now=NOW
+        ),
+        None,
+    ),
+    (
+        "preference_more",
+        lambda db, c: BakeryRepository(db).get_more_bakeries_by_preference(
+            cursor_value=c, page_size=5, area_codes=["14"], user_id=1, now=NOW
+        ),
+        PREFERENCE_SORT.index,
+    ),
+    (
+        "hot_home",
+        lambda db, c: BakeryRepository(db).get_bakery_by_area(
+            area_codes=["14"], now=NOW, user_id=1
+        ),
+        None,
+    ),
+    (
+        "hot_more",
+        lambda db, c: BakeryRepository(db).get_more_hot_bakeries(
+            area_codes=["1"], user_id=1, now=NOW, cursor_value=c, page_size=5
+        ),
+        HOT_BAKERY_SORT.index,
+    ),
+    (
+        "hot_more_all_area",
+        lambda db, c: BakeryRepository(db).get_more_hot_bakeries(
+            area_codes=["14"], user_id=1, now=NOW, cursor_value=c, page_size=5
+        ),
+        HOT_BAKERY_ALL_AREA_SORT.index,
+    ),
+    (
+        "refresh_bakery_popularity",
+        lambda db, c: BakeryRepository(db).refresh_bakery_popularity(
+            now=NOW, bakery_ids=[1, 8, 15]
+        ),
+        "ix_user_bakery_likes_bakery_id",
+    ),
+    (
+        "bakery_detail",
+        lambda db, c: BakeryRepository(db).get_bakery_detail(bakery_id=1, now=NOW),
+        None,
+    ),
+    (
+        "bakery_menus",
+        lambda db, c: BakeryRepository(db).get_bakery_menus(bakery_id=1),
+        None,
+    ),
+    (
+        "check_like_bakery",
+        lambda db, c: BakeryRepository(db).check_like_bakery(user_id=1, bakery_id=8),
+        None,
+    ),
+    (
+        "visited_bakeries",
+        lambda db, c: BakeryRepository(db).get_visited_bakery(
+            user_id=1,
+            sort_by="created_at",
+            direction="desc",
+            now=NOW,
+            cursor_value=c,
+            page_size=5,
+        ),
+        None,
+    ),
+    (
+        "reviews_written_today",
+        lambda db, c: BakeryRepository(db).get_reviews_written_today(
+            user_id=1, bakery_id=1, start_time=NOW, end_time=NOW
+        ),
+        None,
+    ),
+    (
+        "liked_bakeries",
+        lambda db, c: BakeryRepository(db).get_like_bakeries(
+            user_id=1,
+            now=NOW,
+            sort_by="name",
+            direction="asc",
+            cursor_value=c,
+            page_size=3,
+        ),
+        None,
+    ),
+    (
+        "recent_views",
+        lambda db, c: BakeryRepository(db).get_recent_views(user_id=1),
+        None,
+    ),
+    (
+        "recent_view_cards",
+        lambda db, c: BakeryRepository(db).get_bakery_cards(
+            bakery_ids=[1, 2, 3], now=NOW
+        ),
+        None,
+    ),
+    (
+        "operating_hours",
+        lambda db, c: OperatingSchedule._fetch(db, [1, 2, 3]),
+        None,
+    ),
+    *[
+        (
+            f"bakery_reviews:{sort_by}",
+            lambda db, c, sort_by=sort_by: ReviewRepository(db).get_review_by_bakery_id(
+                user_id=1,
+                bakery_id=1,
+                cursor_value=c,
+                sort_by=sort_by,
+                direction="desc",
+                page_size=3,
+            ),
+            spec.index,
+        )
+        for sort_by, spec in BAKERY_REVIEW_SORTS.items()
+    ],
+    (
+        "my_bakery_reviews",
+        lambda db, c: ReviewRepository(db).get_my_reviews_by_bakery_id(
+            bakery_id=1, user_id=1, cursor_value=c, page_size=1
+        ),
+        None,
+    ),
+    (
+        "my_review_photos",
+        lambda db, c: ReviewRepository(db).get_my_review_photos_by_bakery_id(
+            review_ids=[1, 2, 3]
+        ),
+        None,
+    ),
+    (
+        "my_review_menus",
+        lambda db, c: ReviewRepository(db).get_my_review_menus_by_bakery_id(
+            review_ids=[1, 2, 3]
+        ),
+        None,
+    ),
+    (
+        "bakery_summary",
+        lambda db, c: ReviewRepository(db).get_bakery_summary(bakery_id=1),
+        None,
+    ),
+    (
+        "today_review",
+        lambda db, c: ReviewRepository(db).get_today_review(user_id=1, bakery_id=1),
+        None,
+    ),
+    (
+        "review_like_state",
+        lambda db, c: ReviewRepository(db).get_review_like_state(
+            user_id=1, review_id=1
+        ),
+        None,
+    ),
+    (
+        "search",
+        lambda db, c: SearchRepository(db).search_bakeries_by_keyword(
+            keyword="빵집1", user_id=1, now=NOW, cursor_value=c, page_size=5
+        ),
+        None,
+    ),
+    (
+        "search_choseong",
+        lambda db, c: SearchRepository(db).search_bakeries_by_keyword(
+            keyword="ㅃㅈ", user_id=1, now=NOW, cursor_value=c, page_size=5
+        ),
+        None,
+    ),
+    (
+        "user_reviews",
+        lambda db, c: UserRepository(db).get_user_reviews(
+            cursor_value=c, page_size=5, user_id=1
+        ),
+        None,
+    ),
+    (
+        "bread_report",
+        lambda db, c: UserRepository(db).get_user_bread_report(
+            user_id=1, target_years=[2025], target_months=[6, 7]
+        ),
+        None,
+    ),
+    (
+        "bread_report_monthly",
+        lambda db, c: UserRepository(db).get_user_bread_report_monthly(
+            cursor_value=c, page_size=5, user_id=1
+        ),
+        None,
+    ),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query, expected_index", [(c[1], c[2]) for c in CASES], ids=[c[0] for c in CASES]
+)
+async def test_query_plan_uses_index(plan_db, query, expected_index):
+    conn, db, statements = plan_db
+
+    res = await query(db, "0")
+    # 다음 페이지 (keyset 조건이 붙은 쿼리) 까지 검사
+    if isinstance(res, tuple) and res[0]:
+        await query(db, res[0])
+
+    assert statements, "실행된 쿼리가 없습니다."
+    nodes = await explain(conn, statements)
+
+    seq_scans = {
+        n["Relation Name"]
+        for n in nodes
+        if n["Node Type"] == "Seq Scan" and n.get("Relation Name") in HOT_TABLES
+    }
+    assert not seq_scans, f"Seq Scan : {sorted(seq_scans)}"
+
+    if expected_index:
+        assert expected_index in {n.get("Index Name") for n in nodes}
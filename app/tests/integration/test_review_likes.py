@@ -0,0 +1,106 @@
+"""좋아요 버퍼 DB 반영 쿼리 테스트.
+
+TEST_DATABASE_URL 로 지정한 로컬 PostgreSQL에 alembic 마이그레이션을 적용하고,
+테스트가 끝나면 롤백한다.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.const import MAX_BIND_PARAMS
+from app.model.review import Review, ReviewLike
+from app.repositories.review_repo import ReviewRepository
+from app.tests.fixtures.database import TEST_DATABASE_URL, upgrade_schema
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL 미설정 (로컬 PostgreSQL 필요)"
+)
+
+REVIEW_ID = 900001
+LIKED_REVIEW_ID = 900002
+# 한 번에 보내면 bind parameter 개수 제한을 넘는 크기
+USER_COUNT = MAX_BIND_PARAMS // 2 + 1000
+
+
+@pytest_asyncio.fixture
+async def like_db():
+    """좋아요 2개가 있는 리뷰와 없는 리뷰를 만든 세션 반환하는 fixture."""
+
+    await asyncio.to_thread(upgrade_schema)
+
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    async with engine.connect() as conn:
+        db = AsyncSession(bind=conn)
+        db.add_all(
+            [
+                Review(id=REVIEW_ID, bakery_id=1, user_id=1, content="리뷰"),
+                Review(
+                    id=LIKED_REVIEW_ID,
+                    bakery_id=1,
+                    user_id=1,
+                    content="리뷰",
+                    like_count=2,
+                ),
+                ReviewLike(user_id=1, review_id=LIKED_REVIEW_ID),
+                ReviewLike(user_id=2, review_id=LIKED_REVIEW_ID),
+            ]
+        )
+        await db.flush()
+        try:
+            yield db
+        finally:
+            await db.close()
+            await conn.rollback()
+
+    await engine.dispose()
+
+
+async def _like_counts(db: AsyncSession) -> dict:
+    rows = await db.execute(
+        select(Review.id, Review.like_count).where(
+            Review.id.in_([REVIEW_ID, LIKED_REVIEW_ID])
+        )
+    )
+    return dict(rows.all())
+
+
+async def _like_rows(db: AsyncSession, review_id: int) -> int:
+    return await db.scalar(
+        select(func.count()).where(ReviewLike.review_id == review_id)
+    )
+
+
+@pytest.mark.asyncio
+async def test_apply_review_likes_twice(like_db):
+    repo = ReviewRepository(like_db)
+    likes = [(u, REVIEW_ID) for u in range(1, USER_COUNT + 1)]
+    # 이미 좋아요한 유저 / 좋아요 안 한 유저의 해지는 개수에 반영되지 않아야 함
+    likes.append((1, LIKED_REVIEW_ID))
+    unlikes = [(2, LIKED_REVIEW_ID), (3, LIKED_REVIEW_ID)]
+
+    deltas = await repo.apply_review_likes(likes, unlikes)
+
+    assert deltas == {REVIEW_ID: USER_COUNT, LIKED_REVIEW_ID: -1}
+    assert await _like_counts(like_db) == {REVIEW_ID: USER_COUNT, LIKED_REVIEW_ID: 1}
+
+    # flusher 가 DB 반영 후 버퍼를 지우기 전에 죽으면 같은 버퍼가 다시 반영됨
+    assert await repo.apply_review_likes(likes, unlikes) == {}
+    assert await _like_counts(like_db) == {REVIEW_ID: USER_COUNT, LIKED_REVIEW_ID: 1}
+    assert await _like_rows(like_db, REVIEW_ID) == USER_COUNT
+
+
+@pytest.mark.asyncio
+async def test_apply_review_unlikes_in_chunks(like_db):
+    repo = ReviewRepository(like_db)
+    pairs = [(u, REVIEW_ID) for u in range(1, USER_COUNT + 1)]
+    await repo.apply_review_likes(pairs, [])
+
+    assert await repo.apply_review_likes([], pairs) == {REVIEW_ID: -USER_COUNT}
+    assert await repo.apply_review_likes([], pairs) == {}
+    assert await _like_counts(like_db) == {REVIEW_ID: 0, LIKED_REVIEW_ID: 2}
+    assert await _like_rows(like_db, REVIEW_ID) == 0
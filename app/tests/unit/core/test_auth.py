@@ -0,0 +1,28 @@
+from app.core.auth import VerifiedTokenCache
+
+
+def test_verified_token_cache_hit():
+    cache = VerifiedTokenCache(maxsize=10)
+    cache.set("token", user_id=1, exp=200)
+
+    assert cache.get("token", now=100) == 1
+
+
+def test_verified_token_cache_expired():
+    cache = VerifiedTokenCache(maxsize=10)
+    cache.set("token", user_id=1, exp=200)
+
+    assert cache.get("token", now=200) is None
+    assert cache.get("token", now=100) is None
+
+
+def test_verified_token_cache_evicts_least_recently_used():
+    cache = VerifiedTokenCache(maxsize=2)
+    cache.set("a", user_id=1, exp=200)
+    cache.set("b", user_id=2, exp=200)
+    cache.get("a", now=100)
+    cache.set("c", user_id=3, exp=200)
+
+    assert cache.get("a", now=100) == 1
+    assert cache.get("b", now=100) is None
+    assert cache.get("c", now=100) == 3
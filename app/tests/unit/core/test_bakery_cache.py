@@ -0,0 +1,29 @@
+from app.core.bakery_cache import LocalLRU, build_bakery_block_key
+
+
+def test_build_bakery_block_key_contains_version():
+    assert build_bakery_block_key(1, "detail", 3) == "bakery:1:v3:detail"
+
+
+def test_local_lru_evicts_least_recently_used():
+    cache = LocalLRU(maxsize=2)
+    cache.set("a", 0, "A", 10.0)
+    cache.set("b", 0, "B", 10.0)
+    cache.get("a")
+    cache.set("c", 0, "C", 10.0)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == (0, "A", 10.0)
+
+
+def test_local_lru_discard():
+    cache = LocalLRU(maxsize=10)
+    cache.set((1, "detail"), 0, "D", 10.0)
+    cache.set((1, "menus"), 0, "M", 10.0)
+    cache.set((2, "detail"), 0, "D2", 10.0)
+
+    cache.discard(lambda k: k[0] == 1)
+
+    assert cache.get((1, "detail")) is None
+    assert cache.get((1, "menus")) is None
+    assert cache.get((2, "detail")) is not None
@@ -0,0 +1,28 @@
+from app.core.cache import (
+    build_bakery_card_key,
+    build_bakery_index_key,
+    build_feed_cache_key,
+)
+
+
+def test_build_feed_cache_key_area_order_independent():
+    a = build_feed_cache_key("hot", ["3", "1", "2"], 0)
+    b = build_feed_cache_key("hot", ["1", "2", "3", "2"], 0)
+    assert a == b == "feed:hot:area=1,2,3:dow=0"
+
+
+def test_build_feed_cache_key_with_preferences():
+    a = build_feed_cache_key("preference", ["1"], 2, preference_ids=[3, 1])
+    b = build_feed_cache_key("preference", ["1"], 2, preference_ids=[1, 3])
+    c = build_feed_cache_key("preference", ["1"], 2, preference_ids=[1])
+    assert a == b
+    assert a != c
+    assert a.startswith("feed:preference:area=1:dow=2:pref=")
+
+
+def test_build_bakery_index_key():
+    assert build_bakery_index_key(10) == "feed:bakery:10"
+
+
+def test_build_bakery_card_key():
+    assert build_bakery_card_key(7) == "bakery_card:7"
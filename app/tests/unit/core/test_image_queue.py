@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from app.core.config import Configs
+from app.core.image_queue import (
+    REVIEW_IMAGE_DEAD_LETTER,
+    REVIEW_IMAGE_QUEUE,
+    REVIEW_IMAGE_WORKERS_KEY,
+    ack_review_image_job,
+    enqueue_review_image_job,
+    get_review_image_blobs,
+    pop_review_image_job,
+    register_review_image_worker,
+    release_review_image_worker,
+    requeue_stale_review_image_jobs,
+    retry_or_dead_letter,
+)
+
+config = Configs()
+
+
+async def _processing(redis, worker_id: str) -> list:
+    return await redis.lrange(f"review_image:processing:{worker_id}", 0, -1)
+
+
+@pytest.mark.asyncio
+async def test_pop_and_ack_review_image_job(fake_redis):
+    await enqueue_review_image_job(1, [(b"img", "a.jpg")])
+    await register_review_image_worker("w1")
+
+    raw, job = await pop_review_image_job("w1", timeout=1)
+
+    assert job["review_id"] == 1
+    assert await get_review_image_blobs(job) == [(b"img", "a.jpg")]
+    # 처리가 끝나기 전까지 처리중 목록에 남아있음
+    assert await _processing(fake_redis, "w1") == [raw]
+    assert await fake_redis.llen(REVIEW_IMAGE_QUEUE) == 0
+
+    await ack_review_image_job("w1", raw)
+    assert await _processing(fake_redis, "w1") == []
+
+
+@pytest.mark.asyncio
+async def test_requeue_stale_review_image_jobs(fake_redis):
+    await enqueue_review_image_job(1, [(b"img", "a.jpg")])
+    await register_review_image_worker("dead")
+    await register_review_image_worker("alive")
+    raw, _ = await pop_review_image_job("dead", timeout=1)
+
+    # 생존 표시가 만료된 워커의 작업만 큐로 되돌림
+    await fake_redis.delete("review_image:heartbeat:dead")
+    await requeue_stale_review_image_jobs()
+
+    assert await fake_redis.lrange(REVIEW_IMAGE_QUEUE, 0, -1) == [raw]
+    assert await _processing(fake_redis, "dead") == []
+    assert await fake_redis.smembers(REVIEW_IMAGE_WORKERS_KEY) == {"alive"}
+
+
+@pytest.mark.asyncio
+async def test_release_review_image_worker(fake_redis):
+    await enqueue_review_image_job(1, [(b"img", "a.jpg")])
+    await register_review_image_worker("w1")
+    raw, _ = await pop_review_image_job("w1", timeout=1)
+
+    await release_review_image_worker("w1")
+
+    assert await fake_redis.lrange(REVIEW_IMAGE_QUEUE, 0, -1) == [raw]
+    assert await fake_redis.smembers(REVIEW_IMAGE_WORKERS_KEY) == set()
+
+
+@pytest.mark.asyncio
+async def test_retry_or_dead_letter(fake_redis):
+    await enqueue_review_image_job(1, [(b"img", "a.jpg")])
+    await register_review_image_worker("w1")
+
+    for attempt in range(1, config.REVIEW_IMAGE_JOB_MAX_ATTEMPTS):
+        raw, job = await pop_review_image_job("w1", timeout=1)
+        await retry_or_dead_letter("w1", raw, job, "error")
+
+        assert await _processing(fake_redis, "w1") == []
+        retried = json.loads(await fake_redis.lindex(REVIEW_IMAGE_QUEUE, 0))
+        assert retried["attempts"] == attempt
+
+    # 최대 횟수 초과시 dead letter로 이동
+    raw, job = await pop_review_image_job("w1", timeout=1)
+    await retry_or_dead_letter("w1", raw, job, "error")
+
+    assert await fake_redis.llen(REVIEW_IMAGE_QUEUE) == 0
+    assert await _processing(fake_redis, "w1") == []
+    dead = json.loads(await fake_redis.lindex(REVIEW_IMAGE_DEAD_LETTER, 0))
+    assert dead["attempts"] == config.REVIEW_IMAGE_JOB_MAX_ATTEMPTS
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.job_lock import (
+    JOB_LOCK_PREFIX,
+    get_last_started_at,
+    refresh_since_last_run,
+    run_as_leader,
+)
+
+
+@pytest.mark.asyncio
+async def test_run_as_leader_once_per_period(fake_redis):
+    calls = []
+
+    async def job():
+        calls.append(1)
+
+    assert await run_as_leader("job", 60, job)
+    # 다른 인스턴스는 lock이 만료될 때까지 실행하지 않음
+    assert not await run_as_leader("job", 60, job)
+    assert len(calls) == 1
+    assert 0 < await fake_redis.ttl(f"{JOB_LOCK_PREFIX}job") <= 60
+
+
+@pytest.mark.asyncio
+async def test_run_as_leader_releases_lock_on_failure(fake_redis):
+    async def job():
+        raise RuntimeError("fail")
+
+    with pytest.raises(RuntimeError):
+        await run_as_leader("job", 60, job)
+
+    assert not await fake_redis.exists(f"{JOB_LOCK_PREFIX}job")
+
+
+@pytest.mark.asyncio
+async def test_refresh_since_last_run(fake_redis):
+    overlap = timedelta(seconds=60)
+    calls = []
+
+    async def refresh(since):
+        calls.append(since)
+
+    # 기록이 없으면 전체 갱신
+    await refresh_since_last_run("job", refresh, overlap)
+    last_started_at = await get_last_started_at("job")
+    assert calls == [None]
+    assert last_started_at <= datetime.now(timezone.utc)
+
+    # 다음 실행은 (다른 인스턴스여도) 이전 시작시각 - overlap 이후만
+    await refresh_since_last_run("job", refresh, overlap)
+    assert calls[1] == last_started_at - overlap
+
+
+@pytest.mark.asyncio
+async def test_refresh_since_last_run_failure_keeps_last_run(fake_redis):
+    async def refresh(since):
+        raise RuntimeError("fail")
+
+    with pytest.raises(RuntimeError):
+        await refresh_since_last_run("job", refresh, timedelta(seconds=60))
+
+    assert await get_last_started_at("job") is None
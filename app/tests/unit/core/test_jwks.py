@@ -0,0 +1,10 @@
+from app.core.jwks import DEFAULT_MAX_AGE, parse_max_age
+
+
+def test_parse_max_age():
+    assert parse_max_age("public, max-age=86400, must-revalidate") == 86400
+
+
+def test_parse_max_age_without_header():
+    assert parse_max_age(None) == DEFAULT_MAX_AGE
+    assert parse_max_age("no-cache") == DEFAULT_MAX_AGE
@@ -0,0 +1,67 @@
+from alembic.autogenerate import render_python_code
+from alembic.operations import ops
+from sqlalchemy import Column, Index, Integer, MetaData, Table
+
+from app.core.migration import (
+    CreateIndexConcurrentlyOp,
+    DropIndexConcurrentlyOp,
+    use_concurrent_indexes,
+)
+
+metadata = MetaData()
+reviews = Table(
+    "reviews",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("bakery_id", Integer),
+)
+bakery_cards = Table(
+    "bakery_cards",
+    metadata,
+    Column("bakery_id", Integer, primary_key=True),
+    Column("review_count", Integer),
+)
+
+
+def _script(upgrade: list, downgrade: list) -> ops.MigrationScript:
+    return ops.MigrationScript(
+        rev_id="0001",
+        upgrade_ops=ops.UpgradeOps(ops=upgrade),
+        downgrade_ops=ops.DowngradeOps(ops=downgrade),
+    )
+
+
+def test_existing_table_indexes_become_concurrent():
+    create_index = ops.CreateIndexOp.from_index(
+        Index("ix_reviews_bakery_id", reviews.c.bakery_id)
+    )
+    script = _script(
+        [ops.ModifyTableOps("reviews", [create_index])],
+        [ops.ModifyTableOps("reviews", [create_index.reverse()])],
+    )
+
+    use_concurrent_indexes(None, None, [script])
+
+    (upgrade,) = script.upgrade_ops.ops[0].ops
+    (downgrade,) = script.downgrade_ops.ops[0].ops
+    assert isinstance(upgrade, CreateIndexConcurrentlyOp)
+    assert upgrade.columns == ["bakery_id"]
+    assert isinstance(downgrade, DropIndexConcurrentlyOp)
+    assert (
+        "op.create_index_concurrently('ix_reviews_bakery_id', 'reviews', ['bakery_id'])"
+        in render_python_code(script.upgrade_ops)
+    )
+
+
+def test_new_table_indexes_stay_plain():
+    create_index = ops.CreateIndexOp.from_index(
+        Index("ix_bakery_cards_review_count", bakery_cards.c.review_count)
+    )
+    script = _script(
+        [ops.CreateTableOp.from_table(bakery_cards), create_index],
+        [ops.DropTableOp.from_table(bakery_cards)],
+    )
+
+    use_concurrent_indexes(None, None, [script])
+
+    assert script.upgrade_ops.ops[1] is create_index
@@ -0,0 +1,120 @@
+from datetime import datetime
+
+import pytest
+
+from app.core.review_like import (
+    REVIEW_LIKE_DELTA,
+    REVIEW_LIKE_DELTA_FLUSHING,
+    REVIEW_LIKE_PENDING,
+    REVIEW_LIKE_PENDING_FLUSHING,
+    buffer_review_like,
+    clear_flushing_likes,
+    get_buffered_like,
+    merge_buffered_review_likes,
+    parse_pending_likes,
+    take_pending_likes,
+)
+from app.schema.review import BakeryReview
+
+
+def test_parse_pending_likes():
+    pending = {"1:10": "1", "2:10": "0", "1:11": "1"}
+
+    likes, unlikes = parse_pending_likes(pending)
+
+    assert sorted(likes) == [(1, 10), (1, 11)]
+    assert unlikes == [(2, 10)]
+
+
+def test_parse_pending_likes_empty():
+    assert parse_pending_likes({}) == ([], [])
+
+
+def _review(review_id: int, like_count: int, is_like: bool) -> BakeryReview:
+    return BakeryReview(
+        user_name="유저",
+        review_id=review_id,
+        review_content="맛있어요",
+        review_rating=5,
+        review_like_count=like_count,
+        review_created_at=datetime(2025, 1, 1),
+        is_like=is_like,
+    )
+
+
+@pytest.mark.asyncio
+async def test_buffer_review_like_only_records_changes(fake_redis):
+    # DB 기준 좋아요 안 한 상태에서 좋아요 -> 같은 요청 반복은 무시
+    assert await buffer_review_like(1, 10, is_like=True, db_is_like=False)
+    assert not await buffer_review_like(1, 10, is_like=True, db_is_like=False)
+    assert await fake_redis.hget(REVIEW_LIKE_DELTA, "10") == "1"
+
+    # 해지 후 다시 해지 -> 증감값은 원래대로
+    assert await buffer_review_like(1, 10, is_like=False, db_is_like=False)
+    assert not await buffer_review_like(1, 10, is_like=False, db_is_like=False)
+    assert await fake_redis.hget(REVIEW_LIKE_DELTA, "10") == "0"
+    assert await get_buffered_like(1, 10) is False
+
+
+@pytest.mark.asyncio
+async def test_buffer_review_like_uses_db_state(fake_redis):
+    # DB 에 이미 좋아요가 있으면 좋아요 요청은 무시
+    assert not await buffer_review_like(1, 10, is_like=True, db_is_like=True)
+    assert await get_buffered_like(1, 10) is None
+
+    assert await buffer_review_like(1, 10, is_like=False, db_is_like=True)
+    assert await fake_redis.hget(REVIEW_LIKE_DELTA, "10") == "-1"
+
+
+@pytest.mark.asyncio
+async def test_take_pending_likes_keeps_failed_flush(fake_redis):
+    await buffer_review_like(1, 10, is_like=True, db_is_like=False)
+
+    assert await take_pending_likes() == {"1:10": "1"}
+    assert not await fake_redis.exists(REVIEW_LIKE_PENDING, REVIEW_LIKE_DELTA)
+    assert await fake_redis.hget(REVIEW_LIKE_DELTA_FLUSHING, "10") == "1"
+
+    # 반영중 버퍼의 상태를 기준으로 판단하고, 새 요청은 다음 버퍼에 기록
+    assert await get_buffered_like(1, 10) is True
+    assert not await buffer_review_like(1, 10, is_like=True, db_is_like=False)
+    assert await buffer_review_like(2, 10, is_like=True, db_is_like=False)
+
+    # 반영 실패 (clear 전) -> 같은 버퍼를 다시 반영
+    assert await take_pending_likes() == {"1:10": "1"}
+
+    await clear_flushing_likes()
+    assert not await fake_redis.exists(REVIEW_LIKE_PENDING_FLUSHING)
+    assert await take_pending_likes() == {"2:10": "1"}
+
+
+@pytest.mark.asyncio
+async def test_take_pending_likes_empty(fake_redis):
+    assert await take_pending_likes() == {}
+    assert not await fake_redis.exists(REVIEW_LIKE_PENDING_FLUSHING)
+
+
+@pytest.mark.asyncio
+async def test_merge_buffered_review_likes(fake_redis):
+    await buffer_review_like(1, 10, is_like=True, db_is_like=False)
+    await take_pending_likes()
+    await buffer_review_like(2, 10, is_like=True, db_is_like=False)
+    await buffer_review_like(1, 11, is_like=False, db_is_like=True)
+
+    reviews = await merge_buffered_review_likes(
+        user_id=1,
+        reviews=[_review(10, 3, False), _review(11, 5, True), _review(12, 1, True)],
+    )
+
+    # 반영중 버퍼 + 새 버퍼 증감값을 모두 합침
+    assert [(r.review_like_count, r.is_like) for r in reviews] == [
+        (5, True),
+        (4, False),
+        (1, True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_merge_buffered_review_likes_without_buffer(fake_redis):
+    reviews = [_review(10, 3, False)]
+
+    assert await merge_buffered_review_likes(user_id=1, reviews=reviews) is reviews
@@ -0,0 +1,25 @@
+import datetime
+
+from app.core.schedule import OperatingSchedule
+
+
+def test_open_status_uses_weekday_of_now():
+    schedule = OperatingSchedule()
+    schedule._hours = {
+        1: {
+            0: (True, datetime.time(9, 0), datetime.time(18, 0)),
+            1: (False, None, None),
+        }
+    }
+    monday_noon = datetime.datetime(2025, 7, 21, 12, 0)
+    tuesday_noon = datetime.datetime(2025, 7, 22, 12, 0)
+
+    assert schedule.open_status(1, monday_noon) == "O"
+    assert schedule.open_status(1, tuesday_noon) == "D"
+
+
+def test_open_status_without_schedule_is_day_off():
+    schedule = OperatingSchedule()
+    schedule._hours = {2: {}}
+
+    assert schedule.open_status(2, datetime.datetime(2025, 7, 21, 12, 0)) == "D"
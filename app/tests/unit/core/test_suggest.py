@@ -0,0 +1,79 @@
+import random
+
+from app.core.suggest import SuggestIndex, SuggestSource
+
+
+def build_index():
+    index = SuggestIndex()
+    index.replace_all(
+        [
+            SuggestSource(1, "성심당 본점", 100, ("튀김소보로", "소금빵")),
+            SuggestSource(2, "소금집", 10, ("소금빵",)),
+        ]
+    )
+    return index
+
+
+def test_search_prefix_sorted_by_weight():
+    res = build_index().search("소금")
+
+    assert [(e.type, e.text) for e in res] == [
+        ("bakery", "소금집"),
+        ("menu", "소금빵"),
+    ]
+
+
+def test_search_word_prefix():
+    res = build_index().search("본점")
+
+    assert [e.bakery_id for e in res] == [1]
+
+
+def test_search_choseong():
+    res = build_index().search("ㅅㅅㄷㅂ")
+
+    assert [e.text for e in res] == ["성심당 본점"]
+
+
+def test_update_removes_missing_bakery():
+    index = build_index()
+    index.update([2], [])
+
+    assert [e.text for e in index.search("소금")] == ["소금빵"]
+
+
+def test_update_changes_menu_weight():
+    index = build_index()
+    index.update([1], [SuggestSource(1, "성심당 본점", 100, ("튀김소보로",))])
+
+    assert [(e.text, e.weight) for e in index.search("소금빵")] == [("소금빵", 1)]
+    assert [e.text for e in index.search("튀")] == ["튀김소보로"]
+
+
+def test_incremental_update_matches_full_rebuild():
+    rng = random.Random(0)
+    names = ["소금빵", "소보로", "식빵", "크루아상", "바게트", "베이글"]
+
+    def random_source(bakery_id):
+        menus = tuple(rng.sample(names, rng.randint(0, 3)))
+        return SuggestSource(bakery_id, f"빵집{bakery_id}", rng.randint(0, 50), menus)
+
+    sources = {i: random_source(i) for i in range(1, 30)}
+    index = SuggestIndex()
+    index.replace_all(sources.values())
+
+    for _ in range(20):
+        changed = rng.sample(range(1, 35), 5)
+        updated = []
+        for bakery_id in changed:
+            if rng.random() < 0.2:
+                sources.pop(bakery_id, None)
+            else:
+                sources[bakery_id] = random_source(bakery_id)
+                updated.append(sources[bakery_id])
+        index.update(changed, updated)
+
+    rebuilt = SuggestIndex()
+    rebuilt.replace_all(sources.values())
+    for keyword in ["소", "ㅅ", "빵", "빵집1", "ㅂㅈ", "베이", "크루아"]:
+        assert index.search(keyword, size=30) == rebuilt.search(keyword, size=30)
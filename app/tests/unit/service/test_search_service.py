@@ -0,0 +1,74 @@
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.suggest import SuggestIndex, SuggestSource
+from app.core.suggest_changes import record_suggest_changes
+from app.services import search_service
+from app.services.search_service import SearchService
+
+
+def _source(bakery_id: int, name: str) -> SuggestSource:
+    return SuggestSource(
+        bakery_id=bakery_id, name=name, review_count=0, menu_names=("소금빵",)
+    )
+
+
+@pytest.fixture
+def search_repo(mocker):
+    repo = MagicMock()
+    mocker.patch.object(search_service, "SearchRepository", return_value=repo)
+    return repo
+
+
+@pytest.fixture
+def index(mocker):
+    index = SuggestIndex()
+    mocker.patch.object(search_service, "suggest_index", index)
+    return index
+
+
+@pytest.mark.asyncio
+async def test_refresh_search_documents_records_changes(fake_redis, search_repo):
+    search_repo.get_bakery_ids_changed_since = AsyncMock(return_value=[1, 2])
+    search_repo.upsert_search_documents = AsyncMock()
+
+    await SearchService(db=None).refresh_search_documents(
+        since=datetime(2025, 1, 1, tzinfo=timezone.utc)
+    )
+
+    search_repo.upsert_search_documents.assert_awaited_once_with(bakery_ids=[1, 2])
+    assert await fake_redis.zrange("suggest:changed", 0, -1) == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_suggest_index(fake_redis, search_repo, index):
+    search_repo.get_suggest_sources = AsyncMock(
+        return_value=[_source(1, "빵집"), _source(2, "베이커리")]
+    )
+
+    # 처음에는 전체 색인 생성
+    await SearchService(db=None).refresh_suggest_index(since=None)
+    assert {e.bakery_id for e in index.search("빵집")} == {1}
+
+    # 다른 인스턴스가 갱신한 베이커리만 반영 (2번은 삭제됨)
+    since = time.time()
+    await record_suggest_changes([1, 2])
+    search_repo.get_suggest_sources = AsyncMock(return_value=[_source(1, "빵가게")])
+    await SearchService(db=None).refresh_suggest_index(since=since)
+
+    search_repo.get_suggest_sources.assert_awaited_once_with(bakery_ids=[1, 2])
+    assert index.search("빵집") == []
+    assert index.search("베이커리") == []
+    assert [e.bakery_id for e in index.search("빵가게")] == [1]
+
+
+@pytest.mark.asyncio
+async def test_refresh_suggest_index_without_changes(fake_redis, search_repo, index):
+    search_repo.get_suggest_sources = AsyncMock()
+
+    await SearchService(db=None).refresh_suggest_index(since=time.time())
+
+    search_repo.get_suggest_sources.assert_not_awaited()
@@ -0,0 +1,36 @@
+import httpx
+import pytest
+
+from app.core.exception import UnknownException
+from app.services.tour_service import check_tour_response
+
+
+def _response(status_code: int = 200, **kwargs) -> httpx.Response:
+    return httpx.Response(status_code, **kwargs)
+
+
+def test_check_tour_response_ok():
+    body = {
+        "response": {
+            "header": {"resultCode": "0000", "resultMsg": "OK"},
+            "body": {"items": {"item": [{"title": "축제"}]}},
+        }
+    }
+
+    assert check_tour_response(_response(json=body)) == body
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        _response(500, text="error"),
+        # 호출 한도 초과는 XML 로 내려온다
+        _response(text="<OpenAPI_ServiceResponse>LIMITED</OpenAPI_ServiceResponse>"),
+        _response(
+            json={"response": {"header": {"resultCode": "22", "resultMsg": "LIMITED"}}}
+        ),
+    ],
+)
+def test_check_tour_response_error(response):
+    with pytest.raises(UnknownException):
+        check_tour_response(response)
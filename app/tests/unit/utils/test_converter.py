@@ -1,8 +1,17 @@
 import datetime
+from io import BytesIO
 
 import pytest
+from PIL import Image
 
-from app.utils.converter import operating_hours_to_open_status
+from app.utils.converter import (
+    encode_webp_variants,
+    operating_hours_to_open_status,
+    to_chunks,
+    to_search_document,
+    to_signature_menus,
+    variant_filename,
+)
 
 
 def test_operating_hours_to_open_status_day_off():
@@ -35,3 +44,60 @@ def test_operating_hours_to_open_status_close():
     open_time = datetime.time(9, 00, 00)
 
     assert operating_hours_to_open_status(is_opened, close_time, open_time) == "C"
+
+
+def test_operating_hours_to_open_status_with_now():
+    open_time = datetime.time(9, 0, 0)
+    close_time = datetime.time(18, 0, 0)
+
+    def status(now):
+        return operating_hours_to_open_status(True, close_time, open_time, now=now)
+
+    assert status(datetime.time(8, 0, 0)) == "B"
+    assert status(datetime.time(12, 0, 0)) == "O"
+    assert status(datetime.time(19, 0, 0)) == "C"
+
+
+def test_to_search_document():
+    document = to_search_document(
+        "빵굽는 Bakery", "강남구", None, ["소금빵", "소금빵", "크루아상"]
+    )
+
+    assert document == "빵굽는 bakery 강남구 소금빵 크루아상"
+
+
+def test_variant_filename():
+    assert variant_filename("abc.webp", "thumb") == "abc_thumb.webp"
+    assert variant_filename("abc.webp", "full") == "abc.webp"
+
+
+def test_encode_webp_variants_resizes_long_edge():
+    buffer = BytesIO()
+    Image.new("RGB", (2000, 1000)).save(buffer, format="PNG")
+
+    variants = encode_webp_variants(buffer.getvalue())
+
+    sizes = {k: Image.open(BytesIO(v)).size for k, v in variants.items()}
+    assert sizes == {"thumb": (320, 160), "detail": (1080, 540), "full": (2000, 1000)}
+
+
+def test_encode_webp_variants_keeps_original_webp():
+    buffer = BytesIO()
+    Image.new("RGB", (100, 100)).save(buffer, format="WEBP")
+
+    variants = encode_webp_variants(buffer.getvalue(), keep_original=True)
+
+    assert variants["full"] == buffer.getvalue()
+
+
+def test_to_signature_menus():
+    assert to_signature_menus(["소금빵", "크루아상"]) == [
+        {"menu_name": "소금빵"},
+        {"menu_name": "크루아상"},
+    ]
+    assert to_signature_menus(None) == []
+
+
+def test_to_chunks():
+    assert list(to_chunks([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+    assert list(to_chunks([], 2)) == []
@@ -0,0 +1,34 @@
+from app.utils.hangul import is_choseong_only, normalize_text, to_choseong, to_jamo
+
+
+def test_to_choseong_hangul():
+    assert to_choseong("소금빵") == "ㅅㄱㅃ"
+
+
+def test_to_choseong_keeps_other_chars():
+    assert to_choseong("빵 bakery 1") == "ㅃ bakery 1"
+
+
+def test_to_jamo_matches_partial_input():
+    document = to_jamo("소금빵 과자")
+
+    assert document == "ㅅㅗㄱㅡㅁㅃㅏㅇ ㄱㅗㅏㅈㅏ"
+    assert to_jamo("소금빠") in document
+    assert to_jamo("소금ㅃ") in document
+    assert to_jamo("괒") in document
+    assert to_jamo("고") in document
+
+
+def test_to_jamo_keeps_other_chars():
+    assert to_jamo("bread 1") == "bread 1"
+
+
+def test_is_choseong_only():
+    assert is_choseong_only("ㅅㄱㅃ") is True
+    assert is_choseong_only("ㅅㄱ ㅃ") is True
+    assert is_choseong_only("ㅅ금빵") is False
+    assert is_choseong_only(" ") is False
+
+
+def test_normalize_text():
+    assert normalize_text("  Salt   Bread ") == "salt bread"
@@ -0,0 +1,109 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.core.exception import InvalidCursorException, InvalidSortParameterException
+from app.model.review import Review
+from app.utils.pagination import SortSpec, decode_cursor, encode_cursor, pick_sort
+
+LIKE_COUNT_SORT = SortSpec(
+    name="reviews:like_count", column=Review.like_count, pk_column=Review.id
+)
+
+
+@pytest.mark.parametrize(
+    "sort_value",
+    [
+        12,
+        Decimal("4.125"),
+        datetime.datetime(2025, 7, 22, 12, 34, 56, 123456),
+        datetime.datetime(2025, 7, 22, 12, 34, 56, tzinfo=datetime.timezone.utc),
+        "우리동네 빵집",
+        None,
+    ],
+)
+def test_cursor_roundtrip(sort_value):
+    cursor = encode_cursor("scope", sort_value, 1234)
+
+    assert decode_cursor("scope", cursor) == (sort_value, 1234)
+
+
+def test_cursor_rejects_tampered_value():
+    cursor = encode_cursor("scope", 12, 1234)
+    tampered = ("A" if cursor[0] != "A" else "B") + cursor[1:]
+
+    with pytest.raises(InvalidCursorException):
+        decode_cursor("scope", tampered)
+
+
+def test_cursor_rejects_other_scope():
+    cursor = encode_cursor("reviews:like_count:desc", 12, 1234)
+
+    with pytest.raises(InvalidCursorException):
+        decode_cursor("reviews:like_count:asc", cursor)
+
+
+def test_cursor_rejects_legacy_text_cursor():
+    with pytest.raises(InvalidCursorException):
+        LIKE_COUNT_SORT.where("12||1234")
+
+
+@pytest.mark.parametrize("cursor_value", [None, "", "0", "0||0"])
+def test_sort_spec_first_page(cursor_value):
+    assert LIKE_COUNT_SORT.where(cursor_value) == []
+
+
+def test_sort_spec_next_cursor():
+    rows = [{"like_count": 10 - i, "id": 100 - i} for i in range(4)]
+
+    assert LIKE_COUNT_SORT.next_cursor(rows, page_size=4) is None
+
+    cursor = LIKE_COUNT_SORT.next_cursor(rows, page_size=3)
+    assert decode_cursor(LIKE_COUNT_SORT.scope, cursor) == (8, 98)
+    assert len(LIKE_COUNT_SORT.where(cursor)) == 1
+
+
+def test_pick_sort():
+    sort = pick_sort({"like_count": LIKE_COUNT_SORT}, "like_count", "asc")
+
+    assert sort.scope == "reviews:like_count:asc"
+    with pytest.raises(InvalidSortParameterException):
+        pick_sort({"like_count": LIKE_COUNT_SORT}, "rating", "asc")
+    with pytest.raises(InvalidSortParameterException):
+        pick_sort({"like_count": LIKE_COUNT_SORT}, "like_count", "up")
+
+
+def _compile(clauses) -> str:
+    return " ".join(
+        str(c.compile(compile_kwargs={"render_postcompile": True})) for c in clauses
+    )
+
+
+def test_sort_spec_requires_nulls_as_for_nullable_column():
+    with pytest.raises(ValueError):
+        SortSpec(name="reviews:rating", column=Review.rating, pk_column=Review.id)
+
+
+def test_sort_spec_coalesces_nullable_column():
+    sort = SortSpec(
+        name="reviews:rating", column=Review.rating, pk_column=Review.id, nulls_as=0
+    )
+    rows = [{"rating": None, "id": 100 - i} for i in range(4)]
+
+    # NULL 정렬값은 nulls_as 로 커서에 담고, 정렬/비교 모두 같은 COALESCE 사용
+    cursor = sort.next_cursor(rows, page_size=3)
+    assert decode_cursor(sort.scope, cursor) == (0, 98)
+    assert "coalesce(reviews.rating, 0)" in _compile(sort.where(cursor))
+    assert "coalesce(reviews.rating, 0)" in _compile(sort.order_by())
+
+    # 이전에 발급된 NULL 정렬값 커서도 nulls_as 로 이어서 조회
+    legacy = encode_cursor(sort.scope, None, 98)
+    assert _compile(sort.where(legacy)) == _compile(sort.where(cursor))
+
+
+def test_sort_spec_rejects_null_cursor_for_not_null_column():
+    cursor = encode_cursor(LIKE_COUNT_SORT.scope, None, 98)
+
+    with pytest.raises(InvalidCursorException):
+        LIKE_COUNT_SORT.where(cursor)
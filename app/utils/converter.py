@@ -1,14 +1,17 @@
+import asyncio
 import uuid
-from collections import defaultdict
 from datetime import datetime, time
 from io import BytesIO
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import UploadFile
 from PIL import Image
 
+from app.core.const import IMAGE_VARIANT_FULL, IMAGE_VARIANTS
 from app.core.exception import ConvertImageException, UnknownException
+from app.core.executor import get_image_executor
 from app.utils.date import get_now_by_timezone
+from app.utils.hangul import normalize_text
 from app.utils.parser import parse_comma_to_list
 
 AREA_TO_SIGUNGU = {
@@ -32,6 +35,13 @@ read_more_link_domain = (
 )
 
 
+def to_chunks(items: list, size: int):
+    """items를 size개씩 나눠서 반환하는 메소드. (bind parameter 개수 제한 등)"""
+
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
 def user_info_to_id(user_info) -> int:
     """유저정보에서 user_id 추출/반환하는 메소드."""
 
@@ -72,9 +82,11 @@ def operating_hours_to_open_status(
     is_opened: Optional[bool] = None,
     close_time: Optional[time] = None,
     open_time: Optional[time] = None,
+    now: Optional[time] = None,
 ):
     """영업시간 데이터 기반으로 영업상태 ENUM 반환하는 메소드."""
-    now = get_now_by_timezone().time()
+    if now is None:
+        now = get_now_by_timezone().time()
 
     if not is_opened:
         # 휴무일
@@ -95,6 +107,18 @@ def operating_hours_to_open_status(
             return "O"
 
 
+def to_search_document(
+    name: str, gu: Optional[str], dong: Optional[str], menu_names: List[str]
+) -> str:
+    """빵집이름 + 구 + 동 + 메뉴이름으로 검색용 문서 만드는 메소드.
+
+    관련도 계산시 앞부분 일치에 가산점을 주기 때문에 빵집이름을 맨 앞에 둔다.
+    """
+
+    words = [name, gu, dong, *dict.fromkeys(menu_names)]
+    return normalize_text(" ".join(w for w in words if w))
+
+
 def replace_space_with_plus(title: str) -> str:
     """다음 사이트에서 검색화면으로 넘어갈 수 있는 링크로 변환하는 메소드."""
 
@@ -114,46 +138,86 @@ def to_cursor_str(value) -> str:
         raise ValueError(f"지원하지 않는 커서 타입입니다: {type(value)}")
 
 
-async def convert_img_to_webp(img_list: List[UploadFile]):
-    """webp 외의 확장자를 가진 이미지파일 webp로 변환하는 메소드."""
-    upload_files = []
+def variant_filename(filename: str, variant: str) -> str:
+    """원본 파일명으로 variant 파일명 만드는 메소드. (full은 원본 파일명 그대로)
 
-    try:
-        for img in img_list:
-            # 1. 확장자 분류
-            org_ext = img.filename.split(".")[-1].lower()
-            img_data = await img.read()
-
-            # 2. webp가 아닌 확장자만 파일 변경
-            if org_ext == "webp":
-                upload_data = img_data
-            else:
-                try:
-                    target_img = Image.open(BytesIO(img_data)).convert("RGB")
-                    buffer = BytesIO()
-                    target_img.save(buffer, format="WEBP", quality=80)
-                    buffer.seek(0)
-                    upload_data = buffer.read()
-                except:
-                    raise ConvertImageException()
-
-            filename = f"{uuid.uuid4()}.webp"
-            upload_files.append((upload_data, filename))
-
-        return upload_files
-    except Exception as e:
-        print(str(e))
-    return upload_files
+    "abc.webp", "thumb" -> "abc_thumb.webp"
+    """
+
+    if variant == IMAGE_VARIANT_FULL:
+        return filename
+    stem, ext = filename.rsplit(".", 1)
+    return f"{stem}_{variant}.{ext}"
+
+
+def encode_webp_variants(
+    img_data: bytes, keep_original: bool = False, quality: int = 80
+) -> Dict[str, bytes]:
+    """이미지 bytes를 사이즈별 WEBP bytes로 인코딩하는 메소드. (프로세스 풀에서 실행)
+
+    keep_original : 이미 webp인 경우 full은 다시 인코딩하지 않고 원본 사용
+    """
+
+    variants = {}
+    with Image.open(BytesIO(img_data)) as img:
+        rgb = img.convert("RGB")
+        for variant, max_size in IMAGE_VARIANTS.items():
+            if max_size is None and keep_original:
+                variants[variant] = img_data
+                continue
+
+            resized = rgb.copy() if max_size else rgb
+            if max_size:
+                # 비율 유지하면서 긴 변을 max_size 이하로 축소 (확대는 하지 않음)
+                resized.thumbnail((max_size, max_size))
+
+            buffer = BytesIO()
+            resized.save(buffer, format="WEBP", quality=quality)
+            variants[variant] = buffer.getvalue()
+    return variants
+
+
+async def convert_images_to_webp(
+    images: List[Tuple[bytes, str]],
+) -> List[Dict[str, Tuple[bytes, str]]]:
+    """(이미지 bytes, 원본 파일명) 목록을 사이즈별 webp로 변환하는 메소드.
+
+    이미지 하나당 {variant: (webp bytes, 파일명)} 반환.
+    PIL 디코딩/인코딩은 이벤트 루프를 막지 않도록 프로세스 풀에서 동시에 실행.
+    """
+
+    loop = asyncio.get_running_loop()
+    executor = get_image_executor()
+
+    async def convert(img_data: bytes, org_filename: str):
+        # 1. 확장자 분류 (webp면 full은 원본 그대로)
+        org_ext = org_filename.split(".")[-1].lower()
+
+        # 2. 사이즈별 webp 인코딩
+        try:
+            encoded = await loop.run_in_executor(
+                executor, encode_webp_variants, img_data, org_ext == "webp"
+            )
+        except Exception as e:
+            raise ConvertImageException() from e
+
+        filename = f"{uuid.uuid4()}.webp"
+        return {
+            variant: (data, variant_filename(filename, variant))
+            for variant, data in encoded.items()
+        }
+
+    return list(await asyncio.gather(*(convert(d, f) for d, f in images)))
+
+
+async def convert_img_to_webp(img_list: List[UploadFile]):
+    """webp 외의 확장자를 가진 이미지파일 사이즈별 webp로 변환하는 메소드."""
 
+    images = [(await img.read(), img.filename) for img in img_list]
+    return await convert_images_to_webp(images)
 
-def merge_menus_with_bakeries(bakeries: list, menus: list):
-    """베이커리 정보와 시그니처 메뉴 병합하는 메소드."""
 
-    menu_map = defaultdict(list)
-    for m in menus:
-        menu_map[m["bakery_id"]].append({"menu_name": m["menu_name"]})
+def to_signature_menus(menu_names: Optional[List[str]]) -> List[dict]:
+    """베이커리 카드의 대표 메뉴 이름 목록을 응답 형태로 변환하는 메소드."""
 
-    return [
-        b.model_copy(update={"signature_menus": menu_map.get(b.bakery_id, [])})
-        for b in bakeries
-    ]
+    return [{"menu_name": name} for name in menu_names or []]
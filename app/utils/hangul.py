@@ -0,0 +1,155 @@
+import re
+
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+# 초성 하나당 (중성 21개 * 종성 28개) 글자
+SYLLABLES_PER_CHOSEONG = 21 * 28
+
+CHOSEONG = [
+    "ㄱ",
+    "ㄲ",
+    "ㄴ",
+    "ㄷ",
+    "ㄸ",
+    "ㄹ",
+    "ㅁ",
+    "ㅂ",
+    "ㅃ",
+    "ㅅ",
+    "ㅆ",
+    "ㅇ",
+    "ㅈ",
+    "ㅉ",
+    "ㅊ",
+    "ㅋ",
+    "ㅌ",
+    "ㅍ",
+    "ㅎ",
+]
+CHOSEONG_SET = set(CHOSEONG)
+
+# 중성/종성은 입력 중인 글자도 찾을 수 있도록 키보드 입력 단위로 풀어서 사용
+# ex) "과" 는 ㄱ+ㅗ+ㅏ 로 입력하므로 "고" 입력 중에도 일치해야 함
+JUNGSEONG = [
+    "ㅏ",
+    "ㅐ",
+    "ㅑ",
+    "ㅒ",
+    "ㅓ",
+    "ㅔ",
+    "ㅕ",
+    "ㅖ",
+    "ㅗ",
+    "ㅗㅏ",
+    "ㅗㅐ",
+    "ㅗㅣ",
+    "ㅛ",
+    "ㅜ",
+    "ㅜㅓ",
+    "ㅜㅔ",
+    "ㅜㅣ",
+    "ㅠ",
+    "ㅡ",
+    "ㅡㅣ",
+    "ㅣ",
+]
+JONGSEONG = [
+    "",
+    "ㄱ",
+    "ㄲ",
+    "ㄱㅅ",
+    "ㄴ",
+    "ㄴㅈ",
+    "ㄴㅎ",
+    "ㄷ",
+    "ㄹ",
+    "ㄹㄱ",
+    "ㄹㅁ",
+    "ㄹㅂ",
+    "ㄹㅅ",
+    "ㄹㅌ",
+    "ㄹㅍ",
+    "ㄹㅎ",
+    "ㅁ",
+    "ㅂ",
+    "ㅂㅅ",
+    "ㅅ",
+    "ㅆ",
+    "ㅇ",
+    "ㅈ",
+    "ㅊ",
+    "ㅋ",
+    "ㅌ",
+    "ㅍ",
+    "ㅎ",
+]
+# 입력 중에 단독으로 들어오는 겹자모
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ",
+    "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ",
+    "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+}
+
+_whitespace = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """검색용으로 소문자 변환 및 공백 정리하는 메소드."""
+
+    return _whitespace.sub(" ", text or "").strip().lower()
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 변환하는 메소드. (한글 외 문자는 그대로 유지)"""
+
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_SYLLABLE_START <= code <= HANGUL_SYLLABLE_END:
+            chars.append(
+                CHOSEONG[(code - HANGUL_SYLLABLE_START) // SYLLABLES_PER_CHOSEONG]
+            )
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 자모 입력 순서대로 풀어서 변환하는 메소드. (한글 외 문자는 그대로 유지)
+
+    "소금빵" -> "ㅅㅗㄱㅡㅁㅃㅏㅇ" 이라서 입력 중인 "소금빠", "소금ㅃ" 도 부분 일치한다.
+    """
+
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_SYLLABLE_START <= code <= HANGUL_SYLLABLE_END:
+            index = code - HANGUL_SYLLABLE_START
+            chars.append(CHOSEONG[index // SYLLABLES_PER_CHOSEONG])
+            chars.append(JUNGSEONG[index % SYLLABLES_PER_CHOSEONG // len(JONGSEONG)])
+            chars.append(JONGSEONG[index % len(JONGSEONG)])
+        else:
+            chars.append(COMPOUND_JAMO.get(ch, ch))
+    return "".join(chars)
+
+
+def is_choseong_only(text: str) -> bool:
+    """공백 제외 초성으로만 이루어진 검색어인지 체크하는 메소드."""
+
+    chars = [ch for ch in text if not ch.isspace()]
+    return bool(chars) and all(ch in CHOSEONG_SET for ch in chars)
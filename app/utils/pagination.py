@@ -1,26 +1,29 @@
-from datetime import datetime
-from typing import Optional
+import base64
+import hashlib
+import hmac
+import struct
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple
 
-from sqlalchemy import Tuple, and_, asc, desc, func, or_, tuple_
+from sqlalchemy import asc, desc, func, literal, tuple_
 
-from app.core.exception import InvalidSortParameterException
-from app.model.bakery import Bakery
-from app.model.review import Review
+from app.core.config import Configs
+from app.core.exception import InvalidCursorException, InvalidSortParameterException
 
+config = Configs()
 
-def build_order_by_with_reviews(sort_column, direction):
-    """정렬 컬럼과 id를 기준으로 안정적인 ORDER BY 리스트 생성하는 메소드."""
+# 첫 페이지 요청으로 취급하는 커서값 (이전 버전 클라이언트 호환)
+FIRST_PAGE_CURSORS = {"", "0", "0||0"}
 
-    if direction == "desc":
-        return [desc(sort_column), desc(Review.id)]
-    else:
-        return [asc(sort_column), desc(Review.id)]
+CURSOR_VERSION = 1
+CURSOR_SIGNATURE_SIZE = 8
 
+# 커서 값 타입 태그
+_NONE, _INT, _FLOAT, _DECIMAL, _DATETIME, _NAIVE_DATETIME, _STR = range(7)
 
-def build_cursor(sort_value, review_id):
-    """다음 페이지 요청 시 넘겨줄 커서 문자열 생성하는 메소드."""
-
-    return f"{sort_value}||{review_id}"
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
 
 def convert_limit_and_offset(page_no: int, page_size: int):
@@ -32,93 +35,207 @@ def convert_limit_and_offset(page_no: int, page_size: int):
     return limit, offset
 
 
-def build_next_cursor(res, target_column: str, page_size: int):
-    """next_cursor값 반환하는 메소드."""
-
-    has_next = len(res) > page_size
-    if not has_next:
-        return None
+def _to_micros(value: datetime) -> int:
+    aware = value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    return (aware - _EPOCH) // timedelta(microseconds=1)
+
+
+def _pack_value(value) -> bytes:
+    """커서 정렬값을 타입 태그 + 바이너리로 변환하는 메소드."""
+
+    if value is None:
+        return bytes([_NONE])
+    if isinstance(value, bool):
+        return bytes([_INT]) + struct.pack(">q", int(value))
+    if isinstance(value, int):
+        return bytes([_INT]) + struct.pack(">q", value)
+    if isinstance(value, float):
+        return bytes([_FLOAT]) + struct.pack(">d", value)
+    if isinstance(value, Decimal):
+        encoded = str(value).encode()
+        return bytes([_DECIMAL, len(encoded)]) + encoded
+    if isinstance(value, datetime):
+        tag = _DATETIME if value.tzinfo else _NAIVE_DATETIME
+        return bytes([tag]) + struct.pack(">q", _to_micros(value))
+    if isinstance(value, str):
+        encoded = value.encode()
+        return bytes([_STR]) + struct.pack(">H", len(encoded)) + encoded
+    raise TypeError(f"unsupported cursor value : {type(value)}")
+
+
+def _unpack_value(payload: bytes, offset: int) -> Tuple[Any, int]:
+    """_pack_value로 변환한 값을 (값, 다음 offset) 으로 되돌리는 메소드."""
+
+    tag = payload[offset]
+    offset += 1
+    if tag == _NONE:
+        return None, offset
+    if tag == _INT:
+        return struct.unpack_from(">q", payload, offset)[0], offset + 8
+    if tag == _FLOAT:
+        return struct.unpack_from(">d", payload, offset)[0], offset + 8
+    if tag == _DECIMAL:
+        size = payload[offset]
+        start = offset + 1
+        return Decimal(payload[start : start + size].decode()), start + size
+    if tag in (_DATETIME, _NAIVE_DATETIME):
+        micros = struct.unpack_from(">q", payload, offset)[0]
+        value = _EPOCH + timedelta(microseconds=micros)
+        if tag == _NAIVE_DATETIME:
+            value = value.replace(tzinfo=None)
+        return value, offset + 8
+    if tag == _STR:
+        size = struct.unpack_from(">H", payload, offset)[0]
+        start = offset + 2
+        return payload[start : start + size].decode(), start + size
+    raise ValueError(f"unknown cursor value tag : {tag}")
+
+
+def _sign(scope: str, payload: bytes) -> bytes:
+    digest = hmac.new(
+        config.SECRET_KEY.encode(), scope.encode() + b"\x00" + payload, hashlib.sha256
+    ).digest()
+    return digest[:CURSOR_SIGNATURE_SIZE]
+
+
+def encode_cursor(scope: str, sort_value, cursor_id: int) -> str:
+    """(정렬값, id) 를 서명된 base64 커서로 변환하는 메소드.
+
+    scope : 커서를 발급한 정렬 (다른 정렬/방향에 재사용하지 못하도록 서명에 포함)
+    """
 
-    last = res[-1]
-    if hasattr(last, "_mapping"):
-        return str(last._mapping[target_column])
-    else:
-        return str(getattr(last, target_column, None))
+    payload = (
+        bytes([CURSOR_VERSION]) + _pack_value(sort_value) + struct.pack(">q", cursor_id)
+    )
+    token = payload + _sign(scope, payload)
+    return base64.urlsafe_b64encode(token).rstrip(b"=").decode()
 
 
-def build_multi_next_cursor(
-    res, target_sort_by_column: str, distinct_column: str, page_size: int
-):
-    """다중정렬 next_cursor값 반환하는 메소드."""
+def decode_cursor(scope: str, cursor_value: str) -> Tuple[Any, int]:
+    """서명된 커서를 (정렬값, id) 로 되돌리는 메소드."""
 
-    has_next = len(res) > page_size
-    if not has_next:
-        return None
+    try:
+        token = base64.urlsafe_b64decode(cursor_value + "=" * (-len(cursor_value) % 4))
+        payload = token[:-CURSOR_SIGNATURE_SIZE]
+        signature = token[-CURSOR_SIGNATURE_SIZE:]
+        if not payload or not hmac.compare_digest(signature, _sign(scope, payload)):
+            raise ValueError("invalid cursor signature")
+        if payload[0] != CURSOR_VERSION:
+            raise ValueError("unsupported cursor version")
 
-    last = res[-2]
-    if hasattr(last, "_mapping"):
-        first_arg = str(last._mapping[target_sort_by_column])
-        last_arg = str(last._mapping[distinct_column])
-    else:
-        first_arg = str(getattr(last, target_sort_by_column, None))
-        last_arg = str(getattr(last, distinct_column, None))
+        sort_value, offset = _unpack_value(payload, 1)
+        (cursor_id,) = struct.unpack_from(">q", payload, offset)
+        if offset + 8 != len(payload):
+            raise ValueError("invalid cursor length")
+    except Exception:
+        raise InvalidCursorException()
 
-    return f"{first_arg}||{last_arg}"
+    return sort_value, cursor_id
 
 
-def build_order_by(sort_column, sort_pk_column, direction):
-    """정렬 컬럼과 id를 기준으로 안정적인 ORDER BY 리스트 생성하는 메소드."""
-    if direction == "desc":
-        return [desc(sort_column), desc(sort_pk_column)]
-    else:
-        return [asc(sort_column), asc(sort_pk_column)]
+@dataclass(frozen=True)
+class SortSpec:
+    """keyset 페이징 정렬 정의.
 
+    (column, pk_column) 을 같은 방향으로 정렬하고, 다음 페이지는
+    row-value 비교 (column, pk_column) < (:value, :id) 로 이어서 조회한다.
+    column 없이 pk_column 만 주면 id 단일 정렬.
 
-def build_multi_cursor_filter(
-    sort_column, sort_pk_column, sort_value, cursor_id, direction: str
-):
-    """다중정렬 커서의 where절 반환하는 메소드.
+    NULL 과의 row-value 비교는 NULL 이라서 다음 페이지가 비어버리므로,
+    nullable 컬럼은 nulls_as 를 지정해서 정렬/비교 모두 COALESCE(column, nulls_as) 로 한다.
 
-    Args:
-        sort_column (_type_): Review.created_at
-        sort_pk_column (_type_): Review.id
-        sort_value (_type_): 2025-08-18 14:26:12.951
-        cursor_id (_type_): 23
-        direction (str): desc || asc
+    - name     : 커서 서명 scope (정렬마다 고유하게)
+    - key      : 조회 결과에서 정렬값을 꺼낼 key (기본값 column.key)
+    - pk_key   : 조회 결과에서 id를 꺼낼 key
+    - index    : 이 정렬이 타야 하는 인덱스 이름 (쿼리 플랜 확인용)
+    - nulls_as : column 이 NULL 일 때 대신 쓸 정렬값 (nullable 컬럼이면 필수)
     """
 
-    is_desc = direction == "desc"
+    name: str
+    pk_column: Any
+    column: Any = None
+    direction: str = "desc"
+    key: Optional[str] = None
+    pk_key: str = "id"
+    index: Optional[str] = None
+    nulls_as: Any = None
+
+    def __post_init__(self):
+        if getattr(self.column, "nullable", False) and self.nulls_as is None:
+            raise ValueError(f"nullable sort column needs nulls_as : {self.name}")
+
+    @property
+    def scope(self) -> str:
+        return f"{self.name}:{self.direction}"
+
+    @property
+    def sort_key(self) -> str:
+        return self.key or self.column.key
+
+    @property
+    def sort_column(self):
+        """정렬/비교에 쓰는 컬럼 반환하는 메소드. (nulls_as 있으면 COALESCE)"""
+
+        if self.nulls_as is None:
+            return self.column
+        # 인덱스 표현식과 같아지도록 bind parameter 대신 값을 그대로 렌더링
+        return func.coalesce(self.column, literal(self.nulls_as, literal_execute=True))
+
+    def order_by(self) -> list:
+        """ORDER BY 절 반환하는 메소드."""
+
+        order = desc if self.direction == "desc" else asc
+        columns = (
+            [self.pk_column]
+            if self.column is None
+            else [self.sort_column, self.pk_column]
+        )
+        return [order(c) for c in columns]
+
+    def where(self, cursor_value: Optional[str]) -> list:
+        """커서 이후 행만 조회하는 where절 반환하는 메소드. (첫 페이지면 빈 리스트)"""
+
+        if cursor_value is None or cursor_value in FIRST_PAGE_CURSORS:
+            return []
+
+        sort_value, cursor_id = decode_cursor(self.scope, cursor_value)
+
+        if self.column is None:
+            left, right = self.pk_column, cursor_id
+        else:
+            if sort_value is None:
+                # nulls_as 없는 정렬은 NULL 정렬값 커서를 발급하지 않는다
+                if self.nulls_as is None:
+                    raise InvalidCursorException()
+                sort_value = self.nulls_as
+            left = tuple_(self.sort_column, self.pk_column)
+            right = tuple_(
+                literal(sort_value, type_=self.column.type),
+                literal(cursor_id, type_=self.pk_column.type),
+            )
+
+        return [left < right if self.direction == "desc" else left > right]
 
-    if sort_value is None and cursor_id is None:
-        return []
+    def next_cursor(self, rows, page_size: int) -> Optional[str]:
+        """page_size + 1 개 조회한 결과로 다음 페이지 커서 반환하는 메소드."""
 
-    if is_desc:
+        if len(rows) <= page_size:
+            return None
+
+        last = rows[page_size - 1]
+        mapping = last._mapping if hasattr(last, "_mapping") else last
+        sort_value = None
+        if self.column is not None:
+            sort_value = mapping[self.sort_key]
+            if sort_value is None:
+                sort_value = self.nulls_as
+        return encode_cursor(self.scope, sort_value, mapping[self.pk_key])
 
-        return [
-            or_(
-                sort_column < sort_value,
-                and_(
-                    sort_column == sort_value,
-                    sort_pk_column <= cursor_id,
-                ),
-            )
-        ]
-    else:
-        return [
-            or_(
-                sort_column > sort_value,
-                and_(
-                    sort_column == sort_value,
-                    sort_pk_column >= cursor_id,
-                ),
-            )
-        ]
 
+def pick_sort(sorts: Dict[str, SortSpec], sort_by: str, direction: str) -> SortSpec:
+    """지원하는 정렬 중에서 sort_by 정렬을 direction 방향으로 반환하는 메소드."""
 
-def build_multi_next_cursor_real(sort_by, res, page_size: int):
-    has_next = len(res) > page_size
-    if has_next:
-        next_cursor, next_cusor_pk = res[-1][sort_by], res[-1].id
-        return f"{next_cursor}||{next_cusor_pk}"
-    else:
-        return None
+    spec = sorts.get(sort_by)
+    if spec is None or direction not in ("asc", "desc"):
+        raise InvalidSortParameterException()
+    return replace(spec, direction=direction)
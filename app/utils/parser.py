@@ -1,5 +1,3 @@
-from datetime import datetime
-
 from app.core.const import BADGE_METRICS
 from app.core.exception import InvalidSortParameterException
 from app.model.badge import UserMetrics
@@ -11,29 +9,6 @@ def parse_comma_to_list(area_code: str) -> list[str]:
     return [code.strip() for code in area_code.split(",") if code.strip()]
 
 
-def parse_value(value_str: str, sort_by: str):
-    """커서 문자열을 정렬 필드에 맞는 타입으로 변환하는 메소드."""
-
-    if sort_by == "created_at":
-        return datetime.fromisoformat(value_str)
-    elif sort_by in {"rating", "like_count"}:
-        return float(value_str)
-    else:
-        return value_str
-
-
-def parse_cursor_value(cursor_value: str, sort_by: str):
-    """sort_value:review_id 형태의 커서를 파싱하여 비교 가능한 값으로 분리하는 메소드."""
-
-    if cursor_value == "0||0":
-        return None, None
-    try:
-        sort_value_str, id_str = cursor_value.split("||")
-        return parse_value(sort_value_str, sort_by), int(id_str)
-    except Exception:
-        raise InvalidSortParameterException()
-
-
 def build_sort_clause(sort_clause: str, split_standard: str = "."):
     """정렬 조건 문자열을 기준 컬럼과 정렬 방향으로 분리"""
 
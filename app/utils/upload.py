@@ -21,23 +21,31 @@ supabase: Client = create_client(
 async def upload_multiple_to_supabase_storage(
     files: List[Tuple[bytes, str]],
 ) -> List[str]:
-    """여러 이미지를 Supabase 버킷에 업로드하는 메소드."""
+    """여러 이미지를 Supabase 버킷에 동시에 업로드하는 메소드.
 
-    loop = asyncio.get_event_loop()
+    동시 업로드 수는 IMAGE_UPLOAD_CONCURRENCY 로 제한.
+    """
 
-    for file_bytes, filename in files:
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(config.IMAGE_UPLOAD_CONCURRENCY)
+
+    async def upload(file_bytes: bytes, filename: str):
         # Supabase Storage에 저장될 경로 설정
         path_in_bucket = f"images/{filename}"
 
-        try:
-            await loop.run_in_executor(
-                None,
-                partial(
-                    supabase.storage.from_(SUPABASE_BUCKET).upload,
-                    path_in_bucket,
-                    file_bytes,
-                    {"content-type": "image/webp"},
-                ),
-            )
-        except Exception as e:
-            raise UploadImageException(f"Error processing {filename}: {e}") from e
+        async with semaphore:
+            try:
+                await loop.run_in_executor(
+                    None,
+                    partial(
+                        supabase.storage.from_(SUPABASE_BUCKET).upload,
+                        path_in_bucket,
+                        file_bytes,
+                        {"content-type": "image/webp"},
+                    ),
+                )
+            except Exception as e:
+                raise UploadImageException(f"Error processing {filename}: {e}") from e
+
+    await asyncio.gather(*(upload(b, f) for b, f in files))
+    return [filename for _, filename in files]
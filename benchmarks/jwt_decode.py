@@ -0,0 +1,48 @@
+"""access_token 검증 비용 비교 벤치마크.
+
+python-jose / PyJWT 디코딩과 VerifiedTokenCache 조회 시간을 비교한다.
+
+    python -m benchmarks.jwt_decode --number 20000
+"""
+
+import argparse
+import time
+import timeit
+
+import jwt as pyjwt
+from jose import jwt as jose_jwt
+
+from app.core.auth import VerifiedTokenCache
+
+SECRET_KEY = "benchmark-secret-key-0123456789abcdef"
+ALGORITHM = "HS256"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    now = int(time.time())
+    token = jose_jwt.encode(
+        {"sub": "1", "iat": now, "exp": now + 60 * 30}, SECRET_KEY, algorithm=ALGORITHM
+    )
+
+    cache = VerifiedTokenCache(maxsize=10000)
+    cache.set(token, 1, now + 60 * 30)
+
+    cases = {
+        "python-jose decode": lambda: jose_jwt.decode(
+            token, SECRET_KEY, algorithms=ALGORITHM
+        ),
+        "pyjwt decode": lambda: pyjwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]),
+        "VerifiedTokenCache hit": lambda: cache.get(token),
+    }
+
+    for name, fn in cases.items():
+        elapsed = timeit.timeit(fn, number=args.number)
+        print(f"{name:<24} {elapsed / args.number * 1_000_000:8.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import Configs
+from app.core.migration import use_concurrent_indexes
+from app.model import area, badge, bakery, notice, report, review, users  # noqa: F401
+from app.model.base import Base
+
+configs = Configs()
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def get_url() -> str:
+    """마이그레이션 대상 DB URL 반환하는 메소드. (-x url=... 로 덮어쓰기 가능)"""
+
+    return context.get_x_argument(as_dictionary=True).get("url", configs.DATABASE_URL)
+
+
+def run_migrations_offline() -> None:
+    """DB 접속 없이 SQL 스크립트만 출력하는 메소드. (alembic upgrade --sql)"""
+
+    context.configure(
+        url=get_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection) -> None:
+    connection.exec_driver_sql(f"SET lock_timeout = '{configs.MIGRATION_LOCK_TIMEOUT}'")
+    connection.commit()
+
+    # revision 단위로 commit 해야 CONCURRENTLY 작업(autocommit_block)을 섞어 쓸 수 있다.
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        compare_type=True,
+        transaction_per_migration=True,
+        process_revision_directives=use_concurrent_indexes,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    engine = create_async_engine(get_url(), poolclass=pool.NullPool)
+
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
@@ -0,0 +1,555 @@
+"""baseline
+
+운영 DB에 이미 있는 스키마. 기존 DB는 `alembic stamp 0001` 후 이어서 upgrade 한다.
+(모델에만 선언되어 있던 unique 제약은 0002 에서 추가)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "badge_conditions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("badge_id", sa.Integer(), nullable=False),
+        sa.Column("condition_type", sa.String(length=50), nullable=False),
+        sa.Column("value", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "badges",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("img_url", sa.Text(), nullable=True),
+        sa.Column("category", sa.SmallInteger(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "bakeries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "name",
+            sa.String(length=40, collation="ko_KR.utf8"),
+            nullable=False,
+            comment="빵집이름",
+        ),
+        sa.Column(
+            "address", sa.String(length=128), nullable=False, comment="주소 전문"
+        ),
+        sa.Column("gu", sa.String(length=24), nullable=True, comment="구 아름"),
+        sa.Column("dong", sa.String(length=24), nullable=True, comment="동 이름"),
+        sa.Column("lat", sa.Float(), nullable=True, comment="위도 : mapy"),
+        sa.Column("lng", sa.Float(), nullable=True, comment="경도 : mapx"),
+        sa.Column("phone", sa.String(length=40), nullable=True, comment="연락처"),
+        sa.Column("commercial_area_id", sa.Integer(), nullable=True, comment="지역 ID"),
+        sa.Column("avg_rating", sa.Float(), nullable=True, comment="평균 별점"),
+        sa.Column("review_count", sa.Integer(), nullable=True, comment="리뷰 개수"),
+        sa.Column("thumbnail", sa.Text(), nullable=True, comment="빵집 썸네일"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_bakeries_id"), "bakeries", ["id"], unique=False)
+    op.create_table(
+        "bakery_menus",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("is_signature", sa.Boolean(), nullable=True),
+        sa.Column("price", sa.Integer(), nullable=True, comment="가격"),
+        sa.Column("bakery_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "flavor_id",
+            sa.Integer(),
+            nullable=True,
+            comment="preference.type = flavor 번호",
+        ),
+        sa.Column(
+            "bread_type_id",
+            sa.Integer(),
+            nullable=True,
+            comment="preference.type = bread_type 번호",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "bakery_photos",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("bakery_id", sa.Integer(), nullable=False),
+        sa.Column("img_url", sa.Text(), nullable=True, comment="이미지 경로"),
+        sa.Column("is_signature", sa.Boolean(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_bakery_photos_id"), "bakery_photos", ["id"], unique=False)
+    op.create_table(
+        "bakery_preferences",
+        sa.Column("bakery_id", sa.Integer(), nullable=False),
+        sa.Column("preference_id", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("bakery_id", "preference_id"),
+    )
+    op.create_table(
+        "bread_reports",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("year", sa.SmallInteger(), nullable=False),
+        sa.Column("month", sa.SmallInteger(), nullable=False),
+        sa.Column(
+            "visited_areas",
+            sa.JSON(),
+            nullable=True,
+            comment='{"광안리•민락": 4} - 방문지역 : count',
+        ),
+        sa.Column(
+            "bread_types",
+            sa.JSON(),
+            nullable=True,
+            comment='{"케이크, 브라우니, 파이류": 3, "건강한 빵": 1} - 빵타입 : count',
+        ),
+        sa.Column("daily_avg_quantity", sa.Float(), nullable=True),
+        sa.Column(
+            "weekly_distribution",
+            sa.JSON(),
+            nullable=True,
+            comment='{"1": 3, "2": 1} - day_of_week : count',
+        ),
+        sa.Column("visit_count", sa.Integer(), nullable=True, comment="총 방문횟수"),
+        sa.Column(
+            "monthly_consumption_gap",
+            sa.Float(),
+            nullable=True,
+            comment="전체유저와의 빵소비량 차이",
+        ),
+        sa.Column("total_quantity", sa.Integer(), nullable=True),
+        sa.Column("total_price", sa.Integer(), nullable=True),
+        sa.Column("price_diff_from_last_month", sa.Integer(), nullable=True),
+        sa.Column("review_count", sa.Integer(), nullable=True),
+        sa.Column("liked_count", sa.Integer(), nullable=True),
+        sa.Column("received_likes_count", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "commercial_areas",
+        sa.Column(
+            "id",
+            sa.SmallInteger(),
+            autoincrement=True,
+            nullable=False,
+            comment="상권지역 id",
+        ),
+        sa.Column("name", sa.String(length=64), nullable=True, comment="상권지역 이름"),
+        sa.Column(
+            "ordering", sa.SmallInteger(), nullable=True, comment="정렬순서용 번호"
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "menu_photos",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("menu_id", sa.Integer(), nullable=False),
+        sa.Column("img_url", sa.Text(), nullable=True, comment="이미지 경로"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_menu_photos_id"), "menu_photos", ["id"], unique=False)
+    op.create_table(
+        "notice_items",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("notice_id", sa.Integer(), nullable=False),
+        sa.Column("content", sa.String(length=255), nullable=False, comment="공지내용"),
+        sa.Column("order_item", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "notices",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False, comment="공지제목"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "operating_hours",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("bakery_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "day_of_week",
+            sa.SmallInteger(),
+            nullable=True,
+            comment="요일 0 : 월  ~ 6 : 일",
+        ),
+        sa.Column("open_time", sa.Time(), nullable=True, comment="오픈시간"),
+        sa.Column("close_time", sa.Time(), nullable=True, comment="종료시간"),
+        sa.Column("is_opened", sa.Boolean(), nullable=True, comment="오픈여부"),
+        sa.Column(
+            "occasion",
+            sa.String(length=128),
+            nullable=True,
+            comment="공휴일, 설날 등의 텍스트 상황",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_operating_hours_id"), "operating_hours", ["id"], unique=False
+    )
+    op.create_table(
+        "preferences",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            autoincrement=True,
+            nullable=False,
+            comment="취향항목 ID",
+        ),
+        sa.Column(
+            "name", sa.String(length=124), nullable=True, comment="취향항목 이름"
+        ),
+        sa.Column("type", sa.String(length=40), nullable=True, comment="취향항목 타입"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "review_bakery_menus",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("review_id", sa.Integer(), nullable=False, comment="리뷰 ID"),
+        sa.Column("menu_id", sa.Integer(), nullable=False, comment="메뉴 ID"),
+        sa.Column("quantity", sa.Integer(), nullable=False, comment="수량"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "review_likes",
+        sa.Column("user_id", sa.Integer(), nullable=False, comment="작성한 user_id"),
+        sa.Column("review_id", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "review_id"),
+    )
+    op.create_table(
+        "review_photos",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("review_id", sa.Integer(), nullable=False),
+        sa.Column("img_url", sa.Text(), nullable=True, comment="flqb 이미지 경로"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "reviews",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("bakery_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False, comment="작성한 user_id"),
+        sa.Column("content", sa.Text(), nullable=False, comment="리뷰내용"),
+        sa.Column("rating", sa.Float(), nullable=True, comment="별점"),
+        sa.Column(
+            "visit_date",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+            comment="방문시간",
+        ),
+        sa.Column(
+            "is_private",
+            sa.Boolean(),
+            nullable=True,
+            comment="나만보기 여부 (True : 나만공개 / False : 전체공개)",
+        ),
+        sa.Column("like_count", sa.Integer(), nullable=False, comment="좋아요 개수"),
+        sa.Column(
+            "day_of_week", sa.Integer(), nullable=False, comment="요일 : 월 0 ~ 일 6"
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "user_badges",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("badge_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "is_representative", sa.Boolean(), nullable=True, comment="대표뱃지 여부"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "user_bakery_likes",
+        sa.Column("user_id", sa.Integer(), nullable=False, comment="유저 ID"),
+        sa.Column("bakery_id", sa.Integer(), nullable=False, comment="베이커리 ID"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("user_id", "bakery_id"),
+    )
+    op.create_table(
+        "user_metrics",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("review_count", sa.Integer(), nullable=True),
+        sa.Column("pastry_bread_count", sa.Integer(), nullable=True),
+        sa.Column("meal_bread_count", sa.Integer(), nullable=True),
+        sa.Column("healthy_bread_count", sa.Integer(), nullable=True),
+        sa.Column("baked_bread_count", sa.Integer(), nullable=True),
+        sa.Column("retro_bread_count", sa.Integer(), nullable=True),
+        sa.Column("dessert_bread_count", sa.Integer(), nullable=True),
+        sa.Column("sandwich_bread_count", sa.Integer(), nullable=True),
+        sa.Column("cake_bread_count", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_table(
+        "users",
+        sa.Column(
+            "id", sa.Integer(), autoincrement=True, nullable=False, comment="회원 ID"
+        ),
+        sa.Column(
+            "login_type",
+            sa.String(length=16),
+            nullable=False,
+            comment="로그인 타입(KAKAO : 카카오, EMAIL : 이메일)",
+        ),
+        sa.Column("email", sa.String(length=64), nullable=False, comment="이메일 주소"),
+        sa.Column("password", sa.Text(), nullable=True, comment="비밀번호"),
+        sa.Column("nickname", sa.String(length=24), nullable=True, comment="닉네임"),
+        sa.Column(
+            "social_id", sa.String(length=64), nullable=True, comment="소셜로그인 ID"
+        ),
+        sa.Column("name", sa.String(length=16), nullable=True, comment="이름"),
+        sa.Column("age_range", sa.SmallInteger(), nullable=True, comment="연령대"),
+        sa.Column(
+            "profile_img", sa.String(length=128), nullable=True, comment="프로필 썸네일"
+        ),
+        sa.Column("gender", sa.String(length=4), nullable=True),
+        sa.Column("is_preferences_set", sa.Boolean(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True, comment="활성 유저 여부"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "recent_bakery_views",
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("bakery_id", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["bakery_id"],
+            ["bakeries.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "bakery_id"),
+    )
+    op.create_table(
+        "user_preferences",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("preference_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["preference_id"], ["preferences.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "preference_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_preferences")
+    op.drop_table("recent_bakery_views")
+    op.drop_table("users")
+    op.drop_table("user_metrics")
+    op.drop_table("user_bakery_likes")
+    op.drop_table("user_badges")
+    op.drop_table("reviews")
+    op.drop_table("review_photos")
+    op.drop_table("review_likes")
+    op.drop_table("review_bakery_menus")
+    op.drop_table("preferences")
+    op.drop_index(op.f("ix_operating_hours_id"), table_name="operating_hours")
+    op.drop_table("operating_hours")
+    op.drop_table("notices")
+    op.drop_table("notice_items")
+    op.drop_index(op.f("ix_menu_photos_id"), table_name="menu_photos")
+    op.drop_table("menu_photos")
+    op.drop_table("commercial_areas")
+    op.drop_table("bread_reports")
+    op.drop_table("bakery_preferences")
+    op.drop_index(op.f("ix_bakery_photos_id"), table_name="bakery_photos")
+    op.drop_table("bakery_photos")
+    op.drop_table("bakery_menus")
+    op.drop_index(op.f("ix_bakeries_id"), table_name="bakeries")
+    op.drop_table("bakeries")
+    op.drop_table("badges")
+    op.drop_table("badge_conditions")
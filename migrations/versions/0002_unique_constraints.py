@@ -0,0 +1,86 @@
+"""unique constraints on user_badges / bread_reports
+
+모델에만 선언되어 있던 uq_user_badge, uq_user_month_report 를 DB에 추가한다.
+중복 데이터를 정리한 뒤 unique 인덱스를 CONCURRENTLY 로 만들고 제약으로 붙인다.
+정리 후 인덱스가 만들어지기 전에 중복이 다시 들어오면 INVALID 인덱스를 지우고
+중복 정리부터 다시 한다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 10:10:00.000000
+
+"""
+
+from typing import List, Sequence, Union
+
+from alembic import op
+from sqlalchemy.exc import IntegrityError
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 중복 정리 ~ unique 인덱스 생성 재시도 횟수
+UNIQUE_INDEX_RETRIES = 3
+
+
+def _add_unique_constraint(
+    name: str, table_name: str, columns: List[str], order_by: str
+):
+    """중복 행 정리 후 unique 제약 추가하는 메소드. (order_by 첫번째 행만 남김)"""
+
+    partition_by = ", ".join(columns)
+
+    for attempt in range(1, UNIQUE_INDEX_RETRIES + 1):
+        # 1. 중복 정리 (인덱스 생성 전에 commit 된다)
+        op.execute(f"""
+            DELETE FROM {table_name} WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, row_number() OVER (
+                        PARTITION BY {partition_by} ORDER BY {order_by}
+                    ) AS rn
+                    FROM {table_name}
+                ) d
+                WHERE d.rn > 1
+            )
+            """)
+        try:
+            # 2. unique 인덱스 생성 (정리 후 중복이 다시 들어오면 실패)
+            op.create_index_concurrently(name, table_name, columns, unique=True)
+            break
+        except IntegrityError:
+            # 3. INVALID 로 남은 인덱스 지우고 중복 정리부터 다시
+            op.drop_index_concurrently(name, table_name)
+            if attempt == UNIQUE_INDEX_RETRIES:
+                raise
+
+    # 4. 만들어진 unique 인덱스를 제약으로 붙이기
+    op.execute(f"""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = '{name}') THEN
+                ALTER TABLE {table_name} ADD CONSTRAINT {name} UNIQUE USING INDEX {name};
+            END IF;
+        END $$
+        """)
+
+
+def upgrade() -> None:
+    # 대표뱃지로 설정된 행을 우선으로 남김
+    _add_unique_constraint(
+        "uq_user_badge",
+        "user_badges",
+        ["user_id", "badge_id"],
+        "is_representative DESC NULLS LAST, id",
+    )
+    # 조회시 최신 레포트를 사용하므로 가장 최근 행을 남김
+    _add_unique_constraint(
+        "uq_user_month_report", "bread_reports", ["user_id", "year", "month"], "id DESC"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_user_month_report", "bread_reports", type_="unique")
+    op.drop_constraint("uq_user_badge", "user_badges", type_="unique")
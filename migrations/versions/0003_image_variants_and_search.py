@@ -0,0 +1,116 @@
+"""image variant columns / bakery search documents
+
+- bakeries.thumbnail_small, bakery_photos / review_photos 의 thumb_url, detail_url
+  (nullable 컬럼 추가라 테이블 재작성 없음. 없으면 원본 경로로 대체해서 조회)
+- 키워드 검색용 bakery_search_documents (초성/자모 pg_trgm GIN 인덱스)
+  문서는 앱의 검색 문서 갱신 작업이 채운다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 10:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "bakeries",
+        sa.Column(
+            "thumbnail_small",
+            sa.Text(),
+            nullable=True,
+            comment="빵집 썸네일 (리스트용 작은 사이즈)",
+        ),
+    )
+    for table_name in ("bakery_photos", "review_photos"):
+        op.add_column(
+            table_name,
+            sa.Column(
+                "thumb_url",
+                sa.Text(),
+                nullable=True,
+                comment="리스트용 작은 사이즈 이미지 경로",
+            ),
+        )
+        op.add_column(
+            table_name,
+            sa.Column(
+                "detail_url",
+                sa.Text(),
+                nullable=True,
+                comment="상세용 중간 사이즈 이미지 경로",
+            ),
+        )
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_table(
+        "bakery_search_documents",
+        sa.Column("bakery_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "document",
+            sa.Text(),
+            nullable=False,
+            comment="검색용 문서 : 빵집이름 구 동 메뉴이름 (소문자)",
+        ),
+        sa.Column("choseong", sa.Text(), nullable=False, comment="검색용 문서의 초성"),
+        sa.Column(
+            "jamo",
+            sa.Text(),
+            nullable=False,
+            comment="검색용 문서의 자모 (입력 중 부분 일치용)",
+        ),
+        sa.Column(
+            "menu_count",
+            sa.Integer(),
+            nullable=False,
+            comment="문서 생성 시점의 메뉴 수 (삭제 감지용)",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("bakery_id"),
+    )
+    op.create_index(
+        "ix_bakery_search_documents_choseong_trgm",
+        "bakery_search_documents",
+        ["choseong"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"choseong": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_bakery_search_documents_jamo_trgm",
+        "bakery_search_documents",
+        ["jamo"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"jamo": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("bakery_search_documents")
+    for table_name in ("review_photos", "bakery_photos"):
+        op.drop_column(table_name, "detail_url")
+        op.drop_column(table_name, "thumb_url")
+    op.drop_column("bakeries", "thumbnail_small")
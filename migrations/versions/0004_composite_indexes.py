@@ -0,0 +1,62 @@
+"""composite indexes for hot read queries
+
+리뷰 정렬/유저 리뷰/메뉴·사진·영업시간/베이커리별 찜 집계용 인덱스.
+운영 중인 테이블이므로 모두 CONCURRENTLY 로 생성한다. (쓰기 잠금 없음)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_reviews_bakery_like_count", "reviews", ["bakery_id", "like_count", "id"]),
+    ("ix_reviews_bakery_created_at", "reviews", ["bakery_id", "created_at", "id"]),
+    (
+        "ix_reviews_bakery_rating",
+        "reviews",
+        ["bakery_id", sa.text("coalesce(rating, 0)"), "id"],
+    ),
+    (
+        "ix_reviews_user_bakery_created_at",
+        "reviews",
+        ["user_id", "bakery_id", "created_at"],
+    ),
+    ("ix_review_photos_review_id", "review_photos", ["review_id"]),
+    ("ix_review_likes_review_id", "review_likes", ["review_id"]),
+    ("ix_review_bakery_menus_review_id", "review_bakery_menus", ["review_id"]),
+    (
+        "ix_bakery_menus_bakery_signature",
+        "bakery_menus",
+        ["bakery_id", "is_signature"],
+    ),
+    (
+        "ix_bakery_photos_bakery_signature",
+        "bakery_photos",
+        ["bakery_id", "is_signature"],
+    ),
+    ("ix_menu_photos_menu_id", "menu_photos", ["menu_id"]),
+    ("ix_operating_hours_bakery_day", "operating_hours", ["bakery_id", "day_of_week"]),
+    ("ix_user_bakery_likes_bakery_id", "user_bakery_likes", ["bakery_id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table_name, columns in INDEXES:
+        op.create_index_concurrently(name, table_name, columns)
+
+
+def downgrade() -> None:
+    for name, table_name, _ in reversed(INDEXES):
+        op.drop_index_concurrently(name, table_name)
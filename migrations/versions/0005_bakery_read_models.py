@@ -0,0 +1,167 @@
+"""bakery read models (recommendations / popularity / cards)
+
+리스트 API가 읽는 미리 계산된 테이블.
+- user_bakery_recommendations, bakery_popularity : 앱의 주기적 갱신 작업이 채운다.
+- bakery_cards : 새 코드가 배포되기 전에 리스트가 비지 않도록 여기서 batch 단위로 채운다.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 10:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _timestamps():
+    return [
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    ]
+
+
+# app.repositories.bakery_repo.BakeryRepository.refresh_bakery_cards 와 같은 계산
+BACKFILL_BAKERY_CARDS = """
+INSERT INTO bakery_cards (
+    bakery_id, name, gu, dong, commercial_area_id, avg_rating, review_count,
+    thumbnail, signature_img_url, signature_menus
+)
+SELECT
+    b.id, b.name, b.gu, b.dong, b.commercial_area_id, b.avg_rating, b.review_count,
+    coalesce(b.thumbnail_small, b.thumbnail),
+    (
+        SELECT coalesce(p.thumb_url, p.img_url)
+        FROM bakery_photos p
+        WHERE p.bakery_id = b.id AND p.is_signature IS true
+        ORDER BY p.id
+        LIMIT 1
+    ),
+    (
+        SELECT coalesce(array_agg(m.name ORDER BY m.id), '{}'::text[])
+        FROM bakery_menus m
+        WHERE m.bakery_id = b.id AND m.is_signature IS true
+    )
+FROM bakeries b
+WHERE b.id >= :start AND b.id < :end
+ON CONFLICT (bakery_id) DO NOTHING
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_bakery_recommendations",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("bakery_id", sa.Integer(), nullable=False, comment="베이커리 ID"),
+        sa.Column(
+            "score",
+            sa.Numeric(precision=6, scale=3),
+            nullable=False,
+            comment="추천 점수 : 일치하는 취향 수 + 평균 별점 / 10",
+        ),
+        *_timestamps(),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "bakery_id"),
+    )
+    op.create_index(
+        "ix_user_bakery_recommendations_user_score",
+        "user_bakery_recommendations",
+        ["user_id", "score", "bakery_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "bakery_popularity",
+        sa.Column("bakery_id", sa.Integer(), nullable=False, comment="베이커리 ID"),
+        sa.Column("commercial_area_id", sa.Integer(), nullable=True, comment="지역 ID"),
+        sa.Column(
+            "recent_review_count",
+            sa.Integer(),
+            nullable=False,
+            comment="최근 리뷰 개수",
+        ),
+        sa.Column("like_count", sa.Integer(), nullable=False, comment="찜 개수"),
+        sa.Column(
+            "score",
+            sa.Numeric(precision=10, scale=3),
+            nullable=False,
+            comment="인기 점수 : 최근 리뷰 수 / 찜 수 / 평균 별점 가중합",
+        ),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("bakery_id"),
+    )
+    op.create_index(
+        "ix_bakery_popularity_area_score",
+        "bakery_popularity",
+        ["commercial_area_id", "score", "bakery_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_bakery_popularity_score",
+        "bakery_popularity",
+        ["score", "bakery_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "bakery_cards",
+        sa.Column("bakery_id", sa.Integer(), nullable=False, comment="베이커리 ID"),
+        sa.Column(
+            "name",
+            sa.String(length=40, collation="ko_KR.utf8"),
+            nullable=False,
+            comment="빵집이름",
+        ),
+        sa.Column("gu", sa.String(length=24), nullable=True, comment="구 아름"),
+        sa.Column("dong", sa.String(length=24), nullable=True, comment="동 이름"),
+        sa.Column("commercial_area_id", sa.Integer(), nullable=True, comment="지역 ID"),
+        sa.Column("avg_rating", sa.Float(), nullable=True, comment="평균 별점"),
+        sa.Column("review_count", sa.Integer(), nullable=True, comment="리뷰 개수"),
+        sa.Column(
+            "thumbnail",
+            sa.Text(),
+            nullable=True,
+            comment="빵집 썸네일 (작은 사이즈 우선)",
+        ),
+        sa.Column(
+            "signature_img_url",
+            sa.Text(),
+            nullable=True,
+            comment="대표 사진 (작은 사이즈 우선, 없으면 NULL)",
+        ),
+        sa.Column(
+            "signature_menus",
+            postgresql.ARRAY(sa.Text()),
+            nullable=False,
+            comment="대표 메뉴 이름 목록",
+        ),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("bakery_id"),
+    )
+
+    op.batched_backfill("bakeries", BACKFILL_BAKERY_CARDS)
+
+
+def downgrade() -> None:
+    op.drop_table("bakery_cards")
+    op.drop_table("bakery_popularity")
+    op.drop_table("user_bakery_recommendations")
@@ -0,0 +1,47 @@
+"""bakery_popularity -> bakeries foreign key
+
+빵집이 삭제되면 인기 점수도 같이 지워지도록 ON DELETE CASCADE 외래키를 건다.
+(삭제는 남는 row가 없어서 주기적 갱신의 변경 감지 쿼리로 찾을 수 없다)
+이미 남아있는 삭제된 빵집의 인기 점수는 먼저 지우고, NOT VALID 로 만든 뒤
+VALIDATE 해서 검사하는 동안 쓰기를 막지 않는다.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FK_NAME = "bakery_popularity_bakery_id_fkey"
+
+DELETE_ORPHAN_POPULARITY = """
+DELETE FROM bakery_popularity p
+WHERE NOT EXISTS (SELECT 1 FROM bakeries b WHERE b.id = p.bakery_id)
+"""
+
+
+def upgrade() -> None:
+    op.execute(DELETE_ORPHAN_POPULARITY)
+    op.create_foreign_key(
+        FK_NAME,
+        "bakery_popularity",
+        "bakeries",
+        ["bakery_id"],
+        ["id"],
+        ondelete="CASCADE",
+        postgresql_not_valid=True,
+    )
+    op.execute(f"ALTER TABLE bakery_popularity VALIDATE CONSTRAINT {FK_NAME}")
+
+
+def downgrade() -> None:
+    op.drop_constraint(FK_NAME, "bakery_popularity", type_="foreignkey")